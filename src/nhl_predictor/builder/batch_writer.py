@@ -0,0 +1,199 @@
+from typing import Dict, List, Set, Tuple
+
+from sqlitedict import SqliteDict
+
+from nhl_predictor.shared.box_score_archive import BoxScoreArchive
+from nhl_predictor.shared.constants.database import Database as DB
+from nhl_predictor.shared.logging_config import LoggingConfig
+from nhl_predictor.shared.relational_store import RelationalStore
+
+logger = LoggingConfig.get_logger(__name__)
+
+class RowBuffer:
+    """Collects rows produced away from the writer thread, e.g. by a parser,
+    so that they can be handed to a BatchWriter in one go.
+    """
+
+    def __init__(self):
+        """Create an empty buffer.
+        """
+        self.rows: List[Tuple[str, object, object]] = []
+
+    def write(
+        self,
+        table_name: str,
+        key: object,
+        value: object
+    ) -> None:
+        """Collect a row destined for a table.
+
+        Args:
+            table_name (str): Name of the destination table.
+            key (object): Row key.
+            value (object): Row value.
+        """
+        self.rows.append((table_name, key, value))
+
+
+class BatchWriter:
+    """Buffers rows destined for the SqliteDict tables and writes them in
+    batches, one transaction per table, instead of committing every row.
+
+    Tables are flushed in a fixed order: stats tables first, then the games
+    table, the checkpoints table and finally the meta table. A game row is
+    therefore never committed before the stats it describes, and a checkpoint
+    never before the data it records, so an interrupted build can be resumed
+    without losing or duplicating data.
+
+    If a relational store is provided, each batch is also written to it in a
+    single transaction before the SqliteDict tables are committed. Likewise,
+    if a box score archive is provided, archived box scores are written to it
+    first.
+    """
+
+    # Tables that must be committed after everything else, in this order.
+    _commit_last = [
+        DB.games_table_name,
+        DB.checkpoints_table_name,
+        DB.meta_table_name
+    ]
+
+    def __init__(
+        self,
+        data: Dict[str, SqliteDict],
+        batch_size: int,
+        relational_store: RelationalStore = None,
+        archive: BoxScoreArchive = None
+    ):
+        """Create a writer.
+
+        Args:
+            data (Dict[str, SqliteDict]): Dictionary of tables to write to.
+            batch_size (int): Number of buffered rows that triggers a flush.
+            relational_store (RelationalStore, optional): Relational store to
+            keep in step with the tables. Defaults to None.
+            archive (BoxScoreArchive, optional): Archive to store raw box scores
+            in. Defaults to None.
+        """
+        self._data = data
+        self._relational_store = relational_store
+        self._archive = archive
+        self._box_scores: Dict[int, Tuple[Dict[str, object], Dict[str, object]]] = {}
+        self._batch_size = max(1, int(batch_size))
+        self._pending: Dict[str, Dict[object, object]] = {}
+        self._deletes: Dict[str, Set[object]] = {}
+        self._pending_rows = 0
+
+    def write(
+        self,
+        table_name: str,
+        key: object,
+        value: object
+    ) -> None:
+        """Buffer a row to be written to a table.
+
+        Args:
+            table_name (str): Name of the destination table.
+            key (object): Row key.
+            value (object): Row value.
+        """
+        self._pending.setdefault(table_name, {})[key] = value
+        self._deletes.get(table_name, set()).discard(key)
+        self._pending_rows += 1
+
+    def contains(
+        self,
+        table_name: str,
+        key: object
+    ) -> bool:
+        """Check if a table holds a row, counting buffered writes and deletes.
+
+        Args:
+            table_name (str): Name of the table.
+            key (object): Row key.
+
+        Returns:
+            bool: True if the row is buffered or stored and not being deleted.
+        """
+        if key in self._pending.get(table_name, {}):
+            return True
+        if key in self._deletes.get(table_name, set()):
+            return False
+        return key in self._data[table_name]
+
+    def write_rows(self, rows: RowBuffer) -> None:
+        """Buffer every row collected by a RowBuffer.
+
+        Args:
+            rows (RowBuffer): The collected rows.
+        """
+        for table_name, key, value in rows.rows:
+            self.write(table_name, key, value)
+
+    def archive_box_score(
+        self,
+        game_id: int,
+        game: Dict[str, object],
+        box_score: Dict[str, object]
+    ) -> None:
+        """Buffer a raw box score to be archived. Does nothing when the writer
+        has no archive.
+
+        Args:
+            game_id (int): Game ID.
+            game (Dict[str, object]): Game row.
+            box_score (Dict[str, object]): Raw box score JSON.
+        """
+        if self._archive is None:
+            return
+        self._box_scores[game_id] = (game, box_score)
+        self._pending_rows += 1
+
+    def delete(
+        self,
+        table_name: str,
+        key: object
+    ) -> None:
+        """Buffer the removal of a row from a table. Keys that are not in the
+        table are ignored.
+
+        Args:
+            table_name (str): Name of the table.
+            key (object): Row key.
+        """
+        self._pending.get(table_name, {}).pop(key, None)
+        self._deletes.setdefault(table_name, set()).add(key)
+
+    def checkpoint(self) -> None:
+        """Mark a consistent point in the stream of writes (e.g. the end of a
+        game) and flush if enough rows have been buffered.
+        """
+        if self._pending_rows >= self._batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write and commit all buffered rows.
+        """
+        if not self._pending and not self._deletes and not self._box_scores:
+            return
+        logger.info(f"Flushing '{self._pending_rows}' rows to the database.")
+        if self._box_scores:
+            self._archive.write(self._box_scores)
+            self._box_scores = {}
+        if self._relational_store is not None:
+            self._relational_store.write(self._pending)
+        changed = set(self._pending) | set(self._deletes)
+        table_names = (
+            [name for name in changed if name not in BatchWriter._commit_last]
+            + [name for name in BatchWriter._commit_last if name in changed]
+        )
+        for table_name in table_names:
+            table = self._data[table_name]
+            table.update(self._pending.get(table_name, {}))
+            for key in self._deletes.get(table_name, set()):
+                if key in table:
+                    del table[key]
+            table.commit()
+        self._pending = {}
+        self._deletes = {}
+        self._pending_rows = 0
@@ -1,60 +1,350 @@
-import json
-from datetime import datetime, timezone
-from typing import Dict, List
+import multiprocessing
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, Iterator, List, Tuple
 
-import requests
 from ansimarkup import ansiprint as print
 from sqlitedict import SqliteDict
 
+from nhl_predictor.builder.batch_writer import BatchWriter, RowBuffer
 from nhl_predictor.model.game_state import GameState, GameStatesForDataset
 from nhl_predictor.model.game_type import GameType, SupportedGameTypes
 from nhl_predictor.model.home_or_away import HomeOrAway
-from nhl_predictor.model.seasons import Seasons
-from nhl_predictor.model.team_map import TeamMap
+from nhl_predictor.model.season_catalog import SeasonCatalog
+from nhl_predictor.model.team_map import TeamMap, TeamSeasons
+from nhl_predictor.shared.box_score_archive import BoxScoreArchive
+from nhl_predictor.shared.columnar_store import ColumnarStore
+from nhl_predictor.shared.concurrent_fetcher import ConcurrentFetcher
 from nhl_predictor.shared.constants.database import Database as DB
 from nhl_predictor.shared.constants.json import JSON as Keys
+from nhl_predictor.shared.execution_context import ExecutionContext
 from nhl_predictor.shared.logging_config import LoggingConfig
+from nhl_predictor.shared.relational_store import RelationalStore
+from nhl_predictor.shared.streaming_pipeline import StreamingPipeline
 from nhl_predictor.shared.utility import Utility as utl
 
 logger = LoggingConfig.get_logger(__name__)
-execution_context = shared.execution_context.ExecutionContext()
+execution_context = ExecutionContext()
 
 class Builder:
     """Static class with API to fetch desired data from the public NHL API and
     save it in local databases.
     """
+
+    # Number of games handed to a parser process at a time.
+    _shard_size = 25
+
+    # Seconds between attempts to take the write lock.
+    _lock_poll_interval = 5
     
     @staticmethod
     def build(
-        seasons: List[Seasons],
+        seasons: List[str],
         all_seasons: bool = False
     ) -> None:
-        """Main entry point for the builder.
+        """Main entry point for the builder. Waits for any other build,
+        rebuild or backfill writing to the databases to finish first.
 
         Args:
-            seasons (List[Seasons]): List of seasons to include in the data set.
-            all_seasons (bool, optional): Specify if all seasons should be included. Defaults to False.
+            seasons (List[str]): List of seasons to include in the data set.
+            all_seasons (bool, optional): Specify if all seasons of the season
+            catalog, starting with the configured first season, should be
+            included. Defaults to False.
         """
         logger.info("Call to build starting.")
         execution_context._ensure_app_dir()
+        lock_path = Builder._wait_for_write_lock()
+        try:
+            Builder._build(seasons, all_seasons)
+        finally:
+            os.remove(lock_path)
+        logger.info("Call to build is complete.")
+
+    @staticmethod
+    def _build(
+        seasons: List[str],
+        all_seasons: bool = False
+    ) -> None:
+        """Build the data set. The caller must hold the write lock.
+
+        Args:
+            seasons (List[str]): List of seasons to include in the data set.
+            all_seasons (bool, optional): Specify if all seasons of the season
+            catalog, starting with the configured first season, should be
+            included. Defaults to False.
+        """
         data = utl.get_sqlitedict_tables(
             DB.players_table_name,
             DB.skater_stats_table_name,
             DB.goalie_stats_table_name,
             DB.games_table_name,
             DB.meta_table_name,
+            DB.failed_games_table_name,
+            DB.checkpoints_table_name,
+            DB.ingested_dates_table_name,
             path=execution_context.app_dir,
-            update_db=execution_context.allow_update
+            update_db=execution_context.allow_update,
+            autocommit=False
         )
-        
-        if all_seasons:
-            Builder._build_stats_by_season(data)
-        elif seasons is not None:
-            Builder._build_stats_by_season(data, seasons)
-        else:
-            logger.error("Invalid season specification, cannot build data set.")
-        Builder.populate_players(data)
-        logger.info("Call to build is complete.")
+        if not execution_context.resume:
+            # Checkpoints only describe the progress of the latest build.
+            data[DB.checkpoints_table_name].clear()
+            data[DB.checkpoints_table_name].commit()
+        relational_store = RelationalStore(execution_context.app_dir)
+        if execution_context.allow_update:
+            relational_store.clear()
+        archive = None
+        if execution_context.archive_box_scores:
+            archive = BoxScoreArchive(execution_context.app_dir)
+        writer = BatchWriter(data, execution_context.batch_size, relational_store, archive)
+        if execution_context.allow_update:
+            # The tables were emptied, so rows rebuilt from now on replace
+            # the rows cached data sets were built from.
+            Builder._bump_data_generation(writer)
+
+        try:
+            ingested_player_ids = Builder._retry_failed_games(data, writer)
+            if all_seasons:
+                ingested_player_ids |= Builder._build_stats_by_season(
+                    data,
+                    writer,
+                    relational_store,
+                    SeasonCatalog.get_default_seasons()
+                )
+            elif seasons is not None:
+                ingested_player_ids |= Builder._build_stats_by_season(
+                    data,
+                    writer,
+                    relational_store,
+                    seasons
+                )
+            else:
+                logger.error("Invalid season specification, cannot build data set.")
+            if execution_context.players_from_box_scores:
+                Builder.populate_players(data, writer, ingested_player_ids)
+            else:
+                Builder.populate_players(data, writer)
+        finally:
+            writer.flush()
+            if archive is not None:
+                archive.close()
+        Builder._sync_derived_stores(data, relational_store)
+
+    @staticmethod
+    def rebuild_from_archive() -> None:
+        """Rebuild the games and stats tables from the raw box score archive,
+        without any network access. Waits for any other build, rebuild or
+        backfill writing to the databases to finish first.
+        """
+        logger.info("Call to rebuild from archive starting.")
+        execution_context._ensure_app_dir()
+        lock_path = Builder._wait_for_write_lock()
+        try:
+            Builder._rebuild_from_archive()
+        finally:
+            os.remove(lock_path)
+
+    @staticmethod
+    def _rebuild_from_archive() -> None:
+        """Rebuild the games and stats tables from the raw box score archive.
+        The caller must hold the write lock.
+        """
+        if not BoxScoreArchive.exists(execution_context.app_dir):
+            print("<red>No box score archive found. Build with '--archive' first.</red>")
+            logger.error("Rebuild requested but no box score archive exists.")
+            return
+        archive = BoxScoreArchive(execution_context.app_dir)
+        stored_games = utl.get_sqlitedict_tables(DB.games_table_name, path=execution_context.app_dir)
+        missing = len(stored_games[DB.games_table_name]) - archive.count()
+        stored_games[DB.games_table_name].close()
+        if missing > 0:
+            archive.close()
+            print(f"<red>{missing} stored games are not archived, rebuilding would lose them.</red>")
+            logger.error(f"Rebuild aborted, '{missing}' stored games are not archived.")
+            return
+
+        data = utl.get_sqlitedict_tables(
+            DB.skater_stats_table_name,
+            DB.goalie_stats_table_name,
+            DB.games_table_name,
+            path=execution_context.app_dir,
+            update_db=True,
+            autocommit=False
+        )
+        data.update(utl.get_sqlitedict_tables(
+            DB.players_table_name,
+            DB.meta_table_name,
+            DB.failed_games_table_name,
+            DB.checkpoints_table_name,
+            path=execution_context.app_dir,
+            autocommit=False
+        ))
+        relational_store = RelationalStore(execution_context.app_dir)
+        relational_store.clear()
+        writer = BatchWriter(data, execution_context.batch_size, relational_store)
+        Builder._bump_data_generation(writer)
+
+        try:
+            logger.info(f"Rebuilding '{archive.count()}' archived games.")
+            Builder._process_game_rows(
+                archive.read_games(),
+                writer,
+                ((game_id, box_score, None) for game_id, box_score in archive.read_box_scores())
+            )
+        finally:
+            writer.flush()
+            archive.close()
+        Builder._sync_derived_stores(data, relational_store)
+        logger.info("Call to rebuild from archive is complete.")
+
+    @staticmethod
+    def backfill(
+        oldest_season: str,
+        seasons_per_run: int
+    ) -> None:
+        """Build seasons older than the configured first season, newest first.
+
+        Each run builds at most seasons_per_run seasons, so that the history
+        can be extended lazily, e.g. from a scheduled job or in the background
+        after a build. A backfill does not run while another build, rebuild
+        or backfill writes to the databases.
+
+        Args:
+            oldest_season (str): Oldest season to backfill.
+            seasons_per_run (int): Maximum number of seasons to build in this run.
+        """
+        logger.info("Call to backfill starting.")
+        execution_context._ensure_app_dir()
+        lock_path = os.path.join(execution_context.app_dir, DB.write_lock_file_name)
+        if not Builder._acquire_lock(lock_path):
+            print("<yellow>A build or backfill is already running.</yellow>")
+            logger.info("Backfill skipped, another build or backfill is running.")
+            return
+        try:
+            meta_db = utl.get_sqlitedict_tables(
+                DB.meta_table_name,
+                path=execution_context.app_dir
+            )[DB.meta_table_name]
+            seasons = [
+                season for season in SeasonCatalog.get_backfill_seasons(oldest_season)
+                if utl.get_composite_key(Keys.season, season) not in meta_db
+            ]
+            meta_db.close()
+            if not seasons:
+                logger.info("Nothing left to backfill.")
+                return
+            seasons = seasons[:seasons_per_run]
+            logger.info(f"Backfilling seasons '{seasons}'.")
+            execution_context.incremental = True
+            execution_context.players_from_box_scores = True
+            Builder._build(seasons)
+        finally:
+            os.remove(lock_path)
+        logger.info("Call to backfill is complete.")
+
+    @staticmethod
+    def start_backfill(
+        oldest_season: str,
+        seasons_per_run: int
+    ) -> None:
+        """Run a backfill in a detached background process.
+
+        Args:
+            oldest_season (str): Oldest season to backfill.
+            seasons_per_run (int): Maximum number of seasons to build.
+        """
+        command = [
+            sys.executable, "-m", "nhl_predictor.main", "backfill",
+            "--oldest-season", str(oldest_season),
+            "--seasons-per-run", str(seasons_per_run),
+            "--first-season", execution_context.first_season,
+            "--workers", str(execution_context.workers),
+            "--rate-limit", str(execution_context.rate_limit),
+            "--app-dir", str(execution_context.app_dir)
+        ]
+        process = subprocess.Popen(
+            command,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True
+        )
+        logger.info(f"Started background backfill. PID: '{process.pid}'.")
+
+    @staticmethod
+    def _wait_for_write_lock() -> str:
+        """Acquire the write lock, waiting while another build, rebuild or
+        backfill holds it.
+
+        Returns:
+            str: Path of the lock file, to remove once done.
+        """
+        lock_path = os.path.join(execution_context.app_dir, DB.write_lock_file_name)
+        if not Builder._acquire_lock(lock_path):
+            print("<yellow>Waiting for another build or backfill to finish.</yellow>")
+            logger.info("Waiting for the write lock held by another build or backfill.")
+            while not Builder._acquire_lock(lock_path):
+                time.sleep(Builder._lock_poll_interval)
+        return lock_path
+
+    @staticmethod
+    def _acquire_lock(lock_path: str) -> bool:
+        """Create a lock file holding the current process ID. Lock files left
+        behind by processes that no longer run are replaced.
+
+        Args:
+            lock_path (str): Path of the lock file.
+
+        Returns:
+            bool: True if the lock was acquired.
+        """
+        try:
+            descriptor = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            try:
+                with open(lock_path) as file:
+                    os.kill(int(file.read()), 0)
+                return False
+            except (OSError, ValueError):
+                logger.warning(f"Replacing stale lock file '{lock_path}'.")
+                os.remove(lock_path)
+                return Builder._acquire_lock(lock_path)
+        with os.fdopen(descriptor, "w") as file:
+            file.write(str(os.getpid()))
+        return True
+
+    @staticmethod
+    def _sync_derived_stores(
+        data: Dict[str, SqliteDict],
+        relational_store: RelationalStore
+    ) -> None:
+        """Bring the relational store and the columnar copies in step with the
+        SqliteDict tables. Closes the relational store.
+
+        Args:
+            data (Dict[str, SqliteDict]): Dictionary of tables holding raw data.
+            relational_store (RelationalStore): The relational store.
+        """
+        for name in [
+            DB.players_table_name,
+            DB.skater_stats_table_name,
+            DB.goalie_stats_table_name,
+            DB.games_table_name
+        ]:
+            relational_store.sync_table(name, data[name])
+        ColumnarStore(execution_context.app_dir).export_tables(
+            data[DB.meta_table_name],
+            relational_store.read_table,
+            DB.players_table_name,
+            DB.skater_stats_table_name,
+            DB.goalie_stats_table_name,
+            DB.games_table_name
+        )
+        relational_store.close()
     
     @staticmethod
     def report() -> None:
@@ -131,168 +421,614 @@ class Builder:
     @staticmethod
     def _build_stats_by_season(
         data: Dict[str, SqliteDict],
-        seasons: List[str] = [x.value for  x in Seasons.items()],
-    ) -> None:
+        writer: BatchWriter,
+        relational_store: RelationalStore,
+        seasons: List[str]
+    ) -> set[int]:
         """Iterates over the specified seasons and adds those seasons' data to
         the local database.
 
+        Progress is recorded in the checkpoints table per season, team schedule
+        and game. When resuming, completed seasons and games are skipped and
+        the stored team schedules are reused. Completed seasons are also
+        recorded in the meta table, which backfills use to find the seasons
+        that remain to be built, and their fully stored dates in the ingested
+        dates table.
+
         Args:
-            data (Dict[str, SqliteDict]): Dictionary of tables to store raw data in.
-            seasons (List[str], optional): List of seasons to process. Defaults to all items in Seasons enumeration.
+            data (Dict[str, SqliteDict]): Dictionary of tables holding raw data.
+            writer (BatchWriter): Writer used to store raw data.
+            relational_store (RelationalStore): The relational store.
+            seasons (List[str]): List of seasons to process.
+
+        Returns:
+            set[int]: IDs of the players appearing in the ingested box scores.
         """
         logger.info("Start building seasons.")
+        player_ids = set()
+        stored_game_ids = set()
+        if execution_context.incremental:
+            stored_game_ids = Builder._get_stored_game_ids(data, relational_store)
+        checkpoints_db = data[DB.checkpoints_table_name]
         for season in seasons:
+            season_key = utl.get_composite_key(Keys.season, season)
+            if execution_context.resume and season_key in checkpoints_db:
+                logger.info(f"Season '{season}' was completed by the interrupted build, skipping.")
+                continue
             logger.info(f"Start of processing for season '{season}'.")
-            for team in TeamMap:
-                logger.info(f"Start processing for team '{team}' in season '{season}'.")
-                try:
-                    games_raw = execution_context.client.schedule.team_season_schedule(team, season)[Keys.games]
-                    logger.info(f"Found '{len(games_raw)}' games for team '{team}' in season '{season}'.")
-                    Builder._process_raw_games(games_raw, data)
-                except Exception as e:
-                    print("<red>Exception occured. Check logs.</red>")
-                    logger.exception(
-                        f"Exception processing team_season_schedule query. "
-                        f"Games: '{json.dumps(games_raw, indent=4)}',"
-                        f"Exception: '{str(e)}'.",
-                        stack_info=True)
+            games_raw, planned = Builder._plan_season(season, checkpoints_db, writer)
+            planned_games = games_raw
+            logger.info(f"Found '{len(games_raw)}' unique games in season '{season}'.")
+            if stored_game_ids:
+                games_raw = [game for game in games_raw if game[Keys.id] not in stored_game_ids]
+                logger.info(f"'{len(games_raw)}' games in season '{season}' are not stored yet.")
+            if execution_context.resume:
+                games_raw = [
+                    game for game in games_raw
+                    if utl.get_composite_key(Keys.game_id, game[Keys.id]) not in checkpoints_db
+                ]
+                logger.info(f"'{len(games_raw)}' games in season '{season}' remain to be processed.")
+            player_ids |= Builder._process_raw_games(games_raw, writer)
+
+            if planned:
+                writer.flush()
+                Builder._record_ingested_dates(data, writer, planned_games)
+                # The team schedules are only needed until the season is done.
+                for team in Builder._get_season_teams(season):
+                    writer.delete(
+                        DB.checkpoints_table_name,
+                        utl.get_composite_key(Keys.team_id, season, team)
+                    )
+                writer.write(DB.checkpoints_table_name, season_key, {
+                    Keys.last_update: datetime.now(timezone.utc)
+                })
+                writer.write(DB.meta_table_name, season_key, {
+                    Keys.last_update: datetime.now(timezone.utc)
+                })
+            writer.flush()
         logger.info("Finished building seasons.")
-    
+        return player_ids
+
+    @staticmethod
+    def _get_stored_game_ids(
+        data: Dict[str, SqliteDict],
+        relational_store: RelationalStore
+    ) -> set[int]:
+        """Get the IDs of games that are already fully stored in the database.
+
+        A game row is only written once its box score has been processed, so
+        any official game in the games table can be skipped by an incremental
+        build. The IDs are read from the relational store so that the cost
+        does not grow with the size of each stored game.
+
+        Args:
+            data (Dict[str, SqliteDict]): Dictionary of tables holding raw data.
+            relational_store (RelationalStore): The relational store.
+
+        Returns:
+            set[int]: IDs of the games that do not need to be fetched again.
+        """
+        meta_db = data[DB.meta_table_name]
+        if DB.games_table_name not in meta_db:
+            logger.info("Games table has never been updated, performing full build.")
+            return set()
+        logger.info(
+            f"Incremental build. Games table last updated: "
+            f"'{meta_db[DB.games_table_name][Keys.last_update]}'."
+        )
+        relational_store.sync_table(DB.games_table_name, data[DB.games_table_name])
+        return relational_store.get_game_ids(GameState.Official.value)
+
+    @staticmethod
+    def _plan_season(
+        season: str,
+        checkpoints_db: SqliteDict,
+        writer: BatchWriter
+    ) -> Tuple[List[Dict[str, object]], bool]:
+        """Collects the schedule of every team that played in a season into a
+        single list of unique games.
+
+        Each game appears on the schedules of both participating teams, so
+        games are deduplicated by game ID before any box scores are fetched.
+
+        Each downloaded schedule is checkpointed. When resuming, checkpointed
+        schedules are reused instead of being downloaded again.
+
+        Args:
+            season (str): The season to plan.
+            checkpoints_db (SqliteDict): The checkpoints table.
+            writer (BatchWriter): Writer used to store checkpoints.
+
+        Returns:
+            Tuple[List[Dict[str, object]], bool]: Raw game JSON for each unique
+            game, ordered by game ID, and whether every team's schedule was
+            retrieved.
+        """
+        games = {}
+        teams = []
+        season_teams = Builder._get_season_teams(season)
+        for team in season_teams:
+            team_key = utl.get_composite_key(Keys.team_id, season, team)
+            if execution_context.resume and team_key in checkpoints_db:
+                for game in checkpoints_db[team_key][Keys.games]:
+                    games.setdefault(game[Keys.id], game)
+            else:
+                teams.append(team)
+        if len(teams) < len(season_teams):
+            logger.info(f"Reusing '{len(season_teams) - len(teams)}' checkpointed team schedules.")
+
+        planned = True
+        fetcher = ConcurrentFetcher(execution_context.workers)
+        for team, schedule, exception in fetcher.fetch(
+            lambda team: execution_context.client.schedule.team_season_schedule(team, season),
+            teams
+        ):
+            if exception is not None:
+                print("<red>Exception occured. Check logs.</red>")
+                logger.error(
+                    f"Exception processing team_season_schedule query. Team: "
+                    f"'{team}', Season: '{season}', Exception: '{str(exception)}'."
+                )
+                planned = False
+                continue
+            games_raw = utl.json_value_or_default(schedule, Keys.games, default=[])
+            logger.info(f"Found '{len(games_raw)}' games for team '{team}' in season '{season}'.")
+            for game in games_raw:
+                games.setdefault(game[Keys.id], game)
+            writer.write(
+                DB.checkpoints_table_name,
+                utl.get_composite_key(Keys.team_id, season, team),
+                {Keys.games: games_raw, Keys.last_update: datetime.now(timezone.utc)}
+            )
+        return [games[game_id] for game_id in sorted(games)], planned
+
+    @staticmethod
+    def _record_ingested_dates(
+        data: Dict[str, SqliteDict],
+        writer: BatchWriter,
+        games_raw: List[Dict[str, object]]
+    ) -> None:
+        """Record the dates whose scheduled games are all stored in the games
+        table, so that predictions can list those dates without the schedule
+        API.
+
+        Dates with any game that is not stored, e.g. preseason, unsupported,
+        failed or unplayed games, are not recorded.
+
+        Args:
+            data (Dict[str, SqliteDict]): Dictionary of tables holding raw data.
+            writer (BatchWriter): Writer used to store the dates.
+            games_raw (List[Dict[str, object]]): Every scheduled game of a
+            fully planned season.
+        """
+        games_db = data[DB.games_table_name]
+        ingested_dates_db = data[DB.ingested_dates_table_name]
+        game_ids_by_date = {}
+        for game in games_raw:
+            date = utl.json_value_or_default(game, Keys.game_date, default=None)
+            if date is not None:
+                game_ids_by_date.setdefault(date, []).append(game[Keys.id])
+
+        ingested = 0
+        for date, game_ids in game_ids_by_date.items():
+            if date in ingested_dates_db or not all(game_id in games_db for game_id in game_ids):
+                continue
+            writer.write(DB.ingested_dates_table_name, date, {
+                Keys.games: sorted(game_ids),
+                Keys.last_update: datetime.now(timezone.utc)
+            })
+            ingested += 1
+        logger.info(f"Recorded '{ingested}' newly ingested dates.")
+
+    @staticmethod
+    def _get_season_teams(season: str) -> List[str]:
+        """Get the team abbreviations that played in a season.
+
+        Args:
+            season (str): The season ID.
+
+        Returns:
+            List[str]: Abbreviations, in TeamMap order.
+        """
+        season = int(season)
+        return [
+            team for team in TeamMap
+            if TeamSeasons[team][0] <= season
+            and (TeamSeasons[team][1] is None or season <= TeamSeasons[team][1])
+        ]
+
     @staticmethod
     def _process_raw_games(
         games_raw: Dict[str, object],
-        data: Dict[str, SqliteDict]
-    ) -> None:
+        writer: BatchWriter
+    ) -> set[int]:
         """Iterates over the provided raw game data and adds it to the local
         database.
 
         Args:
             games_raw (Dict[str, object]): Dictionary with raw game JSON.
-            data (Dict[str, SqliteDict]): Dictionary of tables to store raw data
-            in.
+            writer (BatchWriter): Writer used to store raw data.
+
+        Returns:
+            set[int]: IDs of the players appearing in the processed box scores.
         """
         logger.info("Start processing game.")
-        games_db = data[DB.games_table_name]
-        meta_db = data[DB.meta_table_name]
+        game_rows = {}
 
-        try:
-            for game in games_raw:
-                logger.info(f"Processing game: '{game}'.")
-                try:
-                    if (GameType(utl.json_value_or_default(game, Keys.game_type, default=GameType.Preseason))
-                        not in SupportedGameTypes):
-                        logger.info(
-                            f"Skipping game '{game[Keys.id]}' which is not a "
-                            f"supported game type. Type: '{game[Keys.game_type]}'."
-                        )
-                        continue
-                    if (GameState(utl.json_value_or_default(game, Keys.game_state, default=GameState.Future))
-                        not in GameStatesForDataset):
-                        logger.info(
-                            f"Skipping game '{game[Keys.id]}' which is not a "
-                            f"supported game state. State: '{game[Keys.game_state]}'."
-                        )
-                        continue
-                    if game[Keys.home_team][Keys.score] > game[Keys.away_team][Keys.score]:
-                        winner = HomeOrAway.HOME.value
-                    else:
-                        winner = HomeOrAway.AWAY.value
-                    # game ID is the primary key for the games DB
-                    games_db[game[Keys.id]] = {
-                        Keys.season: game[Keys.season],
-                        Keys.game_type: game[Keys.game_type],
-                        Keys.game_state: game[Keys.game_state],
-                        Keys.home_team: game[Keys.home_team][Keys.id],
-                        Keys.away_team: game[Keys.away_team][Keys.id],
-                        Keys.winner: winner
-                    }
-                except Exception as e:
-                    print("\033[31mException occured. Check logs.\033[0m")
-                    logger.exception(
-                        f"Exception adding game data to database. Exception: "
-                        f"'{str(e)}'.",
-                        stack_info=True
+        for game in games_raw:
+            logger.info(f"Processing game: '{utl.json_value_or_default(game, Keys.id)}'.")
+            try:
+                if (GameType(utl.json_value_or_default(game, Keys.game_type, default=GameType.Preseason))
+                    not in SupportedGameTypes):
+                    logger.info(
+                        f"Skipping game '{game[Keys.id]}' which is not a "
+                        f"supported game type. Type: '{game[Keys.game_type]}'."
                     )
-
-                try:
-                    box_score = execution_context.client.game_center.boxscore(game[Keys.id])
-                    Builder._process_box_score(box_score, data)
-                except Exception as e:
-                    print("\033[31mException occured. Check logs.\033[0m")
-                    logger.exception(
-                        f"Exception processing box_score query. Exception: "
-                        f"'{str(e)}', box_score: '{json.dumps(box_score, indent=4)}'.",
-                        stack_info=True
+                    continue
+                if (GameState(utl.json_value_or_default(game, Keys.game_state, default=GameState.Future))
+                    not in GameStatesForDataset):
+                    logger.info(
+                        f"Skipping game '{game[Keys.id]}' which is not a "
+                        f"supported game state. State: '{game[Keys.game_state]}'."
                     )
+                    continue
+                if game[Keys.home_team][Keys.score] > game[Keys.away_team][Keys.score]:
+                    winner = HomeOrAway.HOME.value
+                else:
+                    winner = HomeOrAway.AWAY.value
+                game_rows[game[Keys.id]] = {
+                    Keys.season: game[Keys.season],
+                    Keys.game_type: game[Keys.game_type],
+                    Keys.game_state: game[Keys.game_state],
+                    Keys.home_team: game[Keys.home_team][Keys.id],
+                    Keys.away_team: game[Keys.away_team][Keys.id],
+                    Keys.winner: winner,
+                    Keys.game_date: utl.json_value_or_default(game, Keys.game_date, default=None),
+                    Keys.home_team_name: utl.json_value_or_default(
+                        game, Keys.home_team, Keys.common_name, Keys.default, default=None
+                    ),
+                    Keys.away_team_name: utl.json_value_or_default(
+                        game, Keys.away_team, Keys.common_name, Keys.default, default=None
+                    )
+                }
+            except Exception as e:
+                print("\033[31mException occured. Check logs.\033[0m")
+                logger.exception(
+                    f"Exception adding game data to database. Exception: "
+                    f"'{str(e)}'.",
+                    stack_info=True
+                )
 
-            meta_db[DB.games_table_name] = {
-                Keys.last_update: datetime.now(timezone.utc)
-            }
-        except Exception as e:
-            print("\033[31mException occured. Check logs.\033[0m")
-            logger.exception(
-                f"Exception processing team_season_schedule query. Exception: "
-                f"'{str(e)}', games: '{json.dumps(games_raw, indent=4)}', "
-                f"box_score: '{json.dumps(box_score, indent=4)}'.", stack_info=True
+        return Builder._process_game_rows(game_rows, writer)
+
+    @staticmethod
+    def _retry_failed_games(
+        data: Dict[str, SqliteDict],
+        writer: BatchWriter
+    ) -> set[int]:
+        """Retry the games whose box score could not be stored by a previous
+        build.
+
+        Args:
+            data (Dict[str, SqliteDict]): Dictionary of tables holding raw data.
+            writer (BatchWriter): Writer used to store raw data.
+
+        Returns:
+            set[int]: IDs of the players appearing in the processed box scores.
+        """
+        failed_games_db = data[DB.failed_games_table_name]
+        if not len(failed_games_db):
+            return set()
+        logger.info(f"Retrying '{len(failed_games_db)}' games that failed in previous builds.")
+        player_ids = Builder._process_game_rows(
+            {int(game_id): row for game_id, row in failed_games_db.items()},
+            writer
+        )
+        # Commit the retried games so that incremental builds skip them.
+        writer.flush()
+        return player_ids
+
+    @staticmethod
+    def _process_game_rows(
+        game_rows: Dict[int, Dict[str, object]],
+        writer: BatchWriter,
+        box_scores: Iterable[Tuple[int, Dict[str, object], Exception]] = None
+    ) -> set[int]:
+        """Download and store the box score of each game, then store the game.
+
+        Games stream through a producer -> parser -> writer pipeline: box
+        scores are downloaded concurrently, bounded by the configured number of
+        workers, stats rows are extracted on a parser thread and all database
+        writes happen on the calling thread. The stages are connected by
+        bounded queues, so memory use does not grow with the number of games.
+
+        When more than one process is configured, the games are split into
+        shards that worker processes download and parse into rows, and the
+        calling process remains the only one writing to the databases.
+
+        Games whose box score cannot be downloaded or stored are recorded in the
+        failed games table so that the next build retries them. If games that
+        were already stored are stored again, the data generation is bumped.
+
+        Args:
+            game_rows (Dict[int, Dict[str, object]]): Game rows keyed by game ID.
+            writer (BatchWriter): Writer used to store raw data.
+            box_scores (Iterable[Tuple[int, Dict[str, object], Exception]], optional):
+            Tuples of (game ID, box score, exception) to process instead of
+            downloading the box scores. Defaults to None.
+
+        Returns:
+            set[int]: IDs of the players appearing in the processed box scores.
+        """
+        player_ids = set()
+        failed_game_ids = set()
+        stored_game_ids = set()
+        rewritten_game_ids = set()
+
+        def store(parsed: Tuple[int, Dict[str, object], RowBuffer, set[int], Exception]) -> None:
+            game_id, box_score, rows, game_player_ids, exception = parsed
+            if exception is not None:
+                print("\033[31mException occured. Check logs.\033[0m")
+                logger.error(
+                    f"Exception processing box_score. Game: '{game_id}', "
+                    f"Exception: '{str(exception)}'.",
+                    exc_info=exception
+                )
+                failed_game_ids.add(game_id)
+                return
+            if writer.contains(DB.games_table_name, game_id):
+                rewritten_game_ids.add(game_id)
+            stored_game_ids.add(game_id)
+            writer.write_rows(rows)
+            player_ids.update(game_player_ids)
+            # game ID is the primary key for the games DB. The game row is
+            # written last so that incremental builds only skip games whose
+            # box score has been stored.
+            writer.write(DB.games_table_name, game_id, game_rows[game_id])
+            writer.archive_box_score(game_id, game_rows[game_id], box_score)
+            writer.delete(DB.failed_games_table_name, game_id)
+            writer.write(
+                DB.checkpoints_table_name,
+                utl.get_composite_key(Keys.game_id, game_id),
+                {Keys.last_update: datetime.now(timezone.utc)}
+            )
+            writer.checkpoint()
+
+        if box_scores is None and execution_context.processes > 1:
+            StreamingPipeline("games", execution_context.workers * 2).run(
+                Builder._fetch_and_parse_in_processes(list(game_rows)),
+                lambda parsed: parsed,
+                store
+            )
+        else:
+            if box_scores is None:
+                box_scores = ConcurrentFetcher(execution_context.workers).fetch(
+                    execution_context.client.game_center.boxscore,
+                    game_rows
+                )
+            StreamingPipeline("games", execution_context.workers * 2).run(
+                box_scores,
+                lambda fetched: Builder._parse_box_score(*fetched),
+                store
+            )
+
+        for game_id in failed_game_ids:
+            writer.write(DB.failed_games_table_name, game_id, game_rows[game_id])
+        if failed_game_ids:
+            logger.warning(
+                f"'{len(failed_game_ids)}' games could not be stored and will be "
+                f"retried by the next build."
             )
+
+        # Only mark the games table as updated when a game was stored, so that
+        # builds storing nothing keep cached data sets valid. The stats
+        # tables are marked by the rows of each stored game.
+        if stored_game_ids:
+            writer.write(DB.meta_table_name, DB.games_table_name, {
+                Keys.last_update: datetime.now(timezone.utc)
+            })
+        if rewritten_game_ids:
+            logger.info(f"'{len(rewritten_game_ids)}' stored games were stored again.")
+            Builder._bump_data_generation(writer)
         logger.info("Finished processing game.")
+        return player_ids
+
+    @staticmethod
+    def _bump_data_generation(writer: BatchWriter) -> None:
+        """Record that stored rows were overwritten, so that cached data sets
+        built from the previous rows are not extended with new games.
+
+        Args:
+            writer (BatchWriter): Writer used to store raw data.
+        """
+        writer.write(DB.meta_table_name, DB.data_generation_key, {
+            Keys.last_update: datetime.now(timezone.utc)
+        })
+
+    @staticmethod
+    def _fetch_and_parse_in_processes(
+        game_ids: List[int]
+    ) -> Iterator[Tuple[int, Dict[str, object], RowBuffer, set[int], Exception]]:
+        """Download and parse box scores on a pool of worker processes.
+
+        The games are split into shards of a few games each, and each worker
+        process downloads and parses a whole shard, so that parsing is spread
+        over several cores. The configured number of workers and rate limit are
+        shared between the processes.
+
+        Args:
+            game_ids (List[int]): IDs of the games to download.
+
+        Yields:
+            Iterator[Tuple[int, Dict[str, object], RowBuffer, set[int], Exception]]:
+            Parsed games, as returned by _parse_box_score, in completion order.
+        """
+        processes = execution_context.processes
+        shards = [
+            game_ids[i:i + Builder._shard_size]
+            for i in range(0, len(game_ids), Builder._shard_size)
+        ]
+        settings = {
+            "app_dir": execution_context.app_dir,
+            "workers": max(1, execution_context.workers // processes),
+            "rate_limit": execution_context.rate_limit / processes,
+            "request_timeout": execution_context.request_timeout,
+            "max_retries": execution_context.max_retries,
+            "use_cache": execution_context.use_cache,
+            # Every process shares the cache directory, and each one evicts
+            # down to its own bound, so the bound must not be divided.
+            "cache_size": execution_context.cache_size,
+            "archive_box_scores": execution_context.archive_box_scores
+        }
+        # Worker processes are spawned rather than forked so that they do not
+        # inherit the open database connections and pipeline threads.
+        with ProcessPoolExecutor(
+            max_workers=processes,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=Builder._init_worker_process,
+            initargs=(settings,)
+        ) as executor:
+            # Each thread waits on one shard, which bounds the shards in flight.
+            for shard, parsed_games, exception in ConcurrentFetcher(processes).fetch(
+                lambda shard: executor.submit(Builder._fetch_and_parse_shard, shard).result(),
+                shards
+            ):
+                if exception is not None:
+                    parsed_games = [(game_id, None, None, set(), exception) for game_id in shard]
+                yield from parsed_games
+
+    @staticmethod
+    def _init_worker_process(settings: Dict[str, object]) -> None:
+        """Configure the execution context of a worker process.
+
+        Args:
+            settings (Dict[str, object]): Execution context property values.
+        """
+        for name, value in settings.items():
+            setattr(execution_context, name, value)
+
+    @staticmethod
+    def _fetch_and_parse_shard(
+        game_ids: List[int]
+    ) -> List[Tuple[int, Dict[str, object], RowBuffer, set[int], Exception]]:
+        """Download and parse a shard of box scores. Runs in a worker process.
+
+        Args:
+            game_ids (List[int]): IDs of the games in the shard.
+
+        Returns:
+            List[Tuple[int, Dict[str, object], RowBuffer, set[int], Exception]]:
+            Parsed games, as returned by _parse_box_score. Box scores are only
+            sent back when they are archived, and exceptions are replaced by
+            exceptions that can be sent between processes.
+        """
+        parsed_games = []
+        for fetched in ConcurrentFetcher(execution_context.workers).fetch(
+            execution_context.client.game_center.boxscore,
+            game_ids
+        ):
+            game_id, box_score, rows, player_ids, exception = Builder._parse_box_score(*fetched)
+            if not execution_context.archive_box_scores:
+                box_score = None
+            if exception is not None:
+                exception = RuntimeError(f"{type(exception).__name__}: {str(exception)}")
+            parsed_games.append((game_id, box_score, rows, player_ids, exception))
+        return parsed_games
+
+    @staticmethod
+    def _parse_box_score(
+        game_id: int,
+        box_score: Dict[str, object],
+        exception: Exception
+    ) -> Tuple[int, Dict[str, object], RowBuffer, set[int], Exception]:
+        """Extract the stats rows of a downloaded box score. Runs on the parser
+        thread of the ingestion pipeline.
+
+        Args:
+            game_id (int): Game ID.
+            box_score (Dict[str, object]): Raw box score JSON, or None if the
+            download failed.
+            exception (Exception): Download exception, or None.
+
+        Returns:
+            Tuple[int, Dict[str, object], RowBuffer, set[int], Exception]: The
+            game ID, the box score, the extracted rows, the IDs of the players
+            in the game and the exception raised while downloading or parsing,
+            if any.
+        """
+        if exception is not None:
+            return game_id, None, None, set(), exception
+        rows = RowBuffer()
+        try:
+            player_ids = Builder._process_box_score(box_score, rows)
+        except Exception as e:
+            return game_id, None, None, set(), e
+        return game_id, box_score, rows, player_ids, None
 
     @staticmethod
     def _process_box_score(
         box_score: Dict[str, object],
-        data: Dict[str, SqliteDict]
-    ) -> None:
-        """Iterates of the provided raw box score data and adds it to the local
-        database.
+        rows: RowBuffer
+    ) -> set[int]:
+        """Extracts the skater and goalie stats rows from the provided raw box
+        score data.
 
         Args:
             box_score (Dict[str, object]): Dictionary with raw box score JSON.
-            data (Dict[str, SqliteDict]): Dictionary of tables to store raw data in.
+            rows (RowBuffer): Buffer collecting the extracted rows.
+
+        Returns:
+            set[int]: IDs of the players appearing in the box score.
         """
-        logger.info("Processing box_score. BoxScore: '{box_score}'.")
+        logger.info(f"Processing box_score. Game: '{utl.json_value_or_default(box_score, Keys.id)}'.")
         
         if Keys.player_by_game_stats not in box_score:
             logger.warning("Roster not published yet")
-            return None
+            return set()
         
         home_team = utl.json_value_or_default(box_score, Keys.player_by_game_stats, Keys.home_team)
         away_team = utl.json_value_or_default(box_score, Keys.player_by_game_stats, Keys.away_team)
 
         Builder._process_skaters(
             home_team[Keys.forwards] + home_team[Keys.defense],
-            data,
+            rows,
             utl.json_value_or_default(box_score, Keys.id),
             utl.json_value_or_default(box_score, Keys.home_team, Keys.id),
             HomeOrAway.HOME
         )
         Builder._process_goalies(
             home_team[Keys.goalies],
-            data,
+            rows,
             utl.json_value_or_default(box_score, Keys.id),
             utl.json_value_or_default(box_score, Keys.home_team, Keys.id),
             HomeOrAway.HOME
         )
         Builder._process_skaters(
             away_team[Keys.forwards] + away_team[Keys.defense],
-            data,
+            rows,
             utl.json_value_or_default(box_score, Keys.id),
             utl.json_value_or_default(box_score, Keys.away_team, Keys.id),
             HomeOrAway.AWAY
         )
         Builder._process_goalies(
             away_team[Keys.goalies],
-            data,
+            rows,
             utl.json_value_or_default(box_score, Keys.id),
             utl.json_value_or_default(box_score, Keys.away_team, Keys.id),
             HomeOrAway.AWAY
         )
 
         logger.info("Box score processed.")
+        return set(
+            player[Keys.player_id]
+            for team in [home_team, away_team]
+            for player in team[Keys.forwards] + team[Keys.defense] + team[Keys.goalies]
+        )
 
     @staticmethod
     def _process_skaters(
         skaters: Dict[str, object],
-        data: Dict[str, SqliteDict],
+        rows: RowBuffer,
         game_id: str,
         team_id: str,
         team_role: HomeOrAway
@@ -301,20 +1037,19 @@ class Builder:
 
         Args:
             skaters (Dict[str, object]): Skater JSON data.
-            data (Dict[str, SqliteDict]): Dictionary of tables to store raw data in.
+            rows (RowBuffer): Buffer collecting the extracted rows.
             game_id (str): Game ID for the game represented in the data.
             team_id (str): Team ID for the team represented in the data.
             team_role (HomeOrAway): Team role represented in the data.
         """
         logger.info("Started adding skaters to database.")
-        skater_stats_db = data[DB.skater_stats_table_name]
-        meta_db = data[DB.meta_table_name]
 
         for skater in skaters:
-            logger.info(f"Processing skater. Skater:'{skater}'.")
-            skater_stats_db[len(skater_stats_db)+1] = {
+            player_id = utl.json_value_or_default(skater, Keys.player_id)
+            logger.info(f"Processing skater. Player: '{player_id}'.")
+            rows.write(DB.skater_stats_table_name, utl.get_composite_key(game_id, player_id), {
                 Keys.game_id: game_id,
-                Keys.player_id: utl.json_value_or_default(skater, Keys.player_id),
+                Keys.player_id: player_id,
                 Keys.goals: utl.json_value_or_default(skater, Keys.goals),
                 Keys.assists: utl.json_value_or_default(skater, Keys.assists),
                 Keys.points: utl.json_value_or_default(skater, Keys.points),
@@ -331,17 +1066,17 @@ class Builder:
                 Keys.takeaways: utl.json_value_or_default(skater, Keys.takeaways),
                 Keys.team_id: team_id,
                 Keys.team_role: team_role.value
-            }
+            })
 
-        meta_db[DB.skater_stats_table_name] = {
+        rows.write(DB.meta_table_name, DB.skater_stats_table_name, {
             Keys.last_update: datetime.now(timezone.utc)
-        }
+        })
         logger.info("Finished adding skaters to database.")
 
     @staticmethod
     def _process_goalies(
         goalies: Dict[str, object],
-        data: Dict[str, SqliteDict],
+        rows: RowBuffer,
         game_id: str,
         team_id: str,
         team_role: HomeOrAway
@@ -350,23 +1085,24 @@ class Builder:
 
         Args:
             goalies (Dict[str, object]): Goalie JSON data.
-            data (Dict[str, SqliteDict]): Dictionary of tables to store raw data in.
+            rows (RowBuffer): Buffer collecting the extracted rows.
             game_id (str): Game ID for the game represented in the data.
             team_id (str): Team ID for the team represented in the data.
             team_role (HomeOrAway): Team role represented in the data.
         """
         logger.info("Started adding goalies to database.")
-        goalie_stats_db = data[DB.goalie_stats_table_name]
-        meta_db = data[DB.meta_table_name]
 
         for goalie in goalies:
-            logger.info(f"Processing goalie. Goalie:'{goalie}'.")
-            goalie_stats_db[len(goalie_stats_db)+1] = {
+            player_id = utl.json_value_or_default(goalie, Keys.player_id)
+            logger.info(f"Processing goalie. Player: '{player_id}'.")
+            # Compound "saves/shots" stats are split into integer columns here
+            # so that consumers never parse strings.
+            rows.write(DB.goalie_stats_table_name, utl.get_composite_key(game_id, player_id), utl.split_compound_stats({
                 Keys.game_id: game_id,
-                Keys.player_id: utl.json_value_or_default(goalie, Keys.player_id),
+                Keys.player_id: player_id,
                 Keys.even_strength_shots_against: utl.json_value_or_default(goalie, Keys.even_strength_shots_against),
                 Keys.power_play_shots_against: utl.json_value_or_default(goalie, Keys.power_play_shots_against),
-                Keys.shorthanded_shots_against: utl.json_value_or_default(goalie, Keys.power_play_shots_against),
+                Keys.shorthanded_shots_against: utl.json_value_or_default(goalie, Keys.shorthanded_shots_against),
                 Keys.save_shots_against: utl.json_value_or_default(goalie, Keys.save_shots_against),
                 Keys.save_pctg: utl.json_value_or_default(goalie, Keys.save_pctg),
                 Keys.even_strength_goals_against: utl.json_value_or_default(goalie, Keys.even_strength_goals_against),
@@ -381,57 +1117,134 @@ class Builder:
                 Keys.saves: utl.json_value_or_default(goalie, Keys.saves),
                 Keys.team_id: team_id,
                 Keys.team_role: team_role.value
-            }
+            }))
 
-        meta_db[DB.goalie_stats_table_name] = {
+        rows.write(DB.meta_table_name, DB.goalie_stats_table_name, {
             Keys.last_update: datetime.now(timezone.utc)
-        }
+        })
         logger.info("Finished adding goalies to database.")
 
+    @staticmethod
+    def _get_content(
+        url: str,
+        params: Dict[str, object]
+    ) -> bytes:
+        """Make a GET request outside of the nhlpy APIs through the shared
+        transport.
+
+        Args:
+            url (str): Request URL.
+            params (Dict[str, object]): Request query parameters.
+
+        Returns:
+            bytes: The response content.
+        """
+        resp = execution_context.transport.get(url, params)
+        resp.raise_for_status()
+        return resp.content
+
     @staticmethod
     def populate_players(
-        data: Dict[str, SqliteDict]
+        data: Dict[str, SqliteDict],
+        writer: BatchWriter,
+        player_ids: set[int] = None
     ) -> None:
         """Populate the players into the players table.
 
+        Players whose record was refreshed within the configured maximum age
+        are skipped. Career stats of the remaining players are downloaded
+        concurrently, bounded by the configured number of workers.
+
         Args:
-            data (Dict[str, SqliteDict]): Dictionary of tables to store raw data in.
+            data (Dict[str, SqliteDict]): Dictionary of tables holding raw data.
+            writer (BatchWriter): Writer used to store raw data.
+            player_ids (set[int], optional): Only refresh these players.
+            Defaults to None, which refreshes every active player.
         """
         logger.info("Started adding players to database.")
+
+        if player_ids is None:
+            # I don't find this endpoint in the nhlpy APIs. Making a manual request
+            # to get all active players.
+            url = "https://search.d3.nhle.com/api/v1/search/player"
+            params = dict(
+                culture="en-us",
+                limit="50000",
+                q="*",
+                active="true"
+            )
+            players_json = execution_context.http_cache.get_json(
+                url,
+                params,
+                lambda: Builder._get_content(url, params)
+            )
+            if not players_json:
+                logger.error("Unable to get JSON response content from players query.")
+                return
+            player_ids = set(
+                utl.json_value_or_default(player, Keys.player_id, default=None)
+                for player in players_json
+            )
+            player_ids.discard(None)
+
         players_db = data[DB.players_table_name]
-        meta_db = data[DB.meta_table_name]
-        
-        # I don't find this endpoint in the nhlpy APIs. Making a manual request
-        # to get all active players.
-        url = "https://search.d3.nhle.com/api/v1/search/player"
-        params = dict(
-            culture="en-us",
-            limit="50000",
-            q="*",
-            active="true"
+        stale_player_ids = [
+            player_id for player_id in sorted(player_ids)
+            if not Builder._is_player_fresh(players_db, player_id)
+        ]
+        logger.info(
+            f"Refreshing '{len(stale_player_ids)}' of '{len(player_ids)}' players. "
+            f"The others are up to date."
         )
-        resp = requests.get(url=url, params=params)
-        players_json = resp.json()
 
-        if not players_json:
-            logger.error("Unable to get JSON response content from players query.")
-        else:
-            for player in players_json:
-                logger.info(f"Processing player: Player: '{player}'.")
-                player_id = utl.json_value_or_default(player, Keys.player_id, default=None)
-                stats = execution_context.client.stats.player_career_stats(player_id)
-                first_name = utl.json_value_or_default(stats, Keys.first_name, Keys.default, default="")
-                last_name = utl.json_value_or_default(stats, Keys.last_name, Keys.default, default="")
-                players_db[player_id] = {
-                    Keys.current_team_id: utl.json_value_or_default(stats, Keys.current_team_id),
-                    Keys.first_name: first_name,
-                    Keys.last_name: last_name,
-                    Keys.height_in_cm: utl.json_value_or_default(stats, Keys.height_in_cm),
-                    Keys.weight_in_kg: utl.json_value_or_default(stats, Keys.weight_in_kg)
-                }
-                logger.info(f"Added player '{last_name}, {first_name}' to players table.")
+        fetcher = ConcurrentFetcher(execution_context.workers)
+        for player_id, stats, exception in fetcher.fetch(
+            execution_context.client.stats.player_career_stats,
+            stale_player_ids
+        ):
+            if exception is not None:
+                print("\033[31mException occured. Check logs.\033[0m")
+                logger.error(
+                    f"Exception processing player_career_stats query. Player: "
+                    f"'{player_id}', Exception: '{str(exception)}'."
+                )
+                continue
+            first_name = utl.json_value_or_default(stats, Keys.first_name, Keys.default, default="")
+            last_name = utl.json_value_or_default(stats, Keys.last_name, Keys.default, default="")
+            writer.write(DB.players_table_name, player_id, {
+                Keys.current_team_id: utl.json_value_or_default(stats, Keys.current_team_id),
+                Keys.first_name: first_name,
+                Keys.last_name: last_name,
+                Keys.height_in_cm: utl.json_value_or_default(stats, Keys.height_in_cm),
+                Keys.weight_in_kg: utl.json_value_or_default(stats, Keys.weight_in_kg),
+                Keys.last_update: datetime.now(timezone.utc).isoformat()
+            })
+            writer.checkpoint()
+            logger.info(f"Added player '{last_name}, {first_name}' to players table.")
 
-            meta_db[DB.players_table_name] = {
-                Keys.last_update: datetime.now(timezone.utc)
-            }
-        logger.info("Finished adding players to database.")
\ No newline at end of file
+        writer.write(DB.meta_table_name, DB.players_table_name, {
+            Keys.last_update: datetime.now(timezone.utc)
+        })
+        logger.info("Finished adding players to database.")
+
+    @staticmethod
+    def _is_player_fresh(
+        players_db: SqliteDict,
+        player_id: int
+    ) -> bool:
+        """Check if a player's stored record is recent enough to skip refreshing.
+
+        Args:
+            players_db (SqliteDict): The players table.
+            player_id (int): The player ID.
+
+        Returns:
+            bool: True if the record was refreshed within the configured
+            maximum age.
+        """
+        player = players_db.get(player_id)
+        if player is None or Keys.last_update not in player:
+            return False
+        last_update = datetime.fromisoformat(player[Keys.last_update])
+        max_age = timedelta(days=execution_context.player_max_age)
+        return datetime.now(timezone.utc) - last_update < max_age
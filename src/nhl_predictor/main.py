@@ -22,6 +22,63 @@ _algorithm = Annotated[Algorithms, typer.Option(
         case_sensitive=False,
     )]
 
+# Option definition for specifying the number of concurrent API requests.
+_workers = Annotated[int, typer.Option(
+    help="Maximum number of concurrent requests to make to the NHL API.",
+    min=1
+)]
+
+# Option definition for specifying the NHL API request timeout.
+_request_timeout = Annotated[int, typer.Option(
+    help="Timeout, in seconds, of each request to the NHL API.",
+    min=1
+)]
+
+# Option definition for specifying the number of retries of failed API requests.
+_max_retries = Annotated[int, typer.Option(
+    help="Number of times a failed request to the NHL API is retried.",
+    min=0
+)]
+
+# Option definition for specifying the API request rate limit.
+_rate_limit = Annotated[float, typer.Option(
+    help="Maximum sustained number of requests per second to the NHL API.",
+    min=0.1
+)]
+
+# Option definition for enabling the API response cache.
+_cache = Annotated[bool, typer.Option(
+    help="Cache NHL API responses on disk and reuse them while they are valid."
+)]
+
+# Option definition for specifying the API response cache size.
+_cache_size = Annotated[int, typer.Option(
+    help="Maximum size, in megabytes, of the NHL API response cache.",
+    min=1
+)]
+
+# Option definition for specifying the oldest season built by '--all-seasons'.
+_first_season = Annotated[str, typer.Option(
+    help=(
+        "Oldest season, e.g. '20222023', included by '--all-seasons'. Older "
+        "seasons are only built by 'backfill'."
+    )
+)]
+
+# Option definition for specifying the oldest season to backfill.
+_backfill_to = Annotated[Optional[str], typer.Option(
+    help=(
+        "Oldest season, e.g. '20052006', to backfill in the background once "
+        "the build is complete. Seasons are backfilled newest first."
+    )
+)]
+
+# Option definition for specifying the number of seasons built per backfill.
+_seasons_per_run = Annotated[int, typer.Option(
+    help="Maximum number of seasons built by each backfill run.",
+    min=1
+)]
+
 # Option definition for specifying the application directory.
 _app_dir = Annotated[Path, typer.Option(
     help=(
@@ -32,30 +89,88 @@ _app_dir = Annotated[Path, typer.Option(
 
 @app.command()
 def build(
-    season: Annotated[Optional[List[Seasons]], typer.Option(
+    season: Annotated[Optional[List[str]], typer.Option(
         help=(
-            "Specify the seasons to include. If '--all-seasons' is specified, "
-            "this option will be ignored."
+            "Specify the seasons to include, e.g. '20242025'. If "
+            "'--all-seasons' is specified, this option will be ignored."
         )
     )] = None,
     all_seasons: Annotated[bool, typer.Option(
         help=(
             "Indicates that all seasons should be included in the data set. "
-            "This option superscedes the '--season' option. See '--season' hints "
-            "for list of seasons included."
+            "This option superscedes the '--season' option. Seasons are read "
+            "from 'seasons.json' in the application directory if it exists, "
+            "otherwise from the NHL API, starting with '--first-season'."
         )
     )] = False,
+    first_season: _first_season = Seasons.items()[0].value,
+    backfill_to: _backfill_to = None,
+    seasons_per_run: _seasons_per_run = 1,
     update: Annotated[bool, typer.Option(
         help=(
             "Existing tables will be cleared and repopulated."
         )
     )] = False,
+    incremental: Annotated[bool, typer.Option(
+        help=(
+            "Only download games that are not already stored in the database. "
+            "Has no effect when '--update' is specified."
+        )
+    )] = False,
+    resume: Annotated[bool, typer.Option(
+        help=(
+            "Continue an interrupted build where it stopped, skipping the "
+            "seasons, team schedules and games it completed. Has no effect "
+            "when '--update' is specified."
+        )
+    )] = False,
+    archive: Annotated[bool, typer.Option(
+        help=(
+            "Keep a compressed copy of every downloaded box score so that the "
+            "data set can be rebuilt with 'rebuild-from-archive'."
+        )
+    )] = False,
+    players_from_box_scores: Annotated[bool, typer.Option(
+        help=(
+            "Only refresh players appearing in the box scores ingested by this "
+            "build instead of every active player."
+        )
+    )] = False,
+    player_max_age: Annotated[int, typer.Option(
+        help=(
+            "Number of days a stored player record is considered fresh and is "
+            "not downloaded again. 0 refreshes every player."
+        ),
+        min=0
+    )] = 7,
     report: Annotated[bool, typer.Option(
         help=(
             "Reports on the current status of the database.  No alteration of "
             "of data will occur."
         )
     )] = False,
+    workers: _workers = 8,
+    processes: Annotated[int, typer.Option(
+        help=(
+            "Number of processes downloading and parsing box scores. Box scores "
+            "are split into shards across the processes while a single process "
+            "writes to the database. '--workers' and '--rate-limit' are shared "
+            "between the processes."
+        ),
+        min=1
+    )] = 1,
+    request_timeout: _request_timeout = 10,
+    max_retries: _max_retries = 3,
+    rate_limit: _rate_limit = 20.0,
+    cache: _cache = True,
+    cache_size: _cache_size = 1024,
+    batch_size: Annotated[int, typer.Option(
+        help=(
+            "Number of rows to buffer before committing them to the database "
+            "in a single transaction."
+        ),
+        min=1
+    )] = 5000,
     app_dir: _app_dir = None
 ):
     """
@@ -63,6 +178,20 @@ def build(
     """
     context = ExecutionContext()
     context.allow_update = update
+    context.first_season = first_season
+    context.incremental = incremental and not update
+    context.resume = resume and not update
+    context.archive_box_scores = archive
+    context.players_from_box_scores = players_from_box_scores
+    context.player_max_age = player_max_age
+    context.workers = workers
+    context.processes = processes
+    context.request_timeout = request_timeout
+    context.max_retries = max_retries
+    context.rate_limit = rate_limit
+    context.use_cache = cache
+    context.cache_size = cache_size
+    context.batch_size = batch_size
     if app_dir:
         context.app_dir = app_dir
 
@@ -71,6 +200,65 @@ def build(
         Builder.report()
     else:
         Builder.build(season, all_seasons)
+        context.http_cache.report()
+        if backfill_to:
+            Builder.start_backfill(backfill_to, seasons_per_run)
+
+@app.command()
+def backfill(
+    oldest_season: Annotated[str, typer.Option(
+        help="Oldest season, e.g. '20052006', to backfill."
+    )],
+    seasons_per_run: _seasons_per_run = 1,
+    first_season: _first_season = Seasons.items()[0].value,
+    background: Annotated[bool, typer.Option(
+        help="Run the backfill in a detached background process."
+    )] = False,
+    workers: _workers = 8,
+    rate_limit: _rate_limit = 20.0,
+    app_dir: _app_dir = None
+):
+    """
+    Build seasons older than '--first-season', newest first, a few seasons at
+    a time. Meant to be run repeatedly, e.g. from a scheduled job, until the
+    history reaches '--oldest-season'.
+    """
+    context = ExecutionContext()
+    context.allow_update = False
+    context.first_season = first_season
+    context.workers = workers
+    context.rate_limit = rate_limit
+    if app_dir:
+        context.app_dir = app_dir
+
+    from nhl_predictor.builder.builder import Builder
+    if background:
+        Builder.start_backfill(oldest_season, seasons_per_run)
+    else:
+        Builder.backfill(oldest_season, seasons_per_run)
+
+@app.command("rebuild-from-archive")
+def rebuild_from_archive(
+    batch_size: Annotated[int, typer.Option(
+        help=(
+            "Number of rows to buffer before committing them to the database "
+            "in a single transaction."
+        ),
+        min=1
+    )] = 5000,
+    app_dir: _app_dir = None
+):
+    """
+    Rebuild the games and stats tables from archived box scores without
+    downloading anything.
+    """
+    context = ExecutionContext()
+    context.batch_size = batch_size
+    if app_dir:
+        context.app_dir = app_dir
+
+    from nhl_predictor.builder.builder import Builder
+    Builder.rebuild_from_archive()
 
 @app.command()
 def train(
@@ -84,6 +272,20 @@ def train(
             "Allow serialized model to be overwritten."
         )
     )] = False,
+    dataset_cache: Annotated[bool, typer.Option(
+        help=(
+            "Reuse the summarized data set from a previous run when neither "
+            "the data nor the summarizer changed since."
+        )
+    )] = True,
+    history_window: Annotated[int, typer.Option(
+        help=(
+            "Only use each player's most recent N games when summarizing their "
+            "history, for summarizers that summarize history when training. "
+            "Must match the window used when predicting. 0 uses the default."
+        ),
+        min=0
+    )] = 0,
     app_dir: _app_dir = None
 ):
     """
@@ -95,6 +297,8 @@ def train(
     context.output_file = output
     context.allow_update = update
     context.summarizer_type = summarizer_type
+    context.use_dataset_cache = dataset_cache
+    context.history_window = history_window
     
     from nhl_predictor.trainer.trainer import Trainer
     Trainer.train(algorithm)
@@ -132,6 +336,19 @@ def predict(
             "Specify a game to predict by its game ID."
         )
     )] = 0,
+    history_window: Annotated[int, typer.Option(
+        help=(
+            "Only use each player's most recent N games when summarizing their "
+            "history. 0 uses the whole history."
+        ),
+        min=0
+    )] = 0,
+    workers: _workers = 8,
+    request_timeout: _request_timeout = 10,
+    max_retries: _max_retries = 3,
+    rate_limit: _rate_limit = 20.0,
+    cache: _cache = True,
+    cache_size: _cache_size = 1024,
     app_dir: _app_dir = None
 ):
     """
@@ -142,6 +359,13 @@ def predict(
         context.app_dir = app_dir
     context.model = model
     context.summarizer_type = summarizer_type
+    context.history_window = history_window
+    context.workers = workers
+    context.request_timeout = request_timeout
+    context.max_retries = max_retries
+    context.rate_limit = rate_limit
+    context.use_cache = cache
+    context.cache_size = cache_size
     
     from nhl_predictor.predictor.predictor import Predictor
     if list:
@@ -150,6 +374,7 @@ def predict(
         Predictor.predict_single_game(algorithm, game_id)
     else:
         Predictor.predict_by_date(algorithm, date, date_range)
+    context.http_cache.report()
 
 if __name__ == "__main__":
     """Main app entry point.
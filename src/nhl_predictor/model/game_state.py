@@ -12,6 +12,7 @@ class GameState(str, Enum):
     Future = "FUT"
     Pregame = "PRE"
     Live = "LIVE"
+    Critical = "CRIT"
     Final = "FINAL"
     Official = "OFF"
 
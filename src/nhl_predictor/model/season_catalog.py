@@ -0,0 +1,74 @@
+import json
+import os
+from typing import List
+
+from nhl_predictor.model.seasons import Seasons
+from nhl_predictor.shared.constants.database import Database as DB
+from nhl_predictor.shared.constants.json import JSON as Keys
+from nhl_predictor.shared.execution_context import ExecutionContext
+from nhl_predictor.shared.logging_config import LoggingConfig
+
+logger = LoggingConfig.get_logger(__name__)
+execution_context = ExecutionContext()
+
+class SeasonCatalog:
+    """Static class resolving which seasons can be built.
+
+    Seasons are read from a 'seasons.json' file in the application directory
+    when one exists, holding a list of season IDs such as "20232024".
+    Otherwise they come from the NHL API standings manifest, and the Seasons
+    enumeration is used as a last resort when the API cannot be reached.
+    """
+
+    @staticmethod
+    def get_seasons() -> List[str]:
+        """Get every known season.
+
+        Returns:
+            List[str]: Season IDs, oldest first.
+        """
+        path = os.path.join(execution_context.app_dir, DB.seasons_file_name)
+        if os.path.exists(path):
+            with open(path) as file:
+                seasons = json.load(file)
+            logger.info(f"Read '{len(seasons)}' seasons from '{path}'.")
+            return sorted(str(season) for season in seasons)
+        try:
+            manifest = execution_context.client.standings.season_standing_manifest()
+            return sorted(str(season[Keys.id]) for season in manifest)
+        except Exception as e:
+            logger.warning(
+                f"Unable to get the season list from the NHL API, using the "
+                f"built-in seasons. Exception: '{str(e)}'."
+            )
+            return [season.value for season in Seasons.items()]
+
+    @staticmethod
+    def get_default_seasons() -> List[str]:
+        """Get the seasons built by '--all-seasons', i.e. every known season
+        starting with the configured first season.
+
+        Returns:
+            List[str]: Season IDs, oldest first.
+        """
+        return [
+            season for season in SeasonCatalog.get_seasons()
+            if season >= execution_context.first_season
+        ]
+
+    @staticmethod
+    def get_backfill_seasons(oldest_season: str) -> List[str]:
+        """Get the seasons between the oldest season to backfill and the
+        configured first season.
+
+        Args:
+            oldest_season (str): Oldest season to backfill.
+
+        Returns:
+            List[str]: Season IDs, newest first, so that the most relevant
+            history is backfilled first.
+        """
+        return [
+            season for season in reversed(SeasonCatalog.get_seasons())
+            if oldest_season <= season < execution_context.first_season
+        ]
@@ -4,12 +4,12 @@ from typing import List
 
 class Seasons(str, Enum):
     """
-    Seasons to use when fetching data from the API.  This is the data that we will
-    be training and testing our model with.
+    Built-in seasons, used when the season catalog cannot be retrieved from the
+    API. See SeasonCatalog for how the seasons to build are resolved.
 
-    Since I only care about predicting Kraken performance so I only go back to their
-    first year.  I might increase the scope in the future for better accuracy, but
-    for now I value the smaller dataset for performance reasons.
+    Since I only care about predicting Kraken performance, '--all-seasons' only
+    goes back to their first year by default. Older seasons can be added with
+    '--first-season' or backfilled in the background with 'backfill'.
     """
     _20222023 = "20222023"
     _20232024 = "20232024"
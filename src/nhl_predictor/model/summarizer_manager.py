@@ -3,6 +3,7 @@ from __future__ import annotations
 from enum import Enum
 
 import nhl_predictor.model.summarizers.average_player_summarizer as avsum
+import nhl_predictor.model.summarizers.rolling_player_summarizer as rollsum
 from nhl_predictor.model.summarizers.summarizer import Summarizer
 
 
@@ -11,6 +12,7 @@ class SummarizerTypes(str, Enum):
     """
     none = "none"
     average_player_summarizer = "average"
+    rolling_player_summarizer = "rolling"
 
     @staticmethod
     def get_summarizer(summarizer_type: SummarizerTypes) -> Summarizer:
@@ -28,5 +30,7 @@ class SummarizerTypes(str, Enum):
         match summarizer_type:
             case SummarizerTypes.average_player_summarizer:
                 return avsum.AveragePlayerSummarizer()
+            case SummarizerTypes.rolling_player_summarizer:
+                return rollsum.RollingPlayerSummarizer()
             case _:
                 raise Exception("Unsupported summarizer specified.")
\ No newline at end of file
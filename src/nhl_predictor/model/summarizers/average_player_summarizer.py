@@ -1,14 +1,17 @@
-from typing import Dict
+from typing import Dict, Tuple
 
 import pandas as pd
 from sqlitedict import SqliteDict
 
+from nhl_predictor.model.game_state import GameStatesForDataset
 from nhl_predictor.model.home_or_away import HomeOrAway
 from nhl_predictor.model.summarizers.summarizer import Summarizer
+from nhl_predictor.shared.concurrent_fetcher import ConcurrentFetcher
 from nhl_predictor.shared.constants.database import Database as DB
 from nhl_predictor.shared.constants.json import JSON as Keys
 from nhl_predictor.shared.execution_context import ExecutionContext
 from nhl_predictor.shared.logging_config import LoggingConfig
+from nhl_predictor.shared.relational_store import RelationalStore
 from nhl_predictor.shared.utility import Utility as utl
 
 logger = LoggingConfig.get_logger(__name__)
@@ -19,6 +22,49 @@ class AveragePlayerSummarizer(Summarizer):
     across a game roster.
     """
 
+    version = "2"
+
+    # Skater stats included in the summary, in column order.
+    _skater_stats = [
+        Keys.goals,
+        Keys.assists,
+        Keys.points,
+        Keys.plus_minus,
+        # PIM
+        Keys.hits,
+        Keys.power_play_goals,
+        Keys.sog,
+        # faceoffWinningPctg
+        # TOI
+        Keys.blocked_shots,
+        Keys.shifts,
+        Keys.giveaways,
+        Keys.takeaways,
+    ]
+
+    # Goalie stats included in the summary, in column order.
+    _goalie_stats = [
+        Keys.even_strength_shots_against,
+        Keys.power_play_shots_against,
+        Keys.shorthanded_shots_against,
+        Keys.save_shots_against,
+        #save_pctg
+        Keys.even_strength_goals_against,
+        Keys.power_play_goals_against,
+        Keys.shorthanded_goals_against,
+        Keys.pim,
+        Keys.goals_against,
+        #TOI
+        #starter
+        #decision
+        Keys.shots_against,
+        Keys.saves,
+        Keys.even_strength_saves_against,
+        Keys.power_play_saves_against,
+        Keys.shorthanded_saves_against,
+        Keys.save_saves_against,
+    ]
+
     def get_filename_prefix() -> str:
         """Returns a prefix for naming the model save file with.
 
@@ -39,147 +85,96 @@ class AveragePlayerSummarizer(Summarizer):
         Returns:
             pd.DataFrame: DataFrame with one row per game of summarized statistics.
         """
-        self._cleanup_data(data)
         return self._reduce_data(data)
-    
-    def summarize_historical(
+
+    def summarize_incremental(
         self,
-        games: Dict[str, object],
-        data: Dict[str, SqliteDict]
+        data: Dict[str, SqliteDict],
+        previous: pd.DataFrame
     ) -> pd.DataFrame:
-        """Summarize the historical player data for players participating in the
-        provided games.
-
-        Args:
-            games (Dict[str, object]): Set of games to process.
-            data (Dict[str, SqliteDict]): Collection of raw data.
-
-        Returns:
-            pd.DataFrame: Dataframe with one row per game of summarized statistics.
-        """
-        
-        self._cleanup_data(data)
-        data[DB.skater_stats_table_name] = data[DB.skater_stats_table_name].set_index(Keys.game_id)
-        data[DB.goalie_stats_table_name] = data[DB.goalie_stats_table_name].set_index(Keys.game_id)
-        
-        game_stats = None
-        
-        for game in games:
-            logger.info(f"Processing game. ID: '{utl.json_value_or_default(game, Keys.id)}'.")
-            box_score = execution_context.client.game_center.boxscore(
-                utl.json_value_or_default(game, Keys.id)
-            )
-            home_skater_ids = set(
-                [item[Keys.player_id] for item in box_score[Keys.player_by_game_stats][Keys.home_team][Keys.forwards]]
-                + [item[Keys.player_id] for item in box_score[Keys.player_by_game_stats][Keys.home_team][Keys.defense]]
-            )
-            away_skater_ids = set(
-                [item[Keys.player_id] for item in box_score[Keys.player_by_game_stats][Keys.away_team][Keys.forwards]]
-                + [item[Keys.player_id] for item in box_score[Keys.player_by_game_stats][Keys.away_team][Keys.defense]]
-            )
-            home_goalie_ids = set(
-                [item[Keys.player_id] for item in box_score[Keys.player_by_game_stats][Keys.home_team][Keys.goalies]]
-            )
-            away_goalie_ids = set(
-                [item[Keys.player_id] for item in box_score[Keys.player_by_game_stats][Keys.away_team][Keys.goalies]]
-            )
-            
-            new_row = self._flatten_game_players(
-                data,
-                home_skater_ids,
-                home_goalie_ids,
-                away_skater_ids,
-                away_goalie_ids
-            )#.astype(object)
-            new_row[Keys.game_id] = (utl.json_value_or_default(game, Keys.id))
-            
-            if game_stats is None:
-                game_stats = pd.DataFrame([new_row])
-            else:
-                game_stats.loc[len(game_stats)] = new_row
-        
-        return game_stats.astype({Keys.game_id: 'int64'})
+        """Creates the summarized data set, only summarizing the games missing
+        from the previous data set.
 
-    def _cleanup_data(
-        self,
-        data: Dict[str, SqliteDict]
-    ) -> None:
-        """Cleans up the data to prepare for processing.
+        A game's roster sums never change once the game is final, so rows of
+        the previous data set are kept for stored games that are final. Every
+        other stored game is summarized.
 
         Args:
             data (Dict[str, SqliteDict]): Collection of raw data.
-        """
-        skaters_db = data[DB.skater_stats_table_name]
-        goalies_db = data[DB.goalie_stats_table_name]
-
-        skaters_db = skaters_db.groupby([Keys.game_id, Keys.player_id]).first().reset_index()
-        goalies_db = goalies_db.groupby([Keys.game_id, Keys.player_id]).first().reset_index()
-        
-        skaters_db = self._fix_skater_column_dtypes(skaters_db)
-        self._split_compound_goalie_stats(goalies_db)
-        goalies_db = self._fix_goalie_column_dtypes(goalies_db)
-
-        data[DB.skater_stats_table_name] = skaters_db
-        data[DB.goalie_stats_table_name] = goalies_db
-
-    def _fix_skater_column_dtypes(
-        self,
-        skaters: pd.DataFrame
-    ) -> pd.DataFrame:
-        """Corrects the column dtypes for skater data.
-
-        Args:
-            skaters (pd.DataFrame): Raw skater data.
+            previous (pd.DataFrame): Previously summarized data set, indexed by
+            game ID.
 
         Returns:
-            pd.DataFrame: DataFrame with corrected column dtypes.
+            pd.DataFrame: DataFrame with one row per game of summarized statistics.
         """
-        return skaters.astype({
-            Keys.toi: "string",
-        })
+        games_db = data[DB.games_table_name]
+        game_ids = games_db.index.astype(int)
+        final = games_db[Keys.game_state].isin([state.value for state in GameStatesForDataset])
+        kept = previous[previous.index.isin(game_ids[final.to_numpy()])]
+        logger.info(f"Reusing '{len(kept)}' summarized games.")
+
+        new_data = dict(data)
+        new_data[DB.games_table_name] = games_db[~game_ids.isin(kept.index)]
+        for table_name in [DB.skater_stats_table_name, DB.goalie_stats_table_name]:
+            stats_db = data[table_name]
+            new_data[table_name] = stats_db[~stats_db[Keys.game_id].isin(kept.index)]
+        if new_data[DB.games_table_name].empty:
+            return kept
+
+        logger.info(f"Summarizing '{len(new_data[DB.games_table_name])}' new games.")
+        summarized = self.summarize(new_data)
+        frames = [frame for frame in [kept, summarized] if not frame.empty]
+        return pd.concat(frames).reindex(columns=previous.columns).sort_index()
     
-    def _fix_goalie_column_dtypes(
+    def summarize_historical(
         self,
-        goalies: pd.DataFrame
+        games: Dict[str, object],
+        data: Dict[str, pd.DataFrame] = None
     ) -> pd.DataFrame:
-        """Corrects the column dtypes for goalie data.
+        """Summarize the historical player data for players participating in the
+        provided games.
+
+        When no data is provided, each player's history is averaged inside the
+        relational store so that only the rows of rostered players are read.
 
         Args:
-            goalies (pd.DataFrame): Raw goalie data.
+            games (Dict[str, object]): Set of games to process.
+            data (Dict[str, pd.DataFrame], optional): Collection of raw data.
+            Defaults to None.
 
         Returns:
-            pd.DataFrame: DataFrame with corrected column dtypes.
+            pd.DataFrame: Dataframe with one row per game of summarized statistics.
         """
-        return goalies.astype({
-            Keys.even_strength_shots_against: int,
-            Keys.power_play_shots_against: int,
-            Keys.shorthanded_shots_against: int,
-            Keys.save_shots_against: int,
-            Keys.toi: "string",
-            Keys.decision: "string",
-            Keys.even_strength_saves_against: int,
-            Keys.power_play_saves_against: int,
-            Keys.shorthanded_saves_against: int,
-            Keys.save_saves_against: int
-        })
-    
-    def _split_compound_goalie_stats(
-        self,
-        goalies: pd.DataFrame
-    ) -> None:
-        """Splits columns with compound values into individual columns. Changes are made in place.
+        store = None
+        if data is None and RelationalStore.exists(execution_context.app_dir):
+            store = RelationalStore(execution_context.app_dir)
+        elif data is None:
+            logger.info("No relational store found, loading tables.")
+            data = utl.get_pandas_tables(
+                DB.skater_stats_table_name,
+                DB.goalie_stats_table_name,
+                path=execution_context.app_dir
+            )
+        skater_rosters, goalie_rosters = self._get_rosters(games)
+        game_stats = pd.merge(
+            self._flatten_rosters(DB.skater_stats_table_name, skater_rosters, data, store, Keys.skater_prefix),
+            self._flatten_rosters(DB.goalie_stats_table_name, goalie_rosters, data, store, Keys.goalie_prefix),
+            how='outer',
+            on=Keys.game_id
+        )
 
-        Args:
-            goalies (pd.DataFrame): Raw goalie data.
-        """
-        goalies[[Keys.even_strength_saves_against, Keys.even_strength_shots_against]] = \
-            goalies[Keys.even_strength_shots_against].str.split('/', expand=True)
-        goalies[[Keys.power_play_saves_against, Keys.power_play_shots_against]] = \
-            goalies[Keys.power_play_shots_against].str.split('/', expand=True)
-        goalies[[Keys.shorthanded_saves_against, Keys.shorthanded_shots_against]] = \
-            goalies[Keys.shorthanded_shots_against].str.split('/', expand=True)
-        goalies[[Keys.save_saves_against, Keys.save_shots_against]] = \
-            goalies[Keys.save_shots_against].str.split('/', expand=True)
+        if store is not None:
+            store.close()
+
+        # Keep the requested game order and give teams without any known
+        # players zeroed stats.
+        game_ids = pd.Index(
+            [int(utl.json_value_or_default(game, Keys.id)) for game in games],
+            name=Keys.game_id
+        )
+        game_stats = game_stats.reindex(game_ids).fillna(0)
+        game_stats[Keys.game_id] = game_stats.index
+        return game_stats.reset_index(drop=True)
 
     def _reduce_data(
         self,
@@ -224,45 +219,126 @@ class AveragePlayerSummarizer(Summarizer):
             on=Keys.game_id
         )
         
-    def _flatten_game_players(
+    def _get_rosters(
         self,
+        games: Dict[str, object]
+    ) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """Collect the rosters of the provided games. Box scores are fetched
+        concurrently.
+
+        Args:
+            games (Dict[str, object]): Set of games to process.
+
+        Returns:
+            Tuple[pd.DataFrame, pd.DataFrame]: Skater and goalie rosters, with
+            one row per game and player.
+        """
+        skater_rows = []
+        goalie_rows = []
+        game_ids = [int(utl.json_value_or_default(game, Keys.id)) for game in games]
+        fetcher = ConcurrentFetcher(execution_context.workers)
+        for game_id, box_score, exception in fetcher.fetch(
+            execution_context.client.game_center.boxscore,
+            game_ids
+        ):
+            if exception is not None:
+                raise exception
+            logger.info(f"Processing game. ID: '{game_id}'.")
+            for team_key, team_role in [
+                (Keys.home_team, HomeOrAway.HOME),
+                (Keys.away_team, HomeOrAway.AWAY)
+            ]:
+                team_id = utl.json_value_or_default(box_score, team_key, Keys.id)
+                team = box_score[Keys.player_by_game_stats][team_key]
+                skater_rows.extend(
+                    (game_id, item[Keys.player_id], team_id, team_role.value)
+                    for item in team[Keys.forwards] + team[Keys.defense]
+                )
+                goalie_rows.extend(
+                    (game_id, item[Keys.player_id], team_id, team_role.value)
+                    for item in team[Keys.goalies]
+                )
+
+        columns = [Keys.game_id, Keys.player_id, Keys.team_id, Keys.team_role]
+        return (
+            pd.DataFrame(skater_rows, columns=columns).drop_duplicates(),
+            pd.DataFrame(goalie_rows, columns=columns).drop_duplicates()
+        )
+
+    def _flatten_rosters(
+        self,
+        table_name: str,
+        rosters: pd.DataFrame,
         data: Dict[str, pd.DataFrame],
-        home_skater_ids: set[int],
-        home_goalie_ids: set[int],
-        away_skater_ids: set[int],
-        away_goalie_ids: set[int]
-    ) -> pd.Series:
-        """Flatten player stats for the provided players.
+        store: RelationalStore,
+        prefix: str
+    ) -> pd.DataFrame:
+        """Sum the historical averages of every rostered player into one stat
+        line per game.
+
+        Player averages are computed once for all games and joined onto the
+        rosters, so the cost does not grow with the number of games requested.
 
         Args:
-            data (Dict[str, pd.DataFrame]): Collection of raw data.
-            home_skater_ids (set[int]): Home skater player IDs.
-            home_goalie_ids (set[int]): Home goalie player IDs.
-            away_skater_ids (set[int]): Away skater player IDs.
-            away_goalie_ids (set[int]): Away goalie player IDs.
+            table_name (str): Stats table to summarize.
+            rosters (pd.DataFrame): Rosters of the games being summarized.
+            data (Dict[str, pd.DataFrame]): Collection of raw data. Only used
+            when no store is provided.
+            store (RelationalStore): Store to aggregate player stats in, or None.
+            prefix (str): Stat type column name prefix.
 
         Returns:
-            pd.Series: Series containing the summarized stats for this game.
+            pd.DataFrame: DataFrame with HOME and AWAY stats joined by game.
         """
-        skater_db = data[DB.skater_stats_table_name]
-        goalie_db = data[DB.goalie_stats_table_name]
-        
-        home_skater_df = self._group_and_flatten_skaters_by_player(skater_db[skater_db[Keys.player_id].isin(home_skater_ids)]).sum()
-        away_skater_df = self._group_and_flatten_skaters_by_player(skater_db[skater_db[Keys.player_id].isin(away_skater_ids)]).sum()
-        home_goalie_df = self._group_and_flatten_goalies_by_player(goalie_db[goalie_db[Keys.player_id].isin(home_goalie_ids)]).sum()
-        away_goalie_df = self._group_and_flatten_goalies_by_player(goalie_db[goalie_db[Keys.player_id].isin(away_goalie_ids)]).sum()
-        
-        home_skater_df = home_skater_df.add_suffix(Keys.home_suffix).add_prefix(Keys.skater_prefix)
-        away_skater_df = away_skater_df.add_suffix(Keys.away_suffix).add_prefix(Keys.skater_prefix)
-        home_goalie_df = home_goalie_df.add_suffix(Keys.home_suffix).add_prefix(Keys.goalie_prefix)
-        away_goalie_df = away_goalie_df.add_suffix(Keys.away_suffix).add_prefix(Keys.goalie_prefix)
-        
-        return pd.concat([
-            home_skater_df,
-            away_skater_df,
-            home_goalie_df,
-            away_goalie_df
-        ])
+        means = self._get_player_means(table_name, set(rosters[Keys.player_id]), data, store)
+        reduced = (
+            rosters.join(means, on=Keys.player_id)
+            .drop(columns=Keys.player_id)
+            .groupby([Keys.game_id, Keys.team_id, Keys.team_role], observed=True)
+            .sum()
+            .reset_index()
+        )
+        return self._flatten_home_and_away_by_game(reduced, prefix)
+
+    def _get_player_means(
+        self,
+        table_name: str,
+        player_ids: set[int],
+        data: Dict[str, pd.DataFrame],
+        store: RelationalStore
+    ) -> pd.DataFrame:
+        """Average each player's historical stats.
+
+        Honors the configured history window, if any. Without a window, career
+        averages are read from the store's per-player aggregates.
+
+        Args:
+            table_name (str): Stats table to summarize.
+            player_ids (set[int]): Player IDs to include.
+            data (Dict[str, pd.DataFrame]): Collection of raw data. Only used
+            when no store is provided.
+            store (RelationalStore): Store to aggregate player stats in, or None.
+
+        Returns:
+            pd.DataFrame: DataFrame with one row of averaged stats per player.
+        """
+        window = execution_context.history_window
+        if store is not None:
+            if table_name == DB.skater_stats_table_name:
+                stats = AveragePlayerSummarizer._skater_stats
+            else:
+                stats = AveragePlayerSummarizer._goalie_stats
+            if not window:
+                return store.get_aggregate_means(table_name, player_ids, stats)
+            return store.get_player_means(table_name, player_ids, stats, window)
+
+        stats_db = data[table_name]
+        stats_db = stats_db[stats_db[Keys.player_id].isin(player_ids)]
+        if window:
+            stats_db = stats_db.sort_values(Keys.game_id).groupby(Keys.player_id).tail(window)
+        if table_name == DB.skater_stats_table_name:
+            return self._group_and_flatten_skaters_by_player(stats_db)
+        return self._group_and_flatten_goalies_by_player(stats_db)
 
     def _add_wins_column(
         self,
@@ -316,7 +392,7 @@ class AveragePlayerSummarizer(Summarizer):
         Returns:
             pd.DataFrame: DataFrame with skater stats summarized by game.
         """
-        skaters_grouped = skaters_db.groupby([Keys.game_id, Keys.team_id, Keys.team_role])
+        skaters_grouped = skaters_db.groupby([Keys.game_id, Keys.team_id, Keys.team_role], observed=True)
         return self._flatten_skater_stats(skaters_grouped)
     
     def _flatten_skater_stats(
@@ -333,22 +409,9 @@ class AveragePlayerSummarizer(Summarizer):
         Returns:
             pd.DataFrame: Aggregated skater stats.
         """
-        return skaters_db.agg({
-            Keys.goals: method,
-            Keys.assists: method,
-            Keys.points: method,
-            Keys.plus_minus: method,
-            # PIM 
-            Keys.hits: method,
-            Keys.power_play_goals: method,
-            Keys.sog: method,
-            # faceoffWinningPctg
-            # TOI
-            Keys.blocked_shots: method,
-            Keys.shifts: method,
-            Keys.giveaways: method,
-            Keys.takeaways: method,
-        }).reset_index()
+        return skaters_db.agg(
+            {stat: method for stat in AveragePlayerSummarizer._skater_stats}
+        ).reset_index()
         
     def _group_and_flatten_goalies_by_player(
         self,
@@ -377,7 +440,7 @@ class AveragePlayerSummarizer(Summarizer):
         Returns:
             pd.DataFrame: DataFrame with goalie stats summarized by game.
         """
-        goalies_grouped = goalies_db.groupby([Keys.game_id, Keys.team_id, Keys.team_role])
+        goalies_grouped = goalies_db.groupby([Keys.game_id, Keys.team_id, Keys.team_role], observed=True)
         return self._flatten_goalie_stats(goalies_grouped)
     
     def _flatten_goalie_stats(
@@ -394,27 +457,9 @@ class AveragePlayerSummarizer(Summarizer):
         Returns:
             pd.DataFrame: Aggregated goalie stats.
         """
-        return goalies_db.agg({
-            Keys.even_strength_shots_against: method,
-            Keys.power_play_shots_against: method,
-            Keys.shorthanded_shots_against: method,
-            Keys.save_shots_against: method,
-            #Keys.save_pctg: goalies_grouped.apply(lambda x: (x[Keys.saves]/x[Keys.shots_against]))
-            Keys.even_strength_goals_against: method,
-            Keys.power_play_goals_against: method,
-            Keys.shorthanded_goals_against: method,
-            Keys.pim: method,
-            Keys.goals_against: method,
-            #TOI
-            #starter
-            #decision
-            Keys.shots_against: method,
-            Keys.saves: method,
-            Keys.even_strength_saves_against: method,
-            Keys.power_play_saves_against: method,
-            Keys.shorthanded_saves_against: method,
-            Keys.save_saves_against: method,
-        }).reset_index()
+        return goalies_db.agg(
+            {stat: method for stat in AveragePlayerSummarizer._goalie_stats}
+        ).reset_index()
         
     def _flatten_home_and_away_by_player(
         self,
@@ -0,0 +1,336 @@
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+from sqlitedict import SqliteDict
+
+from nhl_predictor.model.summarizers.average_player_summarizer import AveragePlayerSummarizer
+from nhl_predictor.shared.constants.database import Database as DB
+from nhl_predictor.shared.constants.json import JSON as Keys
+from nhl_predictor.shared.execution_context import ExecutionContext
+from nhl_predictor.shared.logging_config import LoggingConfig
+from nhl_predictor.shared.relational_store import RelationalStore
+from nhl_predictor.shared.utility import Utility as utl
+
+logger = LoggingConfig.get_logger(__name__)
+execution_context = ExecutionContext()
+
+class RollingPlayerSummarizer(AveragePlayerSummarizer):
+    """Summarizer that describes each rostered player by their form going into
+    a game, rather than by what they did in it.
+
+    A player's form is the exponentially weighted mean of their stats over
+    their previous games or, when a history window is configured, the plain
+    mean of their last N games. Players without any previous game count as
+    zeroes. Form is then summed across each roster, like the average player
+    summarizer does with the game's own stats, so both produce the same
+    columns.
+
+    The data set is built in a single chronological pass over the games.
+    Each player's form is kept in running accumulators that are read before,
+    and updated after, every game they play, so building the data set is
+    linear in the number of stats rows.
+    """
+
+    version = "1"
+
+    # Span, in games, of the exponentially weighted mean.
+    _ewma_span = 10
+
+    def __init__(self):
+        """Create a summarizer using the configured history window.
+        """
+        self._window = execution_context.history_window
+        # Cached data sets must not be shared between window settings.
+        self.version = f"{RollingPlayerSummarizer.version}-{self._window or 'ewma'}"
+        self._game_order = None
+
+    def get_filename_prefix() -> str:
+        """Returns a prefix for naming the model save file with.
+
+        Returns:
+            str: File name prefix.
+        """
+        return "RollingSummarizer"
+
+    def summarize(
+        self,
+        data: Dict[str, SqliteDict]
+    ) -> pd.DataFrame:
+        """Creates a single DataFrame containing the summarized data set.
+
+        Args:
+            data (Dict[str, SqliteDict]): Collection of raw data.
+
+        Returns:
+            pd.DataFrame: DataFrame with one row per game of the summed form
+            of each roster going into the game.
+        """
+        order = self._get_game_order(data[DB.games_table_name])
+        form_data = dict(data)
+        for table_name in [DB.skater_stats_table_name, DB.goalie_stats_table_name]:
+            stats_db = data[table_name]
+            rows, features, _ = self._roll(stats_db, self._get_stats(table_name), order)
+            form_data[table_name] = rows.assign(**dict(zip(self._get_stats(table_name), features.T)))
+        return self._reduce_data(form_data)
+
+    def summarize_incremental(
+        self,
+        data: Dict[str, SqliteDict],
+        previous: pd.DataFrame
+    ) -> pd.DataFrame:
+        """Creates the summarized data set.
+
+        A game's row depends on every earlier game of its players, so a late
+        arriving game changes the rows of the games after it. The single pass
+        is linear, so everything is summarized again.
+
+        Args:
+            data (Dict[str, SqliteDict]): Collection of raw data.
+            previous (pd.DataFrame): Previously summarized data set. Unused.
+
+        Returns:
+            pd.DataFrame: DataFrame with one row per game of summarized statistics.
+        """
+        return self.summarize(data)
+
+    def _get_player_means(
+        self,
+        table_name: str,
+        player_ids: set[int],
+        data: Dict[str, pd.DataFrame],
+        store: RelationalStore
+    ) -> pd.DataFrame:
+        """Get each player's current form, i.e. their form after every stored
+        game.
+
+        Args:
+            table_name (str): Stats table to summarize.
+            player_ids (set[int]): Player IDs to include.
+            data (Dict[str, pd.DataFrame]): Collection of raw data. Only used
+            when no store is provided.
+            store (RelationalStore): Store to read player stats from, or None.
+
+        Returns:
+            pd.DataFrame: DataFrame with one row of form per player.
+        """
+        stats = self._get_stats(table_name)
+        if store is not None:
+            stats_db = store.get_stats_for_players(table_name, player_ids)
+            if self._game_order is None:
+                self._game_order = self._get_game_order(store.query(
+                    f'SELECT "{Keys.game_id}", "{Keys.game_date}" '
+                    f'FROM "{DB.games_table_name}"'
+                ).set_index(Keys.game_id))
+        else:
+            stats_db = data[table_name]
+            stats_db = stats_db[stats_db[Keys.player_id].isin(player_ids)]
+            if self._game_order is None:
+                games_db = data.get(DB.games_table_name)
+                if games_db is None:
+                    games_db = utl.get_pandas_tables(
+                        DB.games_table_name,
+                        path=execution_context.app_dir
+                    )[DB.games_table_name]
+                self._game_order = self._get_game_order(games_db)
+
+        _, _, form = self._roll(stats_db, stats, self._game_order)
+        return form
+
+    def _get_stats(self, table_name: str) -> List[str]:
+        """Get the stats summarized for a table.
+
+        Args:
+            table_name (str): Stats table name.
+
+        Returns:
+            List[str]: Stat column names.
+        """
+        if table_name == DB.skater_stats_table_name:
+            return AveragePlayerSummarizer._skater_stats
+        return AveragePlayerSummarizer._goalie_stats
+
+    def _get_game_order(self, games_db: pd.DataFrame) -> pd.Series:
+        """Rank games chronologically.
+
+        Games are ordered by date, then by ID. If any game has no date, e.g.
+        rows stored before dates were recorded, games are ordered by ID alone,
+        which follows the schedule order within a season.
+
+        Args:
+            games_db (pd.DataFrame): Games table, indexed by game ID.
+
+        Returns:
+            pd.Series: Chronological rank of each game, indexed by game ID.
+        """
+        game_ids = games_db.index.astype(int).to_numpy()
+        if Keys.game_date in games_db.columns and games_db[Keys.game_date].notna().all():
+            positions = np.lexsort((game_ids, games_db[Keys.game_date].astype(str).to_numpy()))
+        else:
+            positions = np.argsort(game_ids, kind="stable")
+        ranks = np.empty(len(game_ids), dtype=np.int64)
+        ranks[positions] = np.arange(len(game_ids))
+        return pd.Series(ranks, index=game_ids)
+
+    def _roll(
+        self,
+        stats_db: pd.DataFrame,
+        stats: List[str],
+        order: pd.Series
+    ) -> Tuple[pd.DataFrame, np.ndarray, pd.DataFrame]:
+        """Walk the stats rows in chronological order, recording each player's
+        form going into every game.
+
+        Args:
+            stats_db (pd.DataFrame): Stats rows, one per game and player.
+            stats (List[str]): Stat columns to track.
+            order (pd.Series): Chronological rank of each game, indexed by game ID.
+
+        Returns:
+            Tuple[pd.DataFrame, np.ndarray, pd.DataFrame]: The stats rows in
+            chronological order, without the stat columns; the form of the
+            player of each of those rows going into its game; and the form of
+            every player after their last game, indexed by player ID.
+        """
+        ranks = stats_db[Keys.game_id].astype(int).map(order)
+        unknown = ranks.isna()
+        if unknown.any():
+            logger.warning(f"Ignoring '{unknown.sum()}' stats rows of unknown games.")
+        rows = stats_db[~unknown.to_numpy()]
+        positions = np.argsort(ranks[~unknown].to_numpy(), kind="stable")
+        rows = rows.iloc[positions]
+        ranks = ranks[~unknown].to_numpy()[positions]
+
+        codes, player_ids = pd.factorize(rows[Keys.player_id])
+        values = rows[stats].astype(float).fillna(0).to_numpy()
+        features = np.zeros_like(values)
+        if self._window:
+            accumulator = _WindowAccumulator(len(player_ids), len(stats), self._window)
+        else:
+            accumulator = _EwmaAccumulator(len(player_ids), len(stats), RollingPlayerSummarizer._ewma_span)
+
+        # Rows of one game are contiguous, so each slice between rank changes
+        # is read, then folded into the accumulators.
+        boundaries = np.flatnonzero(np.diff(ranks)) + 1
+        starts = np.concatenate(([0], boundaries))
+        ends = np.concatenate((boundaries, [len(ranks)]))
+        for start, end in zip(starts, ends):
+            players = codes[start:end]
+            features[start:end] = accumulator.get(players)
+            accumulator.update(players, values[start:end])
+
+        form = pd.DataFrame(
+            accumulator.get(np.arange(len(player_ids))),
+            index=pd.Index(player_ids, name=Keys.player_id),
+            columns=stats
+        )
+        return rows.drop(columns=stats), features, form
+
+
+class _EwmaAccumulator:
+    """Exponentially weighted mean of each player's stats.
+    """
+
+    def __init__(
+        self,
+        players: int,
+        stats: int,
+        span: int
+    ):
+        """Create accumulators for a number of players.
+
+        Args:
+            players (int): Number of players.
+            stats (int): Number of stats per player.
+            span (int): Span, in games, of the weighted mean.
+        """
+        self._alpha = 2 / (span + 1)
+        self._means = np.zeros((players, stats))
+        self._seen = np.zeros(players, dtype=bool)
+
+    def get(self, players: np.ndarray) -> np.ndarray:
+        """Get the current mean of some players.
+
+        Args:
+            players (np.ndarray): Player positions.
+
+        Returns:
+            np.ndarray: One row of stats per player, zeroes for players
+            without any game.
+        """
+        return self._means[players]
+
+    def update(
+        self,
+        players: np.ndarray,
+        values: np.ndarray
+    ) -> None:
+        """Fold one game into the mean of some players.
+
+        Args:
+            players (np.ndarray): Player positions, each appearing once.
+            values (np.ndarray): One row of stats per player.
+        """
+        means = self._means[players]
+        first = ~self._seen[players]
+        self._means[players] = np.where(
+            first[:, None],
+            values,
+            means + self._alpha * (values - means)
+        )
+        self._seen[players] = True
+
+
+class _WindowAccumulator:
+    """Mean of each player's stats over their last N games, kept in a ring
+    buffer with running sums.
+    """
+
+    def __init__(
+        self,
+        players: int,
+        stats: int,
+        window: int
+    ):
+        """Create accumulators for a number of players.
+
+        Args:
+            players (int): Number of players.
+            stats (int): Number of stats per player.
+            window (int): Number of games to average.
+        """
+        self._window = window
+        self._buffer = np.zeros((players, window, stats))
+        self._sums = np.zeros((players, stats))
+        self._counts = np.zeros(players, dtype=np.int64)
+        self._positions = np.zeros(players, dtype=np.int64)
+
+    def get(self, players: np.ndarray) -> np.ndarray:
+        """Get the current mean of some players.
+
+        Args:
+            players (np.ndarray): Player positions.
+
+        Returns:
+            np.ndarray: One row of stats per player, zeroes for players
+            without any game.
+        """
+        return self._sums[players] / np.maximum(self._counts[players], 1)[:, None]
+
+    def update(
+        self,
+        players: np.ndarray,
+        values: np.ndarray
+    ) -> None:
+        """Fold one game into the mean of some players, dropping their oldest
+        game once the window is full.
+
+        Args:
+            players (np.ndarray): Player positions, each appearing once.
+            values (np.ndarray): One row of stats per player.
+        """
+        positions = self._positions[players]
+        self._sums[players] += values - self._buffer[players, positions]
+        self._buffer[players, positions] = values
+        self._positions[players] = (positions + 1) % self._window
+        self._counts[players] = np.minimum(self._counts[players] + 1, self._window)
@@ -11,6 +11,10 @@ class Summarizer(ABC):
     
     Subclasses must implement the 'get_filename_prefix' and 'summarize' metods.
     """
+
+    # Version of the summarized output. Cached data sets are keyed by it, so
+    # it must be changed whenever a change alters what 'summarize' returns.
+    version = "1"
     
     @abstractmethod
     def get_filename_prefix() -> str:
@@ -39,4 +43,28 @@ class Summarizer(ABC):
             pd.DataFrame: Pandas DataFrame with the final data set for machine
             learning.
         """
-        pass
\ No newline at end of file
+        pass
+
+    def summarize_incremental(
+        self,
+        data: Dict[str, SqliteDict],
+        previous: pd.DataFrame
+    ) -> pd.DataFrame:
+        """Summarizes stats into the final data set, reusing the rows of a data
+        set previously returned by 'summarize' where possible.
+
+        The default implementation summarizes everything again. Subclasses
+        whose rows only depend on their own game should override it to only
+        summarize new games.
+
+        Args:
+            data (Dict[str, SqliteDict]): Dictionary containing the tables of
+            raw data. Keys are table names as strings, each table is a SqliteDict.
+            previous (pd.DataFrame): Data set previously returned by 'summarize'
+            for the same summarizer version, indexed by game ID.
+
+        Returns:
+            pd.DataFrame: Pandas DataFrame with the final data set for machine
+            learning.
+        """
+        return self.summarize(data)
\ No newline at end of file
@@ -37,4 +37,47 @@ TeamMap = {
     "SEA": 55,              # Kraken
     "UTA": 40,              # Mammoth
     "ARI": 40,              # Arizona -- Back compat for Mammoth
-}
\ No newline at end of file
+    "PHX": 40,              # Phoenix -- Back compat for older seasons
+    "ATL": 35,              # Atlanta -- Back compat for Jets, older seasons
+}
+
+# Seasons each abbreviation in TeamMap played under, as (first, last) season
+# IDs. None means the team is still active. Schedule requests fail for a
+# team in a season it did not play, so only these seasons are requested.
+TeamSeasons = {
+    "MTL": (19171918, None),
+    "TOR": (19171918, None),
+    "BOS": (19241925, None),
+    "NYR": (19261927, None),
+    "CHI": (19261927, None),
+    "DET": (19261927, None),
+    "LAK": (19671968, None),
+    "DAL": (19931994, None),
+    "PHI": (19671968, None),
+    "PIT": (19671968, None),
+    "STL": (19671968, None),
+    "BUF": (19701971, None),
+    "VAN": (19701971, None),
+    "CGY": (19801981, None),
+    "NYI": (19721973, None),
+    "NJD": (19821983, None),
+    "WSH": (19741975, None),
+    "EDM": (19791980, None),
+    "CAR": (19971998, None),
+    "COL": (19951996, None),
+    "SJS": (19911992, None),
+    "OTT": (19921993, None),
+    "TBL": (19921993, None),
+    "ANA": (19931994, None),
+    "FLA": (19931994, None),
+    "NSH": (19981999, None),
+    "WPG": (20112012, None),
+    "CBJ": (20002001, None),
+    "MIN": (20002001, None),
+    "VGK": (20172018, None),
+    "SEA": (20212022, None),
+    "UTA": (20242025, None),
+    "ARI": (20142015, 20232024),
+    "PHX": (19961997, 20132014),
+    "ATL": (19992000, 20102011),
+}
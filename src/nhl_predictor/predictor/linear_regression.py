@@ -7,7 +7,6 @@ import pandas as pd
 
 from nhl_predictor.model.home_or_away import HomeOrAway
 from nhl_predictor.model.summarizer_manager import SummarizerTypes
-from nhl_predictor.shared.constants.database import Database as DB
 from nhl_predictor.shared.constants.json import JSON as Keys
 from nhl_predictor.shared.execution_context import ExecutionContext
 from nhl_predictor.shared.logging_config import LoggingConfig
@@ -31,13 +30,6 @@ class PredictLinearRegression:
             games (List[int]): List of game IDs for the games to be predicted.
         """
         game_stats = pd.DataFrame()
-        data = utl.get_pandas_tables(
-            DB.players_table_name,
-            DB.skater_stats_table_name,
-            DB.goalie_stats_table_name,
-            DB.games_table_name,
-            path=execution_context.app_dir,
-        )
         results_table = [["Away", "Home", "Predicted", "Raw"]]
         PredictLinearRegression._ensure_summarizer()
         PredictLinearRegression._ensure_model()
@@ -47,7 +39,7 @@ class PredictLinearRegression:
             print("No games on the schedule for the chosed date(s).")
             return
         games = sorted(games, key=lambda item: item[Keys.id])
-        game_stats = _summarizer.summarize_historical(games, data)
+        game_stats = _summarizer.summarize_historical(games)
         if game_stats.empty:
             logger.warning("None of the specified games have released rosters yet.")
             print("None of the specified games have released rosters yet.")
@@ -1,11 +1,16 @@
+import os
 from datetime import datetime, timedelta
-from typing import List
+from typing import Dict, List
 
 import dateutil.parser as parser
 from daterangeparser import parse as drp
+from sqlitedict import SqliteDict
 
 from nhl_predictor.model.algorithms import Algorithms
 from nhl_predictor.predictor.linear_regression import PredictLinearRegression
+from nhl_predictor.shared.concurrent_fetcher import ConcurrentFetcher
+from nhl_predictor.shared.relational_store import RelationalStore
+from nhl_predictor.shared.constants.database import Database as DB
 from nhl_predictor.shared.constants.json import JSON as Keys
 from nhl_predictor.shared.execution_context import ExecutionContext
 from nhl_predictor.shared.logging_config import LoggingConfig
@@ -121,7 +126,7 @@ class Predictor:
         date_range_start, date_range_end = Predictor._parse_date_range(date_range)
         if date is not None:
             date = parser.parse(date)
-            return Predictor._get_games_for_date(date)
+            return Predictor._get_games_for_date_range(date, date)
         elif date_range_start is not None and date_range_end is not None:
             return Predictor._get_games_for_date_range(date_range_start, date_range_end)
         else:
@@ -135,6 +140,10 @@ class Predictor:
     ) -> List[object]:
         """Get the set of games scheduled during a given date range.
 
+        Dates the build recorded as fully ingested are served from the local
+        games table. The remaining dates are coalesced into as few weekly schedule requests as
+        possible, which are fetched concurrently.
+
         Args:
             date_range_start (datetime): Start of the date range filter.
             date_range_end (datetime): End of the date range filter.
@@ -142,27 +151,137 @@ class Predictor:
         Returns:
             List[object]: List of game JSON.
         """
-        games = []
         number_of_days = (date_range_end - date_range_start).days + 1
         date_list = [date_range_end - timedelta(days=x) for x in range(number_of_days)]
+        games_by_date = Predictor._get_stored_games([str(date)[:10] for date in date_list])
+        games_by_date.update(Predictor._get_scheduled_games(
+            [date for date in date_list if str(date)[:10] not in games_by_date]
+        ))
+
+        games = []
         for date in date_list:
-            next_games = Predictor._get_games_for_date(date)
-            games.extend(next_games)
+            games.extend(games_by_date[str(date)[:10]])
         return games
 
     @staticmethod
-    def _get_games_for_date(date: datetime) -> List[object]:
-        """Get the set of games scheduled on the given date.
+    def _get_stored_games(dates: List[str]) -> Dict[str, List[object]]:
+        """Get the games of every date that the build recorded as fully
+        ingested, i.e. whose scheduled games are all in the local games table.
+
+        A date is only served if every game recorded for it is found, so that
+        no game is silently dropped if the stores are out of sync.
 
         Args:
-            date (datetime): Date filter for games.
+            dates (List[str]): Dates in YYYY-MM-DD format.
 
         Returns:
-            List[object]: List of game JSON.
+            Dict[str, List[object]]: Game JSON, in the shape returned by the
+            schedule API, keyed by served date.
         """
-        schedule = execution_context.client.schedule.daily_schedule(str(date)[:10])
-        return schedule["games"]
-    
+        ingested = Predictor._get_ingested_dates(dates)
+        if not ingested or not RelationalStore.exists(execution_context.app_dir):
+            return {}
+        store = RelationalStore(execution_context.app_dir)
+        try:
+            games = store.get_games_between(min(ingested), max(ingested))
+        finally:
+            store.close()
+
+        games_by_date = {date: [] for date in ingested}
+        for game in games.to_dict("records"):
+            if game[Keys.game_date] in games_by_date:
+                games_by_date[game[Keys.game_date]].append(Predictor._to_schedule_game(game))
+        games_by_date = {
+            date: games for date, games in games_by_date.items()
+            if sorted(game[Keys.id] for game in games) == ingested[date]
+        }
+        logger.info(f"Serving games for '{len(games_by_date)}' dates from the local games table.")
+        return games_by_date
+
+    @staticmethod
+    def _get_ingested_dates(dates: List[str]) -> Dict[str, List[int]]:
+        """Get the dates the build recorded as fully ingested.
+
+        Args:
+            dates (List[str]): Dates in YYYY-MM-DD format.
+
+        Returns:
+            Dict[str, List[int]]: Sorted IDs of the games of each ingested date.
+        """
+        db_path = utl.get_db_path(execution_context.app_dir)
+        if (not os.path.exists(db_path)
+            or DB.ingested_dates_table_name not in SqliteDict.get_tablenames(db_path)):
+            return {}
+        ingested_dates_db = utl.get_sqlitedict_tables(
+            DB.ingested_dates_table_name,
+            path=execution_context.app_dir,
+            read_only=True
+        )[DB.ingested_dates_table_name]
+        try:
+            return {
+                date: ingested_dates_db[date][Keys.games]
+                for date in dates if date in ingested_dates_db
+            }
+        finally:
+            ingested_dates_db.close()
+
+    @staticmethod
+    def _get_scheduled_games(dates: List[datetime]) -> Dict[str, List[object]]:
+        """Get the games of the provided dates from the weekly schedule API.
+
+        Each request returns a week of games, so dates are grouped into weeks
+        and only one request is made per week.
+
+        Args:
+            dates (List[datetime]): Dates to get the games of.
+
+        Returns:
+            Dict[str, List[object]]: Game JSON keyed by date in YYYY-MM-DD format.
+        """
+        week_starts = []
+        for date in sorted(dates):
+            if not week_starts or (date - week_starts[-1]).days >= 7:
+                week_starts.append(date)
+
+        games_by_date = {str(date)[:10]: [] for date in dates}
+        fetcher = ConcurrentFetcher(execution_context.workers)
+        for _, schedule, exception in fetcher.fetch(
+            lambda date: execution_context.client.schedule.weekly_schedule(str(date)[:10]),
+            week_starts
+        ):
+            if exception is not None:
+                raise exception
+            for day in utl.json_value_or_default(schedule, Keys.game_week, default=[]):
+                if day[Keys.date] in games_by_date:
+                    games_by_date[day[Keys.date]] = day[Keys.games]
+        return games_by_date
+
+    @staticmethod
+    def _to_schedule_game(game: Dict[str, object]) -> Dict[str, object]:
+        """Convert a stored game row to the shape returned by the schedule API.
+
+        Args:
+            game (Dict[str, object]): Game row from the games table.
+
+        Returns:
+            Dict[str, object]: Game JSON.
+        """
+        return {
+            Keys.id: game[Keys.game_id],
+            Keys.season: game[Keys.season],
+            Keys.game_type: game[Keys.game_type],
+            Keys.game_state: game[Keys.game_state],
+            Keys.game_date: game[Keys.game_date],
+            Keys.home_team: {
+                Keys.id: game[Keys.home_team],
+                Keys.common_name: {Keys.default: game[Keys.home_team_name]}
+            },
+            Keys.away_team: {
+                Keys.id: game[Keys.away_team],
+                Keys.common_name: {Keys.default: game[Keys.away_team_name]}
+            }
+        }
+
     @staticmethod
     def _get_game_by_id(id: int) -> List[object]:
         """Get game by game ID
@@ -0,0 +1,108 @@
+import json
+import os
+import sqlite3
+import zlib
+from pathlib import Path
+from typing import Dict, Iterator, Tuple
+
+from nhl_predictor.shared.constants.database import Database as DB
+from nhl_predictor.shared.logging_config import LoggingConfig
+
+logger = LoggingConfig.get_logger(__name__)
+
+class BoxScoreArchive:
+    """Compressed archive of raw box score JSON.
+
+    Each game is stored as one row holding its game row, as written to the
+    games table, and its zlib compressed box score. The archive allows the
+    stats tables to be rebuilt locally, e.g. after extracting a new stat,
+    without downloading any box score again.
+    """
+
+    def __init__(self, path: Path):
+        """Open (and create if needed) the archive.
+
+        Args:
+            path (Path): Application directory holding the database files.
+        """
+        self._path = os.path.join(path, DB.archive_db_file_name)
+        # Box scores may be streamed from a pipeline thread while the archive
+        # is opened on the main thread.
+        self._conn = sqlite3.connect(self._path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS "box_scores" ('
+                '"gameId" INTEGER NOT NULL PRIMARY KEY, '
+                '"game" TEXT NOT NULL, '
+                '"boxScore" BLOB NOT NULL)'
+            )
+
+    @staticmethod
+    def exists(path: Path) -> bool:
+        """Check if an archive has been created in a directory.
+
+        Args:
+            path (Path): Application directory holding the database files.
+
+        Returns:
+            bool: True if the archive exists.
+        """
+        return os.path.exists(os.path.join(path, DB.archive_db_file_name))
+
+    def close(self) -> None:
+        """Close the underlying connection.
+        """
+        self._conn.close()
+
+    def count(self) -> int:
+        """Count the archived box scores.
+
+        Returns:
+            int: Number of archived games.
+        """
+        return self._conn.execute('SELECT COUNT(*) FROM "box_scores"').fetchone()[0]
+
+    def write(
+        self,
+        box_scores: Dict[int, Tuple[Dict[str, object], Dict[str, object]]]
+    ) -> None:
+        """Archive box scores in a single transaction, replacing existing copies.
+
+        Args:
+            box_scores (Dict[int, Tuple[Dict[str, object], Dict[str, object]]]):
+            Game row and raw box score JSON, keyed by game ID.
+        """
+        with self._conn:
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO "box_scores" VALUES (?, ?, ?)',
+                [
+                    (
+                        int(game_id),
+                        json.dumps(game, default=str),
+                        zlib.compress(json.dumps(box_score, separators=(",", ":")).encode())
+                    )
+                    for game_id, (game, box_score) in box_scores.items()
+                ]
+            )
+
+    def read_games(self) -> Dict[int, Dict[str, object]]:
+        """Read the game rows of every archived game.
+
+        Returns:
+            Dict[int, Dict[str, object]]: Game rows keyed by game ID.
+        """
+        cursor = self._conn.execute('SELECT "gameId", "game" FROM "box_scores"')
+        return {game_id: json.loads(game) for game_id, game in cursor}
+
+    def read_box_scores(self) -> Iterator[Tuple[int, Dict[str, object]]]:
+        """Stream every archived box score, in game ID order.
+
+        Yields:
+            Iterator[Tuple[int, Dict[str, object]]]: Tuples of (game ID, raw box
+            score JSON).
+        """
+        cursor = self._conn.execute(
+            'SELECT "gameId", "boxScore" FROM "box_scores" ORDER BY "gameId"'
+        )
+        for game_id, box_score in cursor:
+            yield game_id, json.loads(zlib.decompress(box_score))
@@ -0,0 +1,243 @@
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+import numpy as np
+import pandas as pd
+from sqlitedict import SqliteDict
+
+from nhl_predictor.shared.constants.database import Database as DB
+from nhl_predictor.shared.constants.json import JSON as Keys
+from nhl_predictor.shared.logging_config import LoggingConfig
+
+logger = LoggingConfig.get_logger(__name__)
+
+class ColumnarStore:
+    """Typed, column oriented copy of the SqliteDict tables.
+
+    Each table is stored as a directory holding one NumPy file per column and
+    a manifest describing the columns. Loading a table memory-maps the column
+    files directly instead of unpickling every row, which keeps train and
+    predict startup fast.
+
+    A table copy is tagged with a version built from the meta table so that
+    stale copies are never read. String columns holding missing values also
+    store a mask of those values, so that they read back as None rather than
+    as the string 'None'.
+    """
+
+    _manifest_file_name = "manifest.json"
+
+    # Version of the file layout. Copies written with another layout are
+    # ignored and rewritten.
+    _format_version = 2
+    _index_file_name = "__index__.npy"
+
+    def __init__(self, path: Path):
+        """Create a store rooted in the application directory.
+
+        Args:
+            path (Path): Application directory holding the database file.
+        """
+        self._root = os.path.join(path, DB.columnar_dir_name)
+
+    @staticmethod
+    def get_version(
+        meta_db: SqliteDict,
+        name: str
+    ) -> Optional[str]:
+        """Get the current version of a table from the meta table.
+
+        Args:
+            meta_db (SqliteDict): The meta table.
+            name (str): Table name.
+
+        Returns:
+            Optional[str]: The table version, or None if the table has never
+            been updated.
+        """
+        if name not in meta_db:
+            return None
+        return str(meta_db[name][Keys.last_update])
+
+    def export_tables(
+        self,
+        meta_db: SqliteDict,
+        read_table: Callable[[str], pd.DataFrame],
+        *names: str
+    ) -> None:
+        """Write columnar copies of the provided tables. Tables are read from
+        an already typed source, e.g. RelationalStore.read_table, rather than
+        by unpickling every SqliteDict row.
+
+        Args:
+            meta_db (SqliteDict): The meta table.
+            read_table (Callable[[str], pd.DataFrame]): Reads a whole table by
+            name, keyed like its SqliteDict counterpart.
+            names (str): Names of the tables to export.
+        """
+        for name in names:
+            version = ColumnarStore.get_version(meta_db, name)
+            if version is None:
+                logger.info(f"Skipping columnar export of table '{name}' which has never been updated.")
+                continue
+            if self.get_stored_version(name) == version:
+                logger.info(f"Columnar copy of table '{name}' is already current.")
+                continue
+            self.write_table(name, read_table(name), version)
+
+    def write_table(
+        self,
+        name: str,
+        df: pd.DataFrame,
+        version: str
+    ) -> None:
+        """Write a DataFrame as a columnar table, replacing any existing copy.
+
+        Args:
+            name (str): Table name.
+            df (pd.DataFrame): Table contents.
+            version (str): Version tag for this copy of the table.
+        """
+        logger.info(f"Writing columnar copy of table '{name}'. Rows: '{len(df)}'.")
+        table_dir = os.path.join(self._root, name)
+        # Staging is unique per process so that concurrent exports never
+        # remove each other's files.
+        staging_dir = f"{table_dir}.{os.getpid()}.tmp"
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        Path(staging_dir).mkdir(parents=True)
+
+        columns = []
+        for position, column in enumerate(df.columns):
+            file_name = f"{position}.npy"
+            values = ColumnarStore._to_array(df[column])
+            np.save(os.path.join(staging_dir, file_name), values, allow_pickle=False)
+            entry = {"name": column, "file": file_name}
+            missing = df[column].isna().to_numpy()
+            if values.dtype.kind == "U" and missing.any():
+                entry["mask"] = f"{position}.mask.npy"
+                np.save(os.path.join(staging_dir, entry["mask"]), missing, allow_pickle=False)
+            columns.append(entry)
+        np.save(
+            os.path.join(staging_dir, ColumnarStore._index_file_name),
+            ColumnarStore._to_array(df.index.to_series()),
+            allow_pickle=False
+        )
+        with open(os.path.join(staging_dir, ColumnarStore._manifest_file_name), "w") as file:
+            json.dump({
+                "format": ColumnarStore._format_version,
+                "version": version,
+                "rows": len(df),
+                "columns": columns
+            }, file)
+
+        shutil.rmtree(table_dir, ignore_errors=True)
+        os.replace(staging_dir, table_dir)
+
+    def get_stored_version(
+        self,
+        name: str
+    ) -> Optional[str]:
+        """Get the version tag of the stored copy of a table.
+
+        Args:
+            name (str): Table name.
+
+        Returns:
+            Optional[str]: The stored version, or None if there is no copy.
+        """
+        manifest = self._read_manifest(name)
+        return manifest["version"] if manifest else None
+
+    def read_table(
+        self,
+        name: str,
+        version: str = None
+    ) -> Optional[pd.DataFrame]:
+        """Load a table from the store.
+
+        Args:
+            name (str): Table name.
+            version (str, optional): Required version. If provided and the stored
+            copy has a different version, nothing is loaded. Defaults to None.
+
+        Returns:
+            Optional[pd.DataFrame]: The table, or None if no usable copy exists.
+        """
+        manifest = self._read_manifest(name)
+        if manifest is None or (version is not None and manifest["version"] != version):
+            return None
+        table_dir = os.path.join(self._root, name)
+        index = np.load(os.path.join(table_dir, ColumnarStore._index_file_name), mmap_mode="r")
+        return pd.DataFrame(
+            {
+                column["name"]: ColumnarStore._read_column(table_dir, column)
+                for column in manifest["columns"]
+            },
+            index=index
+        )
+
+    @staticmethod
+    def _read_column(
+        table_dir: str,
+        column: Dict[str, str]
+    ) -> np.ndarray:
+        """Load a column, restoring its missing values.
+
+        Args:
+            table_dir (str): Directory of the table copy.
+            column (Dict[str, str]): Manifest entry of the column.
+
+        Returns:
+            np.ndarray: Column values.
+        """
+        values = np.load(os.path.join(table_dir, column["file"]), mmap_mode="r")
+        if "mask" not in column:
+            return values
+        missing = np.load(os.path.join(table_dir, column["mask"]))
+        return np.where(missing, None, values.astype(object))
+
+    def _read_manifest(
+        self,
+        name: str
+    ) -> Optional[Dict[str, object]]:
+        """Read the manifest for a table.
+
+        Args:
+            name (str): Table name.
+
+        Returns:
+            Optional[Dict[str, object]]: The manifest, or None if there is no
+            copy in the current layout.
+        """
+        manifest_path = os.path.join(self._root, name, ColumnarStore._manifest_file_name)
+        if not os.path.exists(manifest_path):
+            return None
+        with open(manifest_path, "r") as file:
+            manifest = json.load(file)
+        if manifest.get("format") != ColumnarStore._format_version:
+            return None
+        return manifest
+
+    @staticmethod
+    def _to_array(series: pd.Series) -> np.ndarray:
+        """Convert a column to a typed array that can be saved without pickling.
+
+        Object columns are stored as numbers when every value is numeric and as
+        fixed width strings otherwise. Missing values of string columns are
+        stored separately, see write_table.
+
+        Args:
+            series (pd.Series): Column to convert.
+
+        Returns:
+            np.ndarray: Typed column values.
+        """
+        if series.dtype != object:
+            return series.to_numpy()
+        try:
+            return pd.to_numeric(series).to_numpy()
+        except (ValueError, TypeError):
+            return series.astype(str).to_numpy(dtype=str)
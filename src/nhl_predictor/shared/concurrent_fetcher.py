@@ -0,0 +1,70 @@
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Iterable, Iterator, Tuple
+
+from nhl_predictor.shared.logging_config import LoggingConfig
+
+logger = LoggingConfig.get_logger(__name__)
+
+class ConcurrentFetcher:
+    """Runs blocking fetch calls (e.g. NHL API requests) on a bounded pool of
+    worker threads and hands the results back to the calling thread as they
+    complete.
+
+    Only the fetches run on the worker threads. Results are yielded to the
+    caller so that a single thread remains responsible for persisting them.
+    """
+
+    def __init__(self, max_workers: int):
+        """Create a fetcher.
+
+        Args:
+            max_workers (int): Maximum number of fetches in flight at once.
+        """
+        self._max_workers = max(1, int(max_workers))
+
+    def fetch(
+        self,
+        fetch_fn: Callable[[object], object],
+        items: Iterable[object]
+    ) -> Iterator[Tuple[object, object, Exception]]:
+        """Apply fetch_fn to every item concurrently.
+
+        Items are submitted lazily so that at most a couple of batches of work
+        are pending at any time, regardless of how many items are provided.
+
+        Args:
+            fetch_fn (Callable[[object], object]): Blocking call to make for each item.
+            items (Iterable[object]): Items to fetch.
+
+        Yields:
+            Iterator[Tuple[object, object, Exception]]: Tuples of (item, result,
+            exception) in completion order. Exactly one of result or exception
+            is meaningful; exception is None on success.
+        """
+        max_pending = self._max_workers * 2
+        items = iter(items)
+        pending: Dict[Future, object] = {}
+
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            exhausted = False
+            while pending or not exhausted:
+                while not exhausted and len(pending) < max_pending:
+                    try:
+                        item = next(items)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    pending[executor.submit(fetch_fn, item)] = item
+
+                if not pending:
+                    break
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    item = pending.pop(future)
+                    exception = future.exception()
+                    if exception is not None:
+                        logger.warning(f"Fetch failed for item '{item}'. Exception: '{str(exception)}'.")
+                        yield item, None, exception
+                    else:
+                        yield item, future.result(), None
@@ -6,4 +6,34 @@ class Database:
     goalie_stats_table_name = "goalie_stats"
     players_table_name = "players"
     games_table_name = "games"
-    meta_table_name = "meta"
\ No newline at end of file
+    meta_table_name = "meta"
+    failed_games_table_name = "failed_games"
+    checkpoints_table_name = "checkpoints"
+    ingested_dates_table_name = "ingested_dates"
+    skater_aggregates_table_name = "skater_aggregates"
+    goalie_aggregates_table_name = "goalie_aggregates"
+
+    # Meta table key recording when stored rows were last overwritten
+    data_generation_key = "data_generation"
+
+    # Directory (relative to the app dir) holding columnar table copies
+    columnar_dir_name = "columnar"
+
+    # Directory (relative to the app dir) holding cached API responses
+    http_cache_dir_name = "http_cache"
+
+    # Directory (relative to the app dir) holding cached training data sets
+    dataset_cache_dir_name = "datasets"
+
+    # File (relative to the app dir) holding the raw box score archive
+    archive_db_file_name = "NHLPredictorArchive.sqlite"
+
+    # File (relative to the app dir) listing the seasons that can be built
+    seasons_file_name = "seasons.json"
+
+    # File (relative to the app dir) held while a build, rebuild or backfill
+    # writes to the databases
+    write_lock_file_name = "write.lock"
+
+    # File (relative to the app dir) holding the relational store
+    relational_db_file_name = "NHLPredictorRelational.sqlite"
\ No newline at end of file
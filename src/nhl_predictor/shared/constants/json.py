@@ -11,6 +11,9 @@ class JSON:
     season = "season"
     game_type = "gameType"
     game_state = "gameState"
+    game_date = "gameDate"
+    game_week = "gameWeek"
+    date = "date"
     player_by_game_stats = "playerByGameStats"
     home_team = "homeTeam"
     away_team = "awayTeam"
@@ -70,10 +73,15 @@ class JSON:
     winner = "winner"
     home_team = "homeTeam"
     away_team= "awayTeam"
+    home_team_name = "homeTeamName"
+    away_team_name = "awayTeamName"
     score = "score"
     team_id = "teamId"
     team_role = "teamRole"
     skater_prefix = "skater_"
     goalie_prefix = "goalie_"
     home_suffix = "_home"
-    away_suffix = "_away"
\ No newline at end of file
+    away_suffix = "_away"
+    games_played = "gamesPlayed"
+    sum_prefix = "sum_"
+    sum_of_squares_prefix = "sumsq_"
\ No newline at end of file
@@ -0,0 +1,242 @@
+from nhl_predictor.shared.constants.database import Database as DB
+from nhl_predictor.shared.constants.json import JSON as Keys
+
+
+class Schema:
+    """Constants describing the typed columns of each table in the relational
+    store.
+    """
+
+    # Column definitions, keyed by table name. Column order is the insert order.
+    columns = {
+        DB.games_table_name: [
+            (Keys.game_id, "INTEGER NOT NULL"),
+            (Keys.season, "INTEGER"),
+            (Keys.game_type, "INTEGER"),
+            (Keys.game_state, "TEXT"),
+            (Keys.home_team, "INTEGER"),
+            (Keys.away_team, "INTEGER"),
+            (Keys.winner, "INTEGER"),
+            (Keys.game_date, "TEXT"),
+            (Keys.home_team_name, "TEXT"),
+            (Keys.away_team_name, "TEXT"),
+        ],
+        DB.players_table_name: [
+            (Keys.player_id, "INTEGER NOT NULL"),
+            (Keys.current_team_id, "INTEGER"),
+            (Keys.first_name, "TEXT"),
+            (Keys.last_name, "TEXT"),
+            (Keys.height_in_cm, "INTEGER"),
+            (Keys.weight_in_kg, "INTEGER"),
+        ],
+        DB.skater_stats_table_name: [
+            (Keys.game_id, "INTEGER NOT NULL"),
+            (Keys.player_id, "INTEGER NOT NULL"),
+            (Keys.goals, "INTEGER"),
+            (Keys.assists, "INTEGER"),
+            (Keys.points, "INTEGER"),
+            (Keys.plus_minus, "INTEGER"),
+            (Keys.pim, "INTEGER"),
+            (Keys.hits, "INTEGER"),
+            (Keys.power_play_goals, "INTEGER"),
+            (Keys.sog, "INTEGER"),
+            (Keys.faceoff_winning_pctg, "REAL"),
+            (Keys.toi, "TEXT"),
+            (Keys.blocked_shots, "INTEGER"),
+            (Keys.shifts, "INTEGER"),
+            (Keys.giveaways, "INTEGER"),
+            (Keys.takeaways, "INTEGER"),
+            (Keys.team_id, "INTEGER"),
+            (Keys.team_role, "INTEGER"),
+        ],
+        DB.goalie_stats_table_name: [
+            (Keys.game_id, "INTEGER NOT NULL"),
+            (Keys.player_id, "INTEGER NOT NULL"),
+            (Keys.even_strength_shots_against, "INTEGER"),
+            (Keys.power_play_shots_against, "INTEGER"),
+            (Keys.shorthanded_shots_against, "INTEGER"),
+            (Keys.save_shots_against, "INTEGER"),
+            (Keys.even_strength_saves_against, "INTEGER"),
+            (Keys.power_play_saves_against, "INTEGER"),
+            (Keys.shorthanded_saves_against, "INTEGER"),
+            (Keys.save_saves_against, "INTEGER"),
+            (Keys.save_pctg, "REAL"),
+            (Keys.even_strength_goals_against, "INTEGER"),
+            (Keys.power_play_goals_against, "INTEGER"),
+            (Keys.shorthanded_goals_against, "INTEGER"),
+            (Keys.pim, "INTEGER"),
+            (Keys.goals_against, "INTEGER"),
+            (Keys.toi, "TEXT"),
+            (Keys.starter, "INTEGER"),
+            (Keys.decision, "TEXT"),
+            (Keys.shots_against, "INTEGER"),
+            (Keys.saves, "INTEGER"),
+            (Keys.team_id, "INTEGER"),
+            (Keys.team_role, "INTEGER"),
+        ],
+    }
+
+    # Compact in-memory dtypes applied when tables are loaded into pandas,
+    # keyed by table name. Integer columns holding missing values use the
+    # matching nullable dtype. TOI columns are converted to integer seconds.
+    #
+    # Every integer column is at least int16, even when its per-game values
+    # would fit in int8, since element-wise arithmetic (differences, sums of
+    # columns, running totals) does not widen and would silently wrap at 127.
+    # The range each column is assumed to fit is noted next to it; int16
+    # holds -32,768 to 32,767 and int32 about +/-2.1 billion.
+    dtypes = {
+        DB.games_table_name: {
+            Keys.season: "int32",           # YYYYYYYY season ID, e.g. 20232024
+            Keys.game_type: "int16",        # 1-3 (GameType)
+            Keys.game_state: "category",
+            Keys.home_team: "int16",        # franchise IDs, < 100
+            Keys.away_team: "int16",        # franchise IDs, < 100
+            Keys.winner: "int16",           # -1, 0 or 1 (HomeOrAway)
+            Keys.home_team_name: "category",
+            Keys.away_team_name: "category",
+        },
+        DB.players_table_name: {
+            Keys.current_team_id: "int16",  # franchise IDs, < 100
+            Keys.height_in_cm: "int16",     # < 250
+            Keys.weight_in_kg: "int16",     # < 200
+        },
+        DB.skater_stats_table_name: {
+            # IDs: game IDs are 10 digit YYYYTTNNNN values, player IDs 7 digit.
+            Keys.game_id: "int32",
+            Keys.player_id: "int32",
+            # Per-game counting stats, each well under 100.
+            Keys.goals: "int16",
+            Keys.assists: "int16",
+            Keys.points: "int16",
+            Keys.plus_minus: "int16",       # may be negative
+            Keys.pim: "int16",
+            Keys.hits: "int16",
+            Keys.power_play_goals: "int16",
+            Keys.sog: "int16",
+            Keys.faceoff_winning_pctg: "float32",
+            Keys.toi: "int16",              # seconds, < 10,000 even in long overtimes
+            Keys.blocked_shots: "int16",
+            Keys.shifts: "int16",
+            Keys.giveaways: "int16",
+            Keys.takeaways: "int16",
+            Keys.team_id: "int16",          # franchise IDs, < 100
+            Keys.team_role: "category",
+        },
+        DB.goalie_stats_table_name: {
+            # IDs: game IDs are 10 digit YYYYTTNNNN values, player IDs 7 digit.
+            Keys.game_id: "int32",
+            Keys.player_id: "int32",
+            # Per-game shots, saves and goals against, each under 200.
+            Keys.even_strength_shots_against: "int16",
+            Keys.power_play_shots_against: "int16",
+            Keys.shorthanded_shots_against: "int16",
+            Keys.save_shots_against: "int16",
+            Keys.even_strength_saves_against: "int16",
+            Keys.power_play_saves_against: "int16",
+            Keys.shorthanded_saves_against: "int16",
+            Keys.save_saves_against: "int16",
+            Keys.save_pctg: "float32",
+            Keys.even_strength_goals_against: "int16",
+            Keys.power_play_goals_against: "int16",
+            Keys.shorthanded_goals_against: "int16",
+            Keys.pim: "int16",
+            Keys.goals_against: "int16",
+            Keys.toi: "int16",              # seconds, < 10,000 even in long overtimes
+            Keys.starter: "bool",           # stored as 0/1 in the relational store
+            Keys.decision: "category",
+            Keys.shots_against: "int16",
+            Keys.saves: "int16",
+            Keys.team_id: "int16",          # franchise IDs, < 100
+            Keys.team_role: "category",
+        },
+    }
+
+    # Primary key columns, keyed by table name.
+    primary_keys = {
+        DB.games_table_name: [Keys.game_id],
+        DB.players_table_name: [Keys.player_id],
+        DB.skater_stats_table_name: [Keys.game_id, Keys.player_id],
+        DB.goalie_stats_table_name: [Keys.game_id, Keys.player_id],
+    }
+
+    # For tables whose SqliteDict rows do not repeat their key, the column
+    # that holds the SqliteDict key.
+    key_columns = {
+        DB.games_table_name: Keys.game_id,
+        DB.players_table_name: Keys.player_id,
+    }
+
+    # Per-player aggregate tables, keyed by the stats table they summarize.
+    aggregate_tables = {
+        DB.skater_stats_table_name: DB.skater_aggregates_table_name,
+        DB.goalie_stats_table_name: DB.goalie_aggregates_table_name,
+    }
+
+    # Stats tracked in the aggregate tables, keyed by stats table name.
+    aggregated_stats = {
+        DB.skater_stats_table_name: [
+            Keys.goals,
+            Keys.assists,
+            Keys.points,
+            Keys.plus_minus,
+            Keys.pim,
+            Keys.hits,
+            Keys.power_play_goals,
+            Keys.sog,
+            Keys.faceoff_winning_pctg,
+            Keys.blocked_shots,
+            Keys.shifts,
+            Keys.giveaways,
+            Keys.takeaways,
+        ],
+        DB.goalie_stats_table_name: [
+            Keys.even_strength_shots_against,
+            Keys.power_play_shots_against,
+            Keys.shorthanded_shots_against,
+            Keys.save_shots_against,
+            Keys.save_pctg,
+            Keys.even_strength_goals_against,
+            Keys.power_play_goals_against,
+            Keys.shorthanded_goals_against,
+            Keys.pim,
+            Keys.goals_against,
+            Keys.shots_against,
+            Keys.saves,
+            Keys.even_strength_saves_against,
+            Keys.power_play_saves_against,
+            Keys.shorthanded_saves_against,
+            Keys.save_saves_against,
+        ],
+    }
+
+    # Goalie stats reported by the API as "saves/shots", mapped to the column
+    # that receives the saves part. The shots part keeps the original column
+    # name. Both parts are stored as integers.
+    compound_stats = {
+        Keys.even_strength_shots_against: Keys.even_strength_saves_against,
+        Keys.power_play_shots_against: Keys.power_play_saves_against,
+        Keys.shorthanded_shots_against: Keys.shorthanded_saves_against,
+        Keys.save_shots_against: Keys.save_saves_against,
+    }
+
+    # Secondary indexes, keyed by table name.
+    indexes = {
+        DB.games_table_name: [
+            [Keys.season],
+            [Keys.game_date],
+            [Keys.home_team],
+            [Keys.away_team],
+        ],
+        DB.players_table_name: [
+            [Keys.current_team_id],
+        ],
+        DB.skater_stats_table_name: [
+            [Keys.player_id, Keys.game_id],
+            [Keys.team_id],
+        ],
+        DB.goalie_stats_table_name: [
+            [Keys.player_id, Keys.game_id],
+            [Keys.team_id],
+        ],
+    }
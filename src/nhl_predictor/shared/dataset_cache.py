@@ -0,0 +1,209 @@
+import glob
+import hashlib
+import os
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+from nhl_predictor.shared.columnar_store import ColumnarStore
+from nhl_predictor.shared.constants.database import Database as DB
+from nhl_predictor.shared.logging_config import LoggingConfig
+from nhl_predictor.shared.utility import Utility as utl
+
+logger = LoggingConfig.get_logger(__name__)
+
+class DatasetCache:
+    """Persistent cache of summarized training data sets.
+
+    A data set is keyed by the summarizer type, the summarizer version and a
+    fingerprint of the source tables made of their row counts and the meta
+    table's last update times. A cached data set is therefore reused as long
+    as neither the data nor the summarizer changed, and only the latest data
+    set of each summarizer type is kept. When the data changed, the latest
+    data set of the same summarizer version and data generation can still be
+    read to summarize incrementally. The data generation changes whenever
+    stored rows are overwritten, e.g. by a rebuild, so that a data set built
+    from the previous rows is never extended.
+    """
+
+    _file_suffix = ".pkl"
+
+    def __init__(self, path: Path):
+        """Create a cache in the application directory.
+
+        Args:
+            path (Path): Application directory.
+        """
+        self._root = os.path.join(path, DB.dataset_cache_dir_name)
+
+    @staticmethod
+    def get_fingerprint(
+        path: Path,
+        *names: str
+    ) -> str:
+        """Fingerprint the source tables without loading them.
+
+        Args:
+            path (Path): Application directory holding the database file.
+            names (str): Names of the source tables.
+
+        Returns:
+            str: The fingerprint.
+        """
+        tables = utl.get_sqlitedict_tables(*names, DB.meta_table_name, path=path, read_only=True)
+        meta_db = tables[DB.meta_table_name]
+        fingerprint = "|".join(
+            f"{name}:{len(tables[name])}:{ColumnarStore.get_version(meta_db, name)}"
+            for name in names
+        )
+        for table in tables.values():
+            table.close()
+        return fingerprint
+
+    @staticmethod
+    def get_generation(path: Path) -> str:
+        """Get the current data generation.
+
+        Args:
+            path (Path): Application directory holding the database file.
+
+        Returns:
+            str: The data generation.
+        """
+        meta_db = utl.get_sqlitedict_tables(DB.meta_table_name, path=path, read_only=True)[DB.meta_table_name]
+        generation = ColumnarStore.get_version(meta_db, DB.data_generation_key)
+        meta_db.close()
+        if generation is None:
+            return "0"
+        return hashlib.sha256(generation.encode()).hexdigest()[:16]
+
+    def get(
+        self,
+        summarizer_type: str,
+        version: str,
+        generation: str,
+        fingerprint: str
+    ) -> Optional[pd.DataFrame]:
+        """Get a cached data set.
+
+        Args:
+            summarizer_type (str): Summarizer type.
+            version (str): Summarizer version.
+            generation (str): Data generation.
+            fingerprint (str): Fingerprint of the source tables.
+
+        Returns:
+            Optional[pd.DataFrame]: The data set, or None if there is no cached
+            data set for the key.
+        """
+        file_path = self._get_file_path(summarizer_type, version, generation, fingerprint)
+        if not os.path.exists(file_path):
+            logger.info(f"No cached data set for summarizer '{summarizer_type}'.")
+            return None
+        try:
+            data_set = pd.read_pickle(file_path)
+        except Exception as e:
+            logger.warning(f"Unable to read cached data set '{file_path}'. Exception: '{str(e)}'.")
+            return None
+        logger.info(f"Using cached data set for summarizer '{summarizer_type}'.")
+        return data_set
+
+    def get_latest(
+        self,
+        summarizer_type: str,
+        version: str,
+        generation: str
+    ) -> Optional[pd.DataFrame]:
+        """Get the latest cached data set of a summarizer version and data
+        generation, whatever data it was built from.
+
+        Args:
+            summarizer_type (str): Summarizer type.
+            version (str): Summarizer version.
+            generation (str): Data generation.
+
+        Returns:
+            Optional[pd.DataFrame]: The data set, or None if there is none.
+        """
+        file_paths = glob.glob(os.path.join(
+            self._root,
+            f"{DatasetCache._get_file_prefix(summarizer_type, version, generation)}*{DatasetCache._file_suffix}"
+        ))
+        if not file_paths:
+            return None
+        try:
+            return pd.read_pickle(max(file_paths, key=os.path.getmtime))
+        except Exception as e:
+            logger.warning(f"Unable to read cached data set. Exception: '{str(e)}'.")
+            return None
+
+    def put(
+        self,
+        summarizer_type: str,
+        version: str,
+        generation: str,
+        fingerprint: str,
+        data_set: pd.DataFrame
+    ) -> None:
+        """Cache a data set, replacing older data sets of the same summarizer.
+
+        Args:
+            summarizer_type (str): Summarizer type.
+            version (str): Summarizer version.
+            generation (str): Data generation.
+            fingerprint (str): Fingerprint of the source tables.
+            data_set (pd.DataFrame): The summarized data set.
+        """
+        Path(self._root).mkdir(parents=True, exist_ok=True)
+        file_path = self._get_file_path(summarizer_type, version, generation, fingerprint)
+        for stale_path in glob.glob(os.path.join(self._root, f"{summarizer_type}_v*{DatasetCache._file_suffix}")):
+            if stale_path != file_path:
+                os.remove(stale_path)
+        staging_path = f"{file_path}.tmp"
+        data_set.to_pickle(staging_path, protocol=5)
+        os.replace(staging_path, file_path)
+        logger.info(f"Cached data set for summarizer '{summarizer_type}'.")
+
+    def _get_file_path(
+        self,
+        summarizer_type: str,
+        version: str,
+        generation: str,
+        fingerprint: str
+    ) -> str:
+        """Get the path of the file holding a data set.
+
+        Args:
+            summarizer_type (str): Summarizer type.
+            version (str): Summarizer version.
+            generation (str): Data generation.
+            fingerprint (str): Fingerprint of the source tables.
+
+        Returns:
+            str: The file path.
+        """
+        key = hashlib.sha256(fingerprint.encode()).hexdigest()
+        return os.path.join(
+            self._root,
+            f"{DatasetCache._get_file_prefix(summarizer_type, version, generation)}{key}{DatasetCache._file_suffix}"
+        )
+
+    @staticmethod
+    def _get_file_prefix(
+        summarizer_type: str,
+        version: str,
+        generation: str
+    ) -> str:
+        """Get the file name prefix shared by the data sets of a summarizer
+        version and data generation.
+
+        Args:
+            summarizer_type (str): Summarizer type.
+            version (str): Summarizer version.
+            generation (str): Data generation.
+
+        Returns:
+            str: The file name prefix.
+        """
+        return f"{summarizer_type}_v{version}_g{generation}_"
@@ -4,6 +4,10 @@ from pathlib import Path
 import typer
 from nhlpy import NHLClient
 
+from nhl_predictor.model.seasons import Seasons
+from nhl_predictor.shared.http_cache import CachingHttpClient, HttpCache
+from nhl_predictor.shared.transport import Transport
+
 
 class ExecutionContext:
     """A singleton execution context to track values needed throughout
@@ -11,6 +15,14 @@ class ExecutionContext:
     """
     _app_name = "nhlpredictor"
     _app_dir_set = False
+    _default_workers = 8
+    _default_processes = 1
+    _default_batch_size = 5000
+    _default_request_timeout = 10
+    _default_cache_size = 1024
+    _default_player_max_age = 7
+    _default_max_retries = 3
+    _default_rate_limit = 20.0
     
     def __new__(cls):
         """Overload __new__ to create only one instance.
@@ -27,8 +39,99 @@ class ExecutionContext:
             NHLClient: An NHLClient to use.
         """
         if getattr(self, '_client', None) is None:
-            self._client = NHLClient()
+            self._client = CachingHttpClient.attach(
+                NHLClient(timeout=self.request_timeout),
+                self.http_cache,
+                self.transport
+            )
         return self._client
+
+    @property
+    def transport(self) -> Transport:
+        """Get the shared HTTP transport for the application run.
+
+        Returns:
+            Transport: The transport used for all API requests.
+        """
+        if getattr(self, '_transport', None) is None:
+            self._transport = Transport(
+                self.request_timeout,
+                self.max_retries,
+                self.rate_limit,
+                self.workers
+            )
+        return self._transport
+
+    @property
+    def http_cache(self) -> HttpCache:
+        """Get the cache of NHL API responses for the application run.
+
+        Returns:
+            HttpCache: The response cache.
+        """
+        if getattr(self, '_http_cache', None) is None:
+            self._http_cache = HttpCache(
+                self.app_dir,
+                self.cache_size * 1024 * 1024,
+                enabled=self.use_cache
+            )
+        return self._http_cache
+
+    @property
+    def use_cache(self) -> bool:
+        """Get if NHL API responses should be cached on disk.
+
+        Returns:
+            bool: Boolean indicating if the response cache is enabled.
+        """
+        return getattr(self, "_use_cache", True)
+
+    @use_cache.setter
+    def use_cache(self, value: bool):
+        """Set if NHL API responses should be cached on disk.
+
+        Args:
+            value (bool): The value to set use_cache to.
+        """
+        self._use_cache = value
+
+    @property
+    def use_dataset_cache(self) -> bool:
+        """Get if summarized training data sets should be cached and reused.
+
+        Returns:
+            bool: Boolean indicating if the data set cache is enabled.
+        """
+        return getattr(self, "_use_dataset_cache", True)
+
+    @use_dataset_cache.setter
+    def use_dataset_cache(self, value: bool):
+        """Set if summarized training data sets should be cached and reused.
+
+        Args:
+            value (bool): The value to set use_dataset_cache to.
+        """
+        self._use_dataset_cache = value
+
+    @property
+    def cache_size(self) -> int:
+        """Get the maximum size, in megabytes, of the response cache.
+
+        Returns:
+            int: The maximum cache size in megabytes.
+        """
+        return getattr(self, "_cache_size", ExecutionContext._default_cache_size)
+
+    @cache_size.setter
+    def cache_size(self, value: int):
+        """Set the maximum size, in megabytes, of the response cache.
+
+        Args:
+            value (int): The value to set cache_size to.
+        """
+        if value < 1:
+            raise ValueError("Cache size must be at least 1 megabyte.")
+        self._cache_size = value
     
     @property
     def summarizer_type(self) -> str:
@@ -65,7 +168,260 @@ class ExecutionContext:
             value (bool): The value to set allow_update to.
         """
         self._allow_update = value
-    
+
+    @property
+    def incremental(self) -> bool:
+        """Get if builds should only fetch games that are not stored yet.
+
+        Returns:
+            bool: Boolean indicating if incremental builds are enabled.
+        """
+        return getattr(self, "_incremental", False)
+
+    @incremental.setter
+    def incremental(self, value: bool):
+        """Set if builds should only fetch games that are not stored yet.
+
+        Args:
+            value (bool): The value to set incremental to.
+        """
+        self._incremental = value
+
+    @property
+    def archive_box_scores(self) -> bool:
+        """Get if raw box scores should be archived during builds.
+
+        Returns:
+            bool: Boolean indicating if box scores are archived.
+        """
+        return getattr(self, "_archive_box_scores", False)
+
+    @archive_box_scores.setter
+    def archive_box_scores(self, value: bool):
+        """Set if raw box scores should be archived during builds.
+
+        Args:
+            value (bool): The value to set archive_box_scores to.
+        """
+        self._archive_box_scores = value
+
+    @property
+    def resume(self) -> bool:
+        """Get if builds should continue where the previous build stopped.
+
+        Returns:
+            bool: Boolean indicating if the build resumes from checkpoints.
+        """
+        return getattr(self, "_resume", False)
+
+    @resume.setter
+    def resume(self, value: bool):
+        """Set if builds should continue where the previous build stopped.
+
+        Args:
+            value (bool): The value to set resume to.
+        """
+        self._resume = value
+
+    @property
+    def first_season(self) -> str:
+        """Get the oldest season built by '--all-seasons'. Older seasons are
+        only built by backfills.
+
+        Returns:
+            str: The first season, e.g. "20222023".
+        """
+        return getattr(self, "_first_season", Seasons.items()[0].value)
+
+    @first_season.setter
+    def first_season(self, value: str):
+        """Set the oldest season built by '--all-seasons'.
+
+        Args:
+            value (str): The value to set first_season to.
+        """
+        self._first_season = value
+
+    @property
+    def player_max_age(self) -> int:
+        """Get the number of days a stored player record is considered fresh.
+
+        Returns:
+            int: The maximum age of a player record in days.
+        """
+        return getattr(self, "_player_max_age", ExecutionContext._default_player_max_age)
+
+    @player_max_age.setter
+    def player_max_age(self, value: int):
+        """Set the number of days a stored player record is considered fresh.
+
+        Args:
+            value (int): The value to set player_max_age to. 0 always refreshes.
+        """
+        if value < 0:
+            raise ValueError("Player maximum age cannot be negative.")
+        self._player_max_age = value
+
+    @property
+    def players_from_box_scores(self) -> bool:
+        """Get if only players seen in newly ingested box scores should be
+        refreshed.
+
+        Returns:
+            bool: Boolean indicating if player refreshes are limited to
+            ingested box scores.
+        """
+        return getattr(self, "_players_from_box_scores", False)
+
+    @players_from_box_scores.setter
+    def players_from_box_scores(self, value: bool):
+        """Set if only players seen in newly ingested box scores should be
+        refreshed.
+
+        Args:
+            value (bool): The value to set players_from_box_scores to.
+        """
+        self._players_from_box_scores = value
+
+    @property
+    def workers(self) -> int:
+        """Get the maximum number of concurrent API requests.
+
+        Returns:
+            int: The maximum number of concurrent API requests.
+        """
+        return getattr(self, "_workers", ExecutionContext._default_workers)
+
+    @workers.setter
+    def workers(self, value: int):
+        """Set the maximum number of concurrent API requests.
+
+        Args:
+            value (int): The value to set workers to.
+        """
+        if value < 1:
+            raise ValueError("Number of workers must be at least 1.")
+        self._workers = value
+
+    @property
+    def processes(self) -> int:
+        """Get the number of processes downloading and parsing box scores.
+
+        Returns:
+            int: The number of processes.
+        """
+        return getattr(self, "_processes", ExecutionContext._default_processes)
+
+    @processes.setter
+    def processes(self, value: int):
+        """Set the number of processes downloading and parsing box scores.
+
+        Args:
+            value (int): The value to set processes to. 1 keeps all the work in
+            the main process.
+        """
+        if value < 1:
+            raise ValueError("Number of processes must be at least 1.")
+        self._processes = value
+
+    @property
+    def request_timeout(self) -> int:
+        """Get the timeout, in seconds, of each NHL API request.
+
+        Returns:
+            int: The request timeout in seconds.
+        """
+        return getattr(self, "_request_timeout", ExecutionContext._default_request_timeout)
+
+    @request_timeout.setter
+    def request_timeout(self, value: int):
+        """Set the timeout, in seconds, of each NHL API request.
+
+        Args:
+            value (int): The value to set request_timeout to.
+        """
+        if value <= 0:
+            raise ValueError("Request timeout must be positive.")
+        self._request_timeout = value
+
+    @property
+    def max_retries(self) -> int:
+        """Get the number of times a failed API request is retried.
+
+        Returns:
+            int: The maximum number of retries.
+        """
+        return getattr(self, "_max_retries", ExecutionContext._default_max_retries)
+
+    @max_retries.setter
+    def max_retries(self, value: int):
+        """Set the number of times a failed API request is retried.
+
+        Args:
+            value (int): The value to set max_retries to.
+        """
+        if value < 0:
+            raise ValueError("Number of retries cannot be negative.")
+        self._max_retries = value
+
+    @property
+    def rate_limit(self) -> float:
+        """Get the maximum sustained number of API requests per second.
+
+        Returns:
+            float: The maximum number of requests per second.
+        """
+        return getattr(self, "_rate_limit", ExecutionContext._default_rate_limit)
+
+    @rate_limit.setter
+    def rate_limit(self, value: float):
+        """Set the maximum sustained number of API requests per second.
+
+        Args:
+            value (float): The value to set rate_limit to.
+        """
+        if value <= 0:
+            raise ValueError("Rate limit must be positive.")
+        self._rate_limit = value
+
+    @property
+    def batch_size(self) -> int:
+        """Get the number of rows buffered before a database commit.
+
+        Returns:
+            int: The number of rows per batch.
+        """
+        return getattr(self, "_batch_size", ExecutionContext._default_batch_size)
+
+    @batch_size.setter
+    def batch_size(self, value: int):
+        """Set the number of rows buffered before a database commit.
+
+        Args:
+            value (int): The value to set batch_size to.
+        """
+        if value < 1:
+            raise ValueError("Batch size must be at least 1.")
+        self._batch_size = value
+
+    @property
+    def history_window(self) -> int:
+        """Get the number of recent games used to summarize a player's history.
+
+        Returns:
+            int: The number of games, or None to use the whole history.
+        """
+        return getattr(self, "_history_window", None)
+
+    @history_window.setter
+    def history_window(self, value: int):
+        """Set the number of recent games used to summarize a player's history.
+
+        Args:
+            value (int): The number of games, or None to use the whole history.
+        """
+        self._history_window = value or None
+
     @property
     def model(self) -> str:
         """Get the model file name.
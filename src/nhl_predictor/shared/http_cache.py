@@ -0,0 +1,399 @@
+import hashlib
+import json
+import os
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Callable, Dict, Optional, Set, Tuple
+from urllib.parse import urlencode
+
+import httpx
+from nhlpy import NHLClient
+from nhlpy.http_client import Endpoint, HttpClient
+
+from nhl_predictor.model.game_state import GameState
+from nhl_predictor.shared.constants.database import Database as DB
+from nhl_predictor.shared.constants.json import JSON as Keys
+from nhl_predictor.shared.logging_config import LoggingConfig
+from nhl_predictor.shared.transport import Transport
+
+logger = LoggingConfig.get_logger(__name__)
+
+class HttpCache:
+    """Persistent, size bounded cache of NHL API responses.
+
+    Each response is stored in its own file, named by a hash of the request
+    URL and parameters, and compressed. How long a response stays valid
+    depends on the games it describes: responses about games that are all
+    official never expire, responses about live games expire quickly and
+    responses about future games expire after a few minutes. Responses that
+    do not describe games expire after a day.
+
+    When the cache grows beyond its size bound, the least recently used
+    responses are evicted. The cache is safe to use from multiple threads.
+    """
+
+    # Seconds a response stays valid, by the state of the games it describes.
+    _live_ttl = 60
+    _future_ttl = 15 * 60
+    _default_ttl = 24 * 60 * 60
+
+    # Game states after which a game's data no longer changes.
+    _final_states = {GameState.Official.value}
+
+    # Game states for games that are currently being played.
+    _live_states = {GameState.Live.value, GameState.Critical.value, GameState.Final.value}
+
+    _file_suffix = ".cache"
+
+    def __init__(
+        self,
+        path: Path,
+        max_bytes: int,
+        enabled: bool = True
+    ):
+        """Create a cache in the application directory.
+
+        Args:
+            path (Path): Application directory.
+            max_bytes (int): Maximum total size of the cached responses.
+            enabled (bool, optional): If False, nothing is read from or written
+            to the cache. Defaults to True.
+        """
+        self._root = os.path.join(path, DB.http_cache_dir_name)
+        self._max_bytes = max_bytes
+        self._enabled = enabled
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        # File name mapped to (size, last access time).
+        self._entries: Dict[str, Tuple[int, float]] = {}
+        self._size = 0
+
+        if not enabled:
+            return
+        Path(self._root).mkdir(parents=True, exist_ok=True)
+        for entry in os.scandir(self._root):
+            if entry.name.endswith(HttpCache._file_suffix):
+                stat = entry.stat()
+                self._entries[entry.name] = (stat.st_size, stat.st_mtime)
+                self._size += stat.st_size
+
+    @property
+    def hits(self) -> int:
+        """Get the number of requests served from the cache.
+
+        Returns:
+            int: Number of cache hits.
+        """
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Get the number of requests that were not served from the cache.
+
+        Returns:
+            int: Number of cache misses.
+        """
+        return self._misses
+
+    def report(self) -> None:
+        """Log the cache counters.
+        """
+        if self._enabled:
+            logger.info(
+                f"HTTP cache hits: '{self._hits}', misses: '{self._misses}', "
+                f"size: '{self._size}' bytes."
+            )
+
+    def get_json(
+        self,
+        url: str,
+        params: Dict[str, object],
+        fetch_fn: Callable[[], bytes]
+    ) -> object:
+        """Get the JSON response to a request, fetching and caching it on a miss.
+
+        Args:
+            url (str): Request URL.
+            params (Dict[str, object]): Request query parameters.
+            fetch_fn (Callable[[], bytes]): Makes the request and returns the
+            response content.
+
+        Returns:
+            object: The decoded JSON response.
+        """
+        content = self.get(url, params)
+        if content is None:
+            content = fetch_fn()
+            self.put(url, params, content)
+        return json.loads(content)
+
+    def get(
+        self,
+        url: str,
+        params: Dict[str, object] = None
+    ) -> Optional[bytes]:
+        """Get a cached response.
+
+        Args:
+            url (str): Request URL.
+            params (Dict[str, object], optional): Request query parameters.
+            Defaults to None.
+
+        Returns:
+            Optional[bytes]: The response content, or None if there is no valid
+            cached response.
+        """
+        if not self._enabled:
+            return None
+        file_name = HttpCache._get_file_name(url, params)
+        file_path = os.path.join(self._root, file_name)
+        try:
+            with open(file_path, "rb") as file:
+                header = json.loads(file.readline())
+                content = zlib.decompress(file.read())
+            expires = header["expires"]
+        except (OSError, ValueError, KeyError, zlib.error):
+            return self._miss()
+        if expires is not None and expires < time.time():
+            return self._miss()
+
+        now = time.time()
+        try:
+            os.utime(file_path, (now, now))
+        except OSError:
+            pass
+        with self._lock:
+            self._hits += 1
+            if file_name in self._entries:
+                self._entries[file_name] = (self._entries[file_name][0], now)
+        return content
+
+    def put(
+        self,
+        url: str,
+        params: Dict[str, object],
+        content: bytes
+    ) -> None:
+        """Cache a response. Responses that are not JSON are not cached.
+
+        Args:
+            url (str): Request URL.
+            params (Dict[str, object]): Request query parameters.
+            content (bytes): Response content.
+        """
+        if not self._enabled:
+            return
+        try:
+            ttl = HttpCache._get_ttl(json.loads(content))
+        except ValueError:
+            return
+        header = {
+            "url": HttpCache._get_request_key(url, params),
+            "expires": None if ttl is None else time.time() + ttl
+        }
+        entry = json.dumps(header).encode() + b"\n" + zlib.compress(content)
+
+        file_name = HttpCache._get_file_name(url, params)
+        file_path = os.path.join(self._root, file_name)
+        # Worker processes share the directory, and thread idents are only
+        # unique within a process.
+        staging_path = f"{file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(staging_path, "wb") as file:
+                file.write(entry)
+            os.replace(staging_path, file_path)
+        except OSError as e:
+            logger.warning(f"Unable to write HTTP cache entry. URL: '{url}', Exception: '{str(e)}'.")
+            return
+
+        with self._lock:
+            previous_size, _ = self._entries.get(file_name, (0, 0))
+            self._entries[file_name] = (len(entry), time.time())
+            self._size += len(entry) - previous_size
+            if self._size > self._max_bytes:
+                self._evict()
+
+    def _miss(self) -> None:
+        """Count a cache miss.
+
+        Returns:
+            None: Always None, so that lookups can return the result directly.
+        """
+        with self._lock:
+            self._misses += 1
+        return None
+
+    def _evict(self) -> None:
+        """Delete the least recently used responses until the cache is back
+        under 90% of its size bound. Must be called with the lock held.
+        """
+        target = self._max_bytes * 0.9
+        for file_name, (size, _) in sorted(self._entries.items(), key=lambda item: item[1][1]):
+            if self._size <= target:
+                break
+            try:
+                os.remove(os.path.join(self._root, file_name))
+            except OSError:
+                pass
+            del self._entries[file_name]
+            self._size -= size
+
+    @staticmethod
+    def _get_request_key(
+        url: str,
+        params: Dict[str, object]
+    ) -> str:
+        """Build a key identifying a request.
+
+        Args:
+            url (str): Request URL.
+            params (Dict[str, object]): Request query parameters.
+
+        Returns:
+            str: The request key.
+        """
+        if not params:
+            return url
+        return f"{url}?{urlencode(sorted(params.items()))}"
+
+    @staticmethod
+    def _get_file_name(
+        url: str,
+        params: Dict[str, object]
+    ) -> str:
+        """Get the name of the file holding the response to a request.
+
+        Args:
+            url (str): Request URL.
+            params (Dict[str, object]): Request query parameters.
+
+        Returns:
+            str: The file name.
+        """
+        key = HttpCache._get_request_key(url, params)
+        return hashlib.sha256(key.encode()).hexdigest() + HttpCache._file_suffix
+
+    @staticmethod
+    def _get_ttl(payload: object) -> Optional[float]:
+        """Get how long a response stays valid based on the games it describes.
+
+        Args:
+            payload (object): Decoded JSON response.
+
+        Returns:
+            Optional[float]: Seconds the response is valid for, or None if it
+            never expires.
+        """
+        states = HttpCache._get_game_states(payload)
+        if not states:
+            return HttpCache._default_ttl
+        if states <= HttpCache._final_states:
+            return None
+        if states & HttpCache._live_states:
+            return HttpCache._live_ttl
+        return HttpCache._future_ttl
+
+    @staticmethod
+    def _get_game_states(payload: object) -> Set[str]:
+        """Collect the states of the games described by a response, whether it
+        is a single game, a list of games or a weekly schedule.
+
+        Args:
+            payload (object): Decoded JSON response.
+
+        Returns:
+            Set[str]: Game states found in the response.
+        """
+        if not isinstance(payload, dict):
+            return set()
+        states = set()
+        if Keys.game_state in payload:
+            states.add(payload[Keys.game_state])
+        games = list(payload.get(Keys.games) or [])
+        for day in payload.get(Keys.game_week) or []:
+            games.extend(day.get(Keys.games) or [])
+        for game in games:
+            if isinstance(game, dict) and Keys.game_state in game:
+                states.add(game[Keys.game_state])
+        return states
+
+
+class CachingHttpClient(HttpClient):
+    """nhlpy HTTP client that serves responses from an HttpCache and makes
+    requests through the shared Transport on a miss.
+    """
+
+    def __init__(
+        self,
+        config,
+        cache: HttpCache,
+        transport: Transport
+    ):
+        """Create a client.
+
+        Args:
+            config (ClientConfig): nhlpy client configuration.
+            cache (HttpCache): Cache to serve responses from.
+            transport (Transport): Transport used to make requests.
+        """
+        super().__init__(config)
+        self._cache = cache
+        self._transport = transport
+
+    def get(
+        self,
+        endpoint: Endpoint,
+        resource: str,
+        query_params: dict = None
+    ) -> httpx.Response:
+        """Get a resource from the cache, or from the NHL API on a miss.
+
+        Args:
+            endpoint (Endpoint): API endpoint.
+            resource (str): Resource path.
+            query_params (dict, optional): Query parameters. Defaults to None.
+
+        Returns:
+            httpx.Response: The response.
+        """
+        url = f"{endpoint.value}{resource}"
+        content = self._cache.get(url, query_params)
+        if content is not None:
+            return httpx.Response(200, content=content)
+        raw_response = self._transport.get(url, query_params)
+        response = httpx.Response(raw_response.status_code, content=raw_response.content)
+        self._handle_response(response, resource)
+        self._cache.put(url, query_params, response.content)
+        return response
+
+    @staticmethod
+    def attach(
+        client: NHLClient,
+        cache: HttpCache,
+        transport: Transport
+    ) -> NHLClient:
+        """Route every API group of an NHLClient through a cache and the shared
+        transport.
+
+        Args:
+            client (NHLClient): Client to attach the cache to.
+            cache (HttpCache): Cache to serve responses from.
+            transport (Transport): Transport used to make requests.
+
+        Returns:
+            NHLClient: The provided client.
+        """
+        # nhlpy has no hook for a custom HTTP client, so this relies on the
+        # internals of nhl-api-py 3.0.2, as pinned in requirements.txt: the
+        # client's _config and _http_client attributes, the client attribute
+        # of each API group and HttpClient._handle_response, used by get.
+        # Check them when upgrading nhlpy.
+        http_client = CachingHttpClient(client._config, cache, transport)
+        client._http_client = http_client
+        for api in vars(client).values():
+            if isinstance(getattr(api, "client", None), HttpClient):
+                api.client = http_client
+        return client
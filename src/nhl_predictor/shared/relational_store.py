@@ -0,0 +1,512 @@
+import os
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+import pandas as pd
+from sqlitedict import SqliteDict
+
+from nhl_predictor.shared.constants.database import Database as DB
+from nhl_predictor.shared.constants.json import JSON as Keys
+from nhl_predictor.shared.constants.schema import Schema
+from nhl_predictor.shared.logging_config import LoggingConfig
+from nhl_predictor.shared.utility import Utility as utl
+
+logger = LoggingConfig.get_logger(__name__)
+
+class RelationalStore:
+    """SQLite store with one typed column per field and indexes on the
+    columns used for lookups (game, player, team and season).
+
+    The builder keeps this store in step with the SqliteDict tables so that
+    filters and aggregates can run inside SQLite instead of loading whole
+    tables into pandas.
+
+    For each stats table, a per-player aggregate table holds the number of
+    games and the sum and sum of squares of every aggregated stat. Aggregates
+    are updated with each batch of stats rows, so per-player means are a
+    lookup rather than a scan of the player's history.
+    """
+
+    def __init__(self, path: Path):
+        """Open (and create if needed) the relational store.
+
+        Args:
+            path (Path): Application directory holding the database files.
+        """
+        self._path = os.path.join(path, DB.relational_db_file_name)
+        self._conn = sqlite3.connect(self._path)
+        self._create_tables()
+
+    @staticmethod
+    def exists(path: Path) -> bool:
+        """Check if a relational store has been created in a directory.
+
+        Args:
+            path (Path): Application directory holding the database files.
+
+        Returns:
+            bool: True if the store exists.
+        """
+        return os.path.exists(os.path.join(path, DB.relational_db_file_name))
+
+    def close(self) -> None:
+        """Close the underlying connection.
+        """
+        self._conn.close()
+
+    def _create_tables(self) -> None:
+        """Create all tables and indexes that do not exist yet. Tables whose
+        columns no longer match the schema are dropped and recreated; they are
+        repopulated by the next sync.
+        """
+        with self._conn:
+            for table_name, columns in Schema.columns.items():
+                existing = [
+                    row[1] for row in self._conn.execute(f'PRAGMA table_info("{table_name}")')
+                ]
+                if existing and existing != [name for name, _ in columns]:
+                    logger.info(f"Schema of relational table '{table_name}' changed, recreating it.")
+                    self._conn.execute(f'DROP TABLE "{table_name}"')
+                column_defs = ", ".join(f'"{name}" {sql_type}' for name, sql_type in columns)
+                primary_key = ", ".join(f'"{name}"' for name in Schema.primary_keys[table_name])
+                self._conn.execute(
+                    f'CREATE TABLE IF NOT EXISTS "{table_name}" '
+                    f'({column_defs}, PRIMARY KEY ({primary_key}))'
+                )
+                for index_columns in Schema.indexes.get(table_name, []):
+                    index_name = f"idx_{table_name}_{'_'.join(index_columns)}"
+                    indexed = ", ".join(f'"{name}"' for name in index_columns)
+                    self._conn.execute(
+                        f'CREATE INDEX IF NOT EXISTS "{index_name}" '
+                        f'ON "{table_name}" ({indexed})'
+                    )
+            for stats_table_name, aggregate_table_name in Schema.aggregate_tables.items():
+                column_defs = ", ".join(
+                    [
+                        f'"{Keys.player_id}" INTEGER NOT NULL PRIMARY KEY',
+                        f'"{Keys.games_played}" INTEGER NOT NULL DEFAULT 0'
+                    ]
+                    + [
+                        f'"{name}" REAL NOT NULL DEFAULT 0'
+                        for name in RelationalStore._aggregate_columns(stats_table_name)
+                    ]
+                )
+                self._conn.execute(
+                    f'CREATE TABLE IF NOT EXISTS "{aggregate_table_name}" ({column_defs})'
+                )
+
+    def clear(self) -> None:
+        """Delete all rows from every table.
+        """
+        with self._conn:
+            for table_name in Schema.columns:
+                self._conn.execute(f'DELETE FROM "{table_name}"')
+            for aggregate_table_name in Schema.aggregate_tables.values():
+                self._conn.execute(f'DELETE FROM "{aggregate_table_name}"')
+
+    def write(
+        self,
+        rows_by_table: Dict[str, Dict[object, Dict[str, object]]]
+    ) -> None:
+        """Insert or replace rows in a single transaction. Per-player
+        aggregates are updated in the same transaction.
+
+        Args:
+            rows_by_table (Dict[str, Dict[object, Dict[str, object]]]): For each
+            table name, a mapping of SqliteDict keys to row values. Tables that
+            are not part of the schema are ignored.
+        """
+        with self._conn:
+            for table_name, rows in rows_by_table.items():
+                if table_name not in Schema.columns:
+                    continue
+                records = RelationalStore._to_records(table_name, rows.items())
+                if table_name in Schema.aggregate_tables:
+                    self._update_aggregates(table_name, records)
+                self._conn.executemany(
+                    RelationalStore._insert_statement(table_name),
+                    records
+                )
+
+    def sync_table(
+        self,
+        table_name: str,
+        table: SqliteDict
+    ) -> None:
+        """Rebuild a table from its SqliteDict counterpart if the row counts
+        differ, e.g. for databases created before the relational store existed.
+        Aggregates are rebuilt as well when the table was resynchronized or
+        when they are missing.
+
+        Args:
+            table_name (str): Table name.
+            table (SqliteDict): Source table.
+        """
+        resynchronized = False
+        if self.count(table_name) != len(table):
+            logger.info(f"Resynchronizing relational table '{table_name}'.")
+            with self._conn:
+                self._conn.execute(f'DELETE FROM "{table_name}"')
+                self._conn.executemany(
+                    RelationalStore._insert_statement(table_name),
+                    RelationalStore._to_records(table_name, table.items())
+                )
+            resynchronized = True
+
+        aggregate_table_name = Schema.aggregate_tables.get(table_name)
+        if aggregate_table_name is not None and (
+            resynchronized
+            or (self.count(aggregate_table_name) == 0 and self.count(table_name) > 0)
+        ):
+            self.rebuild_aggregates(table_name)
+
+    def rebuild_aggregates(self, table_name: str) -> None:
+        """Recompute the per-player aggregates of a stats table from scratch.
+
+        Args:
+            table_name (str): Stats table name.
+        """
+        logger.info(f"Rebuilding aggregates for table '{table_name}'.")
+        aggregate_table_name = Schema.aggregate_tables[table_name]
+        expressions = [f'COALESCE("{stat}", 0)' for stat in Schema.aggregated_stats[table_name]]
+        column_list = ", ".join(
+            [f'"{Keys.player_id}"', f'"{Keys.games_played}"']
+            + [f'"{name}"' for name in RelationalStore._aggregate_columns(table_name)]
+        )
+        selected = ", ".join(
+            [f'"{Keys.player_id}"', "COUNT(*)"]
+            + [f"SUM({expression})" for expression in expressions]
+            + [f"SUM(({expression}) * ({expression}))" for expression in expressions]
+        )
+        with self._conn:
+            self._conn.execute(f'DELETE FROM "{aggregate_table_name}"')
+            self._conn.execute(
+                f'INSERT INTO "{aggregate_table_name}" ({column_list}) '
+                f'SELECT {selected} FROM "{table_name}" GROUP BY "{Keys.player_id}"'
+            )
+
+    def count(self, table_name: str) -> int:
+        """Count the rows in a table.
+
+        Args:
+            table_name (str): Table name.
+
+        Returns:
+            int: Number of rows.
+        """
+        return self._conn.execute(f'SELECT COUNT(*) FROM "{table_name}"').fetchone()[0]
+
+    def query(
+        self,
+        sql: str,
+        params: Iterable[object] = ()
+    ) -> pd.DataFrame:
+        """Run a query against the store.
+
+        Args:
+            sql (str): SQL query.
+            params (Iterable[object], optional): Query parameters. Defaults to ().
+
+        Returns:
+            pd.DataFrame: Query results.
+        """
+        return pd.read_sql_query(sql, self._conn, params=list(params))
+
+    def read_table(self, table_name: str) -> pd.DataFrame:
+        """Read a whole table, keyed like its SqliteDict counterpart: games and
+        players by their ID, stats rows by their composite game and player key.
+
+        Args:
+            table_name (str): Table name.
+
+        Returns:
+            pd.DataFrame: Table rows.
+        """
+        df = self.query(f'SELECT * FROM "{table_name}"')
+        key_column = Schema.key_columns.get(table_name)
+        if key_column is not None:
+            return df.set_index(key_column).rename_axis(None)
+        # Vectorized equivalent of Utility.get_composite_key.
+        keys = df[Keys.game_id].astype(str) + "_" + df[Keys.player_id].astype(str)
+        return df.set_index(keys.rename(None))
+
+    def get_stats_for_players(
+        self,
+        table_name: str,
+        player_ids: Iterable[int]
+    ) -> pd.DataFrame:
+        """Get every stats row for the provided players.
+
+        Args:
+            table_name (str): Stats table name.
+            player_ids (Iterable[int]): Player IDs to include.
+
+        Returns:
+            pd.DataFrame: Stats rows for the players.
+        """
+        player_ids = list(player_ids)
+        placeholders = ", ".join("?" for _ in player_ids)
+        return self.query(
+            f'SELECT * FROM "{table_name}" WHERE "{Keys.player_id}" IN ({placeholders})',
+            player_ids
+        )
+
+    def get_games_for_season(self, season: int) -> pd.DataFrame:
+        """Get every game of a season.
+
+        Args:
+            season (int): Season, e.g. 20242025.
+
+        Returns:
+            pd.DataFrame: Game rows for the season.
+        """
+        return self.query(
+            f'SELECT * FROM "{DB.games_table_name}" WHERE "{Keys.season}" = ?',
+            [int(season)]
+        )
+
+    def get_game_ids(self, game_state: str) -> set[int]:
+        """Get the IDs of every game in a given state.
+
+        Args:
+            game_state (str): Game state, e.g. "OFF".
+
+        Returns:
+            set[int]: The game IDs.
+        """
+        cursor = self._conn.execute(
+            f'SELECT "{Keys.game_id}" FROM "{DB.games_table_name}" WHERE "{Keys.game_state}" = ?',
+            [game_state]
+        )
+        return {game_id for (game_id,) in cursor}
+
+    def get_games_between(
+        self,
+        first_date: str,
+        last_date: str
+    ) -> pd.DataFrame:
+        """Get every game played between two dates, inclusive.
+
+        Args:
+            first_date (str): First date, in YYYY-MM-DD format.
+            last_date (str): Last date, in YYYY-MM-DD format.
+
+        Returns:
+            pd.DataFrame: Game rows ordered by date and game ID.
+        """
+        return self.query(
+            f'SELECT * FROM "{DB.games_table_name}" '
+            f'WHERE "{Keys.game_date}" BETWEEN ? AND ? '
+            f'ORDER BY "{Keys.game_date}", "{Keys.game_id}"',
+            [first_date, last_date]
+        )
+
+    def get_player_means(
+        self,
+        table_name: str,
+        player_ids: Iterable[int],
+        stats: List[str],
+        window: int = None
+    ) -> pd.DataFrame:
+        """Average stats per player inside SQLite, reading only the rows of the
+        requested players.
+
+        Args:
+            table_name (str): Stats table name.
+            player_ids (Iterable[int]): Player IDs to include.
+            stats (List[str]): Stats to average.
+            window (int, optional): Only average each player's most recent games.
+            Defaults to None, which averages the whole history.
+
+        Returns:
+            pd.DataFrame: One row of averages per player, indexed by player ID.
+        """
+        player_ids = [int(player_id) for player_id in player_ids]
+        if not player_ids:
+            return pd.DataFrame(columns=stats).rename_axis(Keys.player_id)
+
+        placeholders = ", ".join("?" for _ in player_ids)
+        averages = ", ".join(f'AVG("{stat}") AS "{stat}"' for stat in stats)
+        params = list(player_ids)
+        if window:
+            source = (
+                f'(SELECT *, ROW_NUMBER() OVER (PARTITION BY "{Keys.player_id}" '
+                f'ORDER BY "{Keys.game_id}" DESC) AS "_game_number" '
+                f'FROM "{table_name}" WHERE "{Keys.player_id}" IN ({placeholders}))'
+            )
+            condition = '"_game_number" <= ?'
+            params.append(int(window))
+        else:
+            source = f'"{table_name}"'
+            condition = f'"{Keys.player_id}" IN ({placeholders})'
+        return self.query(
+            f'SELECT "{Keys.player_id}", {averages} FROM {source} '
+            f'WHERE {condition} GROUP BY "{Keys.player_id}"',
+            params
+        ).set_index(Keys.player_id)
+
+    def get_aggregate_means(
+        self,
+        table_name: str,
+        player_ids: Iterable[int],
+        stats: List[str]
+    ) -> pd.DataFrame:
+        """Get each player's career average of the provided stats from the
+        aggregate table.
+
+        Args:
+            table_name (str): Stats table name.
+            player_ids (Iterable[int]): Player IDs to include.
+            stats (List[str]): Stats to average. Must be aggregated stats.
+
+        Returns:
+            pd.DataFrame: One row of averages per player, indexed by player ID.
+        """
+        player_ids = [int(player_id) for player_id in player_ids]
+        if not player_ids:
+            return pd.DataFrame(columns=stats).rename_axis(Keys.player_id)
+
+        placeholders = ", ".join("?" for _ in player_ids)
+        averages = ", ".join(
+            f'"{Keys.sum_prefix}{stat}" / "{Keys.games_played}" AS "{stat}"' for stat in stats
+        )
+        return self.query(
+            f'SELECT "{Keys.player_id}", {averages} '
+            f'FROM "{Schema.aggregate_tables[table_name]}" '
+            f'WHERE "{Keys.player_id}" IN ({placeholders}) AND "{Keys.games_played}" > 0',
+            player_ids
+        ).set_index(Keys.player_id)
+
+    def _update_aggregates(
+        self,
+        table_name: str,
+        records: List[Tuple[object, ...]]
+    ) -> None:
+        """Apply a batch of stats rows to the per-player aggregates. Rows that
+        are about to be replaced are subtracted first so that re-ingesting a
+        game does not count it twice. Must be called inside a transaction,
+        before the rows are inserted.
+
+        Args:
+            table_name (str): Stats table name.
+            records (List[Tuple[object, ...]]): Records about to be inserted.
+        """
+        names = [name for name, _ in Schema.columns[table_name]]
+        game_index = names.index(Keys.game_id)
+        player_index = names.index(Keys.player_id)
+
+        self._conn.execute(
+            f'CREATE TEMP TABLE IF NOT EXISTS "_batch_keys" '
+            f'("{Keys.game_id}" INTEGER, "{Keys.player_id}" INTEGER)'
+        )
+        self._conn.execute('DELETE FROM "_batch_keys"')
+        self._conn.executemany(
+            'INSERT INTO "_batch_keys" VALUES (?, ?)',
+            [(record[game_index], record[player_index]) for record in records]
+        )
+        replaced = self._conn.execute(
+            f'SELECT s.* FROM "{table_name}" AS s JOIN "_batch_keys" AS k '
+            f'ON s."{Keys.game_id}" = k."{Keys.game_id}" '
+            f'AND s."{Keys.player_id}" = k."{Keys.player_id}"'
+        )
+        replaced_names = [column[0] for column in replaced.description]
+        changes = (
+            [(dict(zip(names, record)), 1) for record in records]
+            + [(dict(zip(replaced_names, record)), -1) for record in replaced.fetchall()]
+        )
+
+        stats = Schema.aggregated_stats[table_name]
+        deltas = {}
+        for row, sign in changes:
+            values = RelationalStore._aggregate_values(table_name, row)
+            delta = deltas.setdefault(int(row[Keys.player_id]), [0] * (1 + 2 * len(stats)))
+            delta[0] += sign
+            for position, value in enumerate(values):
+                delta[1 + position] += sign * value
+                delta[1 + len(stats) + position] += sign * value * value
+
+        columns = [Keys.games_played] + RelationalStore._aggregate_columns(table_name)
+        column_list = ", ".join(f'"{name}"' for name in [Keys.player_id] + columns)
+        placeholders = ", ".join("?" for _ in range(len(columns) + 1))
+        updates = ", ".join(f'"{name}" = "{name}" + excluded."{name}"' for name in columns)
+        self._conn.executemany(
+            f'INSERT INTO "{Schema.aggregate_tables[table_name]}" ({column_list}) '
+            f'VALUES ({placeholders}) '
+            f'ON CONFLICT("{Keys.player_id}") DO UPDATE SET {updates}',
+            [(player_id, *delta) for player_id, delta in deltas.items()]
+        )
+
+    @staticmethod
+    def _aggregate_columns(table_name: str) -> List[str]:
+        """Get the sum and sum of squares column names of an aggregate table.
+
+        Args:
+            table_name (str): Stats table name.
+
+        Returns:
+            List[str]: Sum columns followed by sum of squares columns.
+        """
+        stats = Schema.aggregated_stats[table_name]
+        return (
+            [f"{Keys.sum_prefix}{stat}" for stat in stats]
+            + [f"{Keys.sum_of_squares_prefix}{stat}" for stat in stats]
+        )
+
+    @staticmethod
+    def _aggregate_values(
+        table_name: str,
+        row: Dict[str, object]
+    ) -> List[float]:
+        """Extract the aggregated stats of a row as numbers.
+
+        Args:
+            table_name (str): Stats table name.
+            row (Dict[str, object]): Stats row.
+
+        Returns:
+            List[float]: Stat values in aggregated stats order.
+        """
+        return [float(row.get(stat) or 0) for stat in Schema.aggregated_stats[table_name]]
+
+    @staticmethod
+    def _insert_statement(table_name: str) -> str:
+        """Build the insert statement for a table.
+
+        Args:
+            table_name (str): Table name.
+
+        Returns:
+            str: Parameterized INSERT OR REPLACE statement.
+        """
+        names = [name for name, _ in Schema.columns[table_name]]
+        column_list = ", ".join(f'"{name}"' for name in names)
+        placeholders = ", ".join("?" for _ in names)
+        return f'INSERT OR REPLACE INTO "{table_name}" ({column_list}) VALUES ({placeholders})'
+
+    @staticmethod
+    def _to_records(
+        table_name: str,
+        items: Iterable[Tuple[object, Dict[str, object]]]
+    ) -> List[Tuple[object, ...]]:
+        """Convert SqliteDict (key, row) pairs into tuples in column order.
+        Goalie rows stored before compound stats were split at ingest are
+        split on the way.
+
+        Args:
+            table_name (str): Table name.
+            items (Iterable[Tuple[object, Dict[str, object]]]): Key and row pairs.
+
+        Returns:
+            List[Tuple[object, ...]]: Records ready to insert.
+        """
+        names = [name for name, _ in Schema.columns[table_name]]
+        key_column = Schema.key_columns.get(table_name)
+        records = []
+        for key, row in items:
+            if key_column is not None:
+                row = {**row, key_column: key}
+            if table_name == DB.goalie_stats_table_name:
+                row = utl.split_compound_stats(dict(row))
+            records.append(tuple(row.get(name) for name in names))
+        return records
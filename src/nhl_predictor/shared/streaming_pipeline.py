@@ -0,0 +1,218 @@
+import queue
+import threading
+import time
+from typing import Callable, Iterable
+
+from nhl_predictor.shared.logging_config import LoggingConfig
+
+logger = LoggingConfig.get_logger(__name__)
+
+class StreamingPipeline:
+    """Runs a producer -> parser -> writer pipeline with bounded queues
+    between the stages.
+
+    The producer and the parser each run on their own thread while the writer
+    runs on the calling thread, so that a single thread remains responsible
+    for persisting data. Because the queues are bounded, a slow stage makes
+    the earlier stages wait instead of letting items pile up in memory.
+
+    Each stage counts the items it handles and the time it spends on them,
+    and the throughput of every stage is logged once the pipeline finishes.
+    """
+
+    # Sentinel marking the end of the stream.
+    _end = object()
+
+    # Seconds between checks for cancellation while waiting on a queue.
+    _poll_interval = 0.5
+
+    def __init__(
+        self,
+        name: str,
+        queue_size: int
+    ):
+        """Create a pipeline.
+
+        Args:
+            name (str): Name used when reporting throughput.
+            queue_size (int): Maximum number of items waiting between two stages.
+        """
+        self._name = name
+        self._queue_size = max(1, int(queue_size))
+        self._stop = threading.Event()
+        self._stats = {}
+        self._stats_lock = threading.Lock()
+
+    def run(
+        self,
+        items: Iterable[object],
+        parse_fn: Callable[[object], object],
+        write_fn: Callable[[object], None]
+    ) -> None:
+        """Stream every item through the pipeline.
+
+        Args:
+            items (Iterable[object]): Producer stage. Iterating it may block,
+            e.g. on network requests.
+            parse_fn (Callable[[object], object]): Parser stage, applied to each
+            produced item.
+            write_fn (Callable[[object], None]): Writer stage, applied to each
+            parsed item on the calling thread.
+
+        Raises:
+            Exception: Any exception raised by the producer or parser is raised
+            again on the calling thread once the items before it are written.
+        """
+        produced = queue.Queue(self._queue_size)
+        parsed = queue.Queue(self._queue_size)
+        producer = threading.Thread(
+            target=self._produce,
+            args=(items, produced),
+            name=f"{self._name}-producer",
+            daemon=True
+        )
+        parser = threading.Thread(
+            target=self._parse,
+            args=(parse_fn, produced, parsed),
+            name=f"{self._name}-parser",
+            daemon=True
+        )
+        producer.start()
+        parser.start()
+        try:
+            while True:
+                item = parsed.get()
+                if item is StreamingPipeline._end:
+                    break
+                if isinstance(item, _StageError):
+                    raise item.exception
+                started = time.perf_counter()
+                write_fn(item)
+                self._record("writer", started)
+            producer.join()
+            parser.join()
+        finally:
+            # On failure the background stages are daemon threads that stop at
+            # their next queue operation, so they are not waited for.
+            self._stop.set()
+            self.report()
+
+    def report(self) -> None:
+        """Log the throughput of each stage.
+        """
+        with self._stats_lock:
+            for stage, (count, seconds) in self._stats.items():
+                rate = count / seconds if seconds > 0 else 0
+                logger.info(
+                    f"Pipeline '{self._name}' stage '{stage}': '{count}' items in "
+                    f"'{seconds:.2f}'s ('{rate:.1f}' items/s)."
+                )
+
+    def _produce(
+        self,
+        items: Iterable[object],
+        produced: queue.Queue
+    ) -> None:
+        """Producer thread body.
+
+        Args:
+            items (Iterable[object]): Items to produce.
+            produced (queue.Queue): Queue feeding the parser.
+        """
+        try:
+            iterator = iter(items)
+            while not self._stop.is_set():
+                started = time.perf_counter()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    break
+                self._record("producer", started)
+                if not self._put(produced, item):
+                    return
+        except BaseException as e:
+            self._put(produced, _StageError(e))
+            return
+        self._put(produced, StreamingPipeline._end)
+
+    def _parse(
+        self,
+        parse_fn: Callable[[object], object],
+        produced: queue.Queue,
+        parsed: queue.Queue
+    ) -> None:
+        """Parser thread body.
+
+        Args:
+            parse_fn (Callable[[object], object]): Parser applied to each item.
+            produced (queue.Queue): Queue fed by the producer.
+            parsed (queue.Queue): Queue feeding the writer.
+        """
+        while not self._stop.is_set():
+            try:
+                item = produced.get(timeout=StreamingPipeline._poll_interval)
+            except queue.Empty:
+                continue
+            if item is StreamingPipeline._end or isinstance(item, _StageError):
+                self._put(parsed, item)
+                return
+            started = time.perf_counter()
+            try:
+                result = parse_fn(item)
+            except BaseException as e:
+                self._put(parsed, _StageError(e))
+                return
+            self._record("parser", started)
+            if not self._put(parsed, result):
+                return
+
+    def _put(
+        self,
+        target: queue.Queue,
+        item: object
+    ) -> bool:
+        """Put an item on a bounded queue, giving up if the pipeline stops.
+
+        Args:
+            target (queue.Queue): Destination queue.
+            item (object): Item to enqueue.
+
+        Returns:
+            bool: True if the item was enqueued.
+        """
+        while not self._stop.is_set():
+            try:
+                target.put(item, timeout=StreamingPipeline._poll_interval)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _record(
+        self,
+        stage: str,
+        started: float
+    ) -> None:
+        """Record that a stage handled one item.
+
+        Args:
+            stage (str): Stage name.
+            started (float): perf_counter value when the stage started the item.
+        """
+        elapsed = time.perf_counter() - started
+        with self._stats_lock:
+            count, seconds = self._stats.get(stage, (0, 0.0))
+            self._stats[stage] = (count + 1, seconds + elapsed)
+
+
+class _StageError:
+    """Carries an exception raised by a background stage to the writer.
+    """
+
+    def __init__(self, exception: BaseException):
+        """Wrap an exception.
+
+        Args:
+            exception (BaseException): The exception raised by the stage.
+        """
+        self.exception = exception
@@ -0,0 +1,175 @@
+import random
+import threading
+import time
+from typing import Dict
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from nhl_predictor.shared.logging_config import LoggingConfig
+
+logger = LoggingConfig.get_logger(__name__)
+
+class RateLimiter:
+    """Thread safe token bucket limiting how often requests are made.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = None
+    ):
+        """Create a rate limiter.
+
+        Args:
+            rate (float): Tokens added per second, i.e. the sustained request rate.
+            burst (int, optional): Maximum number of tokens that can accumulate.
+            Defaults to one second worth of tokens.
+        """
+        self._rate = rate
+        self._capacity = max(1, burst if burst is not None else int(rate))
+        self._tokens = float(self._capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take a token, blocking until one is available.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity,
+                    self._tokens + (now - self._updated) * self._rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self._rate
+            time.sleep(wait)
+
+
+class Transport:
+    """Shared HTTP transport for all NHL API access.
+
+    Requests go through a single pooled keep-alive session and a token bucket
+    rate limiter. Connection errors, timeouts, rate limit responses and server
+    errors are retried with exponential backoff and full jitter, honoring the
+    Retry-After header when the server provides one.
+    """
+
+    # Status codes worth retrying.
+    _retry_status_codes = {429, 500, 502, 503, 504}
+
+    _backoff_base = 0.5
+    _backoff_max = 30.0
+
+    def __init__(
+        self,
+        timeout: float,
+        max_retries: int,
+        rate_limit: float,
+        pool_size: int
+    ):
+        """Create a transport.
+
+        Args:
+            timeout (float): Timeout, in seconds, of each request.
+            max_retries (int): Number of times a failed request is retried.
+            rate_limit (float): Maximum sustained number of requests per second.
+            pool_size (int): Number of keep-alive connections to pool per host.
+        """
+        self._timeout = timeout
+        self._max_retries = max_retries
+        self._rate_limiter = RateLimiter(rate_limit)
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+    def get(
+        self,
+        url: str,
+        params: Dict[str, object] = None
+    ) -> requests.Response:
+        """Make a GET request, retrying transient failures.
+
+        Args:
+            url (str): Request URL.
+            params (Dict[str, object], optional): Request query parameters.
+            Defaults to None.
+
+        Raises:
+            requests.RequestException: Thrown if the request still fails with a
+            connection error or timeout after all retries.
+
+        Returns:
+            requests.Response: The response. Responses with a retryable status
+            code are returned once the retries are exhausted.
+        """
+        attempt = 0
+        while True:
+            self._rate_limiter.acquire()
+            retry_after = None
+            try:
+                response = self._session.get(url, params=params, timeout=self._timeout)
+                if response.status_code not in Transport._retry_status_codes:
+                    return response
+                if attempt >= self._max_retries:
+                    return response
+                reason = f"status '{response.status_code}'"
+                retry_after = Transport._get_retry_after(response)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt >= self._max_retries:
+                    raise
+                reason = f"exception '{str(e)}'"
+
+            delay = self._get_delay(attempt, retry_after)
+            attempt += 1
+            logger.warning(
+                f"Request failed, retrying. URL: '{url}', Reason: {reason}, "
+                f"Attempt: '{attempt}' of '{self._max_retries}', Delay: '{delay:.2f}'s."
+            )
+            time.sleep(delay)
+
+    def close(self) -> None:
+        """Close the pooled connections.
+        """
+        self._session.close()
+
+    def _get_delay(
+        self,
+        attempt: int,
+        retry_after: float = None
+    ) -> float:
+        """Get how long to wait before retrying.
+
+        Args:
+            attempt (int): Number of retries made so far.
+            retry_after (float, optional): Delay requested by the server.
+            Defaults to None.
+
+        Returns:
+            float: Delay in seconds.
+        """
+        if retry_after is not None:
+            return min(retry_after, Transport._backoff_max)
+        ceiling = min(Transport._backoff_max, Transport._backoff_base * 2 ** attempt)
+        return random.uniform(0, ceiling)
+
+    @staticmethod
+    def _get_retry_after(response: requests.Response) -> float:
+        """Read the Retry-After header of a response.
+
+        Args:
+            response (requests.Response): The response.
+
+        Returns:
+            float: Seconds to wait, or None if the header is missing or is not
+            a number of seconds.
+        """
+        try:
+            return float(response.headers["Retry-After"])
+        except (KeyError, ValueError):
+            return None
@@ -5,6 +5,10 @@ from typing import Dict, List
 import pandas as pd
 from sqlitedict import SqliteDict
 
+from nhl_predictor.shared.columnar_store import ColumnarStore
+from nhl_predictor.shared.constants.database import Database as DB
+from nhl_predictor.shared.constants.json import JSON as Keys
+from nhl_predictor.shared.constants.schema import Schema
 from nhl_predictor.shared.logging_config import LoggingConfig
 
 logger = LoggingConfig.get_logger(__name__)
@@ -129,12 +133,51 @@ class Utility:
 
         return tuple(parts)
 
+    @staticmethod
+    def split_compound_stats(row: Dict[str, object]) -> Dict[str, object]:
+        """Split the compound "saves/shots" goalie stats of a row into integer
+        shots and saves columns. Changes are made in place. Values that are
+        already split are left untouched, so rows stored before stats were
+        split at ingest can be passed through safely. Stats missing from the
+        box score default to a plain 0, which gets 0 saves.
+
+        Args:
+            row (Dict[str, object]): Goalie stats row.
+
+        Returns:
+            Dict[str, object]: The provided row.
+        """
+        for shots_column, saves_column in Schema.compound_stats.items():
+            value = row.get(shots_column)
+            if isinstance(value, str):
+                parts = Utility.split_compound_value(value)
+                row[saves_column] = parts[0]
+                row[shots_column] = parts[-1]
+            elif shots_column in row and row.get(saves_column) is None:
+                row[saves_column] = 0
+        return row
+
+    @staticmethod
+    def get_composite_key(*parts: object, delim: str = '_') -> str:
+        """Build a single table key out of several values, e.g. a game ID and
+        a player ID.
+
+        Args:
+            parts (object): Values that together identify a row.
+            delim (str): The delimiter to join on. Defaults to '_'.
+
+        Returns:
+            str: The composite key.
+        """
+        return delim.join(str(part) for part in parts)
+
     @staticmethod
     def get_sqlitedict_tables(
         *names: str,
         path: Path,
         update_db: bool = False,
-        read_only: bool = False
+        read_only: bool = False,
+        autocommit: bool = True
     ) -> Dict[str, SqliteDict]:
         """Get a dictionary of table names to SqliteDict database objects.
 
@@ -143,6 +186,8 @@ class Utility:
             path (Path): Path to location to find or save database file.
             update_db (bool, optional): Indicates if tables should be cleared first. Defaults to False.
             read_only (bool, optional): Indicates if tables should be editable. Defaults to False.
+            autocommit (bool, optional): Indicates if every write should be committed immediately.
+            When False, the caller is responsible for calling commit. Defaults to True.
 
         Returns:
             Dict[str, SqliteDict]: Dictionary of database tables.
@@ -162,7 +207,7 @@ class Utility:
             DBs[name] = SqliteDict(
                 Utility.get_db_path(path),
                 tablename=name,
-                autocommit=True,
+                autocommit=autocommit,
                 flag=flag
             )
         return DBs
@@ -171,7 +216,9 @@ class Utility:
         *names: str,
         path: Path
     ) -> Dict[str, pd.DataFrame]:
-        """_summary_
+        """Load tables into pandas DataFrames. Tables are read from the
+        columnar store when it holds a current copy and are otherwise rebuilt
+        from the SqliteDict rows.
 
         Args:
             names (str): Database table names.
@@ -186,6 +233,116 @@ class Utility:
             path=path,
             read_only=True
         )
+        meta_db = Utility.get_sqlitedict_tables(
+            DB.meta_table_name,
+            path=path,
+            read_only=True
+        )[DB.meta_table_name]
+        store = ColumnarStore(path)
         for name in names:
-            DBs[name] = pd.DataFrame(list(DBs[name].values()), index=list(DBs[name].keys()))
-        return DBs
\ No newline at end of file
+            version = ColumnarStore.get_version(meta_db, name)
+            df = store.read_table(name, version) if version is not None else None
+            if df is None:
+                logger.info(f"No current columnar copy of table '{name}', loading rows.")
+                df = pd.DataFrame(list(DBs[name].values()), index=list(DBs[name].keys()))
+            DBs[name] = Utility.apply_dtypes(name, df)
+        return DBs
+
+    @staticmethod
+    def apply_dtypes(
+        name: str,
+        df: pd.DataFrame
+    ) -> pd.DataFrame:
+        """Convert the columns of a loaded table to the compact dtypes declared
+        in the schema.
+
+        Args:
+            name (str): Table name.
+            df (pd.DataFrame): Table contents.
+
+        Returns:
+            pd.DataFrame: The converted table.
+        """
+        if name == DB.goalie_stats_table_name:
+            Utility.split_compound_columns(df)
+        dtypes = {}
+        for column, dtype in Schema.dtypes.get(name, {}).items():
+            if column not in df:
+                continue
+            if column == Keys.toi:
+                df[column] = Utility.toi_to_seconds(df[column])
+            if dtype.startswith("int") and df[column].isna().any():
+                dtype = dtype.capitalize()
+            if dtype == "bool" and df[column].isna().any():
+                dtype = "boolean"
+            if dtype == "category" and df[column].dtype == object:
+                df[column] = Utility._to_text_column(df[column])
+            dtypes[column] = dtype
+        return df.astype(dtypes)
+
+    @staticmethod
+    def _to_text_column(series: pd.Series) -> pd.Series:
+        """Convert the values of a text column loaded from rows to strings, as
+        columnar copies store them, so that defaults such as a 0 decision
+        read back the same from both. Columns holding only numbers are left
+        unchanged, as columnar copies store them as numbers.
+
+        Args:
+            series (pd.Series): Column to convert.
+
+        Returns:
+            pd.Series: The converted column.
+        """
+        try:
+            pd.to_numeric(series)
+            return series
+        except (ValueError, TypeError):
+            return series.where(series.isna(), series.astype(str))
+
+    @staticmethod
+    def split_compound_columns(goalies: pd.DataFrame) -> None:
+        """Split the compound "saves/shots" goalie stats of rows stored before
+        stats were split at ingest, which lack the saves columns. Values
+        without a '/', e.g. the 0 default of a stat missing from the box
+        score, are shots with 0 saves. Changes are made in place.
+
+        Args:
+            goalies (pd.DataFrame): Goalie stats.
+        """
+        for shots_column, saves_column in Schema.compound_stats.items():
+            if shots_column not in goalies:
+                continue
+            if saves_column not in goalies:
+                goalies[saves_column] = None
+            legacy = goalies[saves_column].isna()
+            if not legacy.any():
+                continue
+            parts = (
+                goalies.loc[legacy, shots_column].astype(str)
+                .str.split('/', expand=True)
+                .reindex(columns=[0, 1])
+            )
+            compound = parts[1].notna()
+            goalies[saves_column] = goalies[saves_column].astype(object)
+            goalies[shots_column] = goalies[shots_column].astype(object)
+            goalies.loc[legacy, saves_column] = pd.to_numeric(parts[0].where(compound, 0), errors="coerce")
+            goalies.loc[legacy, shots_column] = pd.to_numeric(parts[1].where(compound, parts[0]), errors="coerce")
+
+    @staticmethod
+    def toi_to_seconds(toi: pd.Series) -> pd.Series:
+        """Convert a time on ice column from "MM:SS" to seconds.
+
+        Args:
+            toi (pd.Series): Time on ice values.
+
+        Returns:
+            pd.Series: Time on ice in seconds, missing where the value is missing.
+        """
+        if pd.api.types.is_numeric_dtype(toi):
+            return toi
+        parts = toi.astype("string").str.split(":", n=1, expand=True)
+        if parts.shape[1] < 2:
+            return pd.to_numeric(parts[0], errors="coerce")
+        minutes = pd.to_numeric(parts[0], errors="coerce")
+        seconds = pd.to_numeric(parts[1], errors="coerce")
+        return minutes * 60 + seconds
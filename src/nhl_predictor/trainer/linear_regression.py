@@ -2,6 +2,7 @@ import os
 from pickle import dump
 
 import numpy as np
+import pandas as pd
 import statsmodels.api as sm
 from ansimarkup import ansiprint as print
 from sklearn.linear_model import LinearRegression
@@ -9,7 +10,9 @@ from sklearn.metrics import mean_squared_error, r2_score
 from sklearn.model_selection import train_test_split
 
 from nhl_predictor.model.summarizer_manager import SummarizerTypes
+from nhl_predictor.model.summarizers.summarizer import Summarizer
 from nhl_predictor.shared.constants.database import Database as DB
+from nhl_predictor.shared.dataset_cache import DatasetCache
 from nhl_predictor.shared.execution_context import ExecutionContext
 from nhl_predictor.shared.logging_config import LoggingConfig
 from nhl_predictor.shared.utility import Utility as utl
@@ -27,18 +30,9 @@ class TrainLinearRegression:
         """Entry point for linear regression model training.
         """
         logger.info("Start of model training.")
-        
-        data = utl.get_pandas_tables(
-            DB.players_table_name,
-            DB.skater_stats_table_name,
-            DB.goalie_stats_table_name,
-            DB.games_table_name,
-            DB.meta_table_name,
-            path=execution_context.app_dir
-        )
 
         summarizer = SummarizerTypes.get_summarizer(execution_context.summarizer_type)
-        game_data = summarizer.summarize(data)
+        game_data = TrainLinearRegression._get_data_set(summarizer)
 
         train, test = train_test_split(game_data, test_size=0.2)
 
@@ -118,4 +112,50 @@ class TrainLinearRegression:
         with open(os.path.join(execution_context.app_dir, filename), "wb") as file:
             dump(model, file, protocol=5)
 
-        logger.info("End of model training.")
\ No newline at end of file
+        logger.info("End of model training.")
+
+    @staticmethod
+    def _get_data_set(summarizer: Summarizer) -> pd.DataFrame:
+        """Get the summarized data set, reusing the cached copy when neither
+        the source tables nor the summarizer changed since it was built. When
+        only new games were stored since, the previous data set is extended
+        with them.
+
+        Args:
+            summarizer (Summarizer): Summarizer used to build the data set.
+
+        Returns:
+            pd.DataFrame: The summarized data set.
+        """
+        # Only the tables summarizers read, so that e.g. refreshing players
+        # does not invalidate the cached data set.
+        table_names = [
+            DB.skater_stats_table_name,
+            DB.goalie_stats_table_name,
+            DB.games_table_name
+        ]
+        summarizer_type = SummarizerTypes(execution_context.summarizer_type).value
+        cache = DatasetCache(execution_context.app_dir)
+        fingerprint = None
+        if execution_context.use_dataset_cache:
+            generation = DatasetCache.get_generation(execution_context.app_dir)
+            fingerprint = DatasetCache.get_fingerprint(execution_context.app_dir, *table_names)
+            game_data = cache.get(summarizer_type, summarizer.version, generation, fingerprint)
+            if game_data is not None:
+                return game_data
+
+        data = utl.get_pandas_tables(
+            *table_names,
+            DB.meta_table_name,
+            path=execution_context.app_dir
+        )
+        previous = None
+        if fingerprint is not None:
+            previous = cache.get_latest(summarizer_type, summarizer.version, generation)
+        if previous is not None:
+            game_data = summarizer.summarize_incremental(data, previous)
+        else:
+            game_data = summarizer.summarize(data)
+        if fingerprint is not None:
+            cache.put(summarizer_type, summarizer.version, generation, fingerprint, game_data)
+        return game_data
\ No newline at end of file